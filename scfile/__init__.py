@@ -5,11 +5,12 @@ __license__ = "MIT"
 __repository__ = "onejeuu/sc-file"
 
 from .core import Options
-from . import cli, consts, convert, enums, exceptions, formats, structures, types
+from . import aio, cli, consts, convert, enums, exceptions, formats, structures, types
 
 
 __all__ = (
     "Options",
+    "aio",
     "cli",
     "convert",
     "core",
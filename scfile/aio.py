@@ -0,0 +1,196 @@
+"""
+Asynchronous conversion API for event loop based services.
+
+Wraps blocking decode/encode calls into executor jobs,
+so conversions can run concurrently without blocking the event loop.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncIterator, Callable, NamedTuple, Optional, Type, TypeAlias
+
+from scfile import exceptions, types
+from scfile.convert import detect
+from scfile.core import ContentType, FileDecoder, FileEncoder, Options
+from scfile.utils import archives, files
+
+
+CancelEvent: TypeAlias = Optional[threading.Event]
+
+DEFAULT_WORKERS = os.cpu_count() or 4
+"""Default concurrent conversions limit."""
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one batch conversion."""
+
+    source: str
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _convert_bytes(
+    decoder: Type[FileDecoder[ContentType]],
+    encoder: Type[FileEncoder[ContentType]],
+    data: bytes,
+    options: Optional[Options],
+) -> bytes:
+    with decoder(data, options) as src:
+        return src.convert(encoder)
+
+
+def _auto(
+    source: types.PathLike,
+    output: types.OutputLike,
+    options: Optional[Options],
+    cancelled: CancelEvent,
+    load: Optional[Callable[[], Optional[bytes]]] = None,
+) -> None:
+    # Job may wait in executor queue, recheck before actual work
+    if cancelled and cancelled.is_set():
+        raise exceptions.ConvertInterrupted()
+
+    detect.auto(source, output, options, load() if load else None)
+
+
+async def convert_bytes(
+    decoder: Type[FileDecoder[ContentType]],
+    encoder: Type[FileEncoder[ContentType]],
+    data: bytes,
+    options: Optional[Options] = None,
+    executor: Optional[Executor] = None,
+) -> bytes:
+    """
+    Convert in-memory file between formats.
+
+    Arguments:
+        decoder: Decoder class for source format.
+        encoder: Encoder class for output format.
+        data: Source file content.
+        options (optional): Shared handlers options.
+        executor (optional): Executor for blocking work. Defaults to event loop executor.
+
+    Returns:
+        Encoded file content.
+
+    Example:
+        - ``await convert_bytes(McsbDecoder, GlbEncoder, upload)``
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _convert_bytes, decoder, encoder, data, options)
+
+
+async def auto(
+    source: types.PathLike,
+    output: types.OutputLike = None,
+    options: Optional[Options] = None,
+    executor: Optional[Executor] = None,
+) -> None:
+    """
+    Automatically convert one file between formats based on its extension.
+
+    Arguments:
+        source: Path to source file.
+        output (optional): Path to directory. Defaults to same location as source.
+        options (optional): Shared handlers options.
+        executor (optional): Executor for blocking work. Defaults to event loop executor.
+
+    Example:
+        - ``await auto("model.mcsb", "path/to/output/dir")``
+    """
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, _auto, source, output, options, None)
+
+
+async def batch(
+    sources: types.FilesSources,
+    output: types.OutputLike = None,
+    options: Optional[Options] = None,
+    executor: Optional[Executor] = None,
+    workers: int = DEFAULT_WORKERS,
+    relative: bool = False,
+    cancelled: CancelEvent = None,
+) -> AsyncIterator[BatchResult]:
+    """
+    Convert files from sources concurrently, yielding results as they complete.
+
+    Zip archive sources are converted member by member without extraction.
+
+    Arguments:
+        sources: Files or directories to convert.
+        output (optional): Path to directory. Defaults to same location as source.
+        options (optional): Shared handlers options.
+        executor (optional): Executor for blocking work. Defaults to event loop executor.
+        workers (optional): Maximum conversions in progress at once.
+        relative (optional): Preserve directory structure from source in output.
+        cancelled (optional): Event that stops pending conversions once set.
+
+    Raises:
+        ConvertInterrupted: Batch stopped by ``cancelled`` event.
+
+    Example:
+        - ``async for result in batch(["path/to/assets"], "path/to/output"): ...``
+    """
+
+    loop = asyncio.get_running_loop()
+    out = os.fspath(output) if output else None
+    entries = files.walk(sources, parent=relative)
+    limit = max(workers, 1)
+    reader = archives.ArchiveReader()
+
+    def submit(entry: types.FileEntry) -> asyncio.Future[None]:
+        dest = files.entry_destination(entry=entry, relative=relative, output=out)
+        load = partial(reader.load, entry) if entry.member is not None else None
+        return loop.run_in_executor(executor, _auto, entry.path, dest, options, cancelled, load)
+
+    pending: dict[asyncio.Future[None], str] = {}
+    exhausted = False
+    interrupted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < limit and not (cancelled and cancelled.is_set()):
+                # Directory scan blocks, but must not queue behind conversions in executor
+                entry = await asyncio.to_thread(next, entries, None)
+                if entry is None:
+                    exhausted = True
+                    break
+                pending[submit(entry)] = entry.path
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                source = pending.pop(future)
+                error = future.exception()
+
+                if isinstance(error, exceptions.ConvertInterrupted):
+                    interrupted = True
+                    continue
+
+                if error is not None and not isinstance(error, Exception):
+                    raise error
+
+                yield BatchResult(source, error)
+
+        # Queued jobs may be dropped after last entry was submitted
+        if interrupted or not exhausted:
+            raise exceptions.ConvertInterrupted()
+
+    finally:
+        # Drop queued jobs on early exit, running ones finish in executor
+        for future in pending:
+            future.cancel()
+
+        # Running jobs that have not opened their archive yet fail instead of reopening it
+        reader.close()
@@ -1,17 +1,21 @@
+import sys
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from typing import Optional
 
 import click
 from rich import print
+from rich.console import Console
 
 from scfile import convert, exceptions, types
 from scfile.cli import params
 from scfile.consts import CLI, Formats, Text
-from scfile.core import Options
-from scfile.core.options import OnConflict
+from scfile.core import Metrics, Options
+from scfile.core.options import JsonBytes, OnConflict
 from scfile.enums import CliCommand, L
-from scfile.utils import files
-from scfile.utils.cli import check_feature_unsupported
+from scfile.utils import archives, files
+from scfile.utils.cli import check_feature_unsupported, metrics_table
 
 from . import scfile
 
@@ -26,8 +30,14 @@ from . import scfile
 @click.option(
     "-O",
     "--output",
-    help="Output results directory.",
-    type=params.Output,
+    help="Output results directory or single .zip/.tar archive. Use '-' for standard output.",
+    type=params.StreamOutput,
+)
+@click.option(
+    "-I",
+    "--input-format",
+    help="Source format, required for standard input.",
+    type=params.InputFormats,
 )
 @click.option(
     "-F",
@@ -46,6 +56,13 @@ from . import scfile
     help="Use parent directory as starting point in relative directory.",
     is_flag=True,
 )
+@click.option(
+    "-W",
+    "--workers",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Number of worker threads (default: sequential)",
+)
 @click.option(
     "--skeleton",
     help="Parse armature in models.",
@@ -56,21 +73,48 @@ from . import scfile
     help="Parse builtin clips in models.",
     is_flag=True,
 )
+@click.option(
+    "--quantize",
+    help="Store model vertex attributes as normalized integers (glb).",
+    is_flag=True,
+)
+@click.option(
+    "--json-compact",
+    help="Write JSON without indentation (nbt).",
+    is_flag=True,
+)
+@click.option(
+    "--json-bytes",
+    type=params.JsonBytes,
+    default="string",
+    help="Encoding of byte arrays in JSON (nbt).",
+)
 @click.option(
     "--on-conflict",
     type=params.OnConflict,
     default="overwrite",
     help="What to do when output file already exists.",
 )
+@click.option(
+    "--stats",
+    help="Show per-stage timings and byte counters.",
+    is_flag=True,
+)
 def convert_command(
     paths: types.FilesPaths,
     output: types.Output,
+    input_format: Optional[str],
     mdlformat: Optional[Formats],
     relative: bool,
     parent: bool,
+    workers: int,
     skeleton: bool,
     animation: bool,
+    quantize: bool,
+    json_compact: bool,
+    json_bytes: JsonBytes,
     on_conflict: OnConflict,
+    stats: bool,
 ) -> None:
     # Normalize options
     model_formats = mdlformat or None
@@ -96,27 +140,132 @@ def convert_command(
         model_formats=model_formats,
         skeleton=skeleton,
         animation=animation,
+        quantize=quantize,
+        json_compact=json_compact,
+        json_bytes=json_bytes,
         on_conflict=on_conflict,
+        metrics=Metrics() if stats else None,
     )
 
-    out = str(output) if output else None
+    # Standard streams handled separately
+    if params.STDIO in paths or output == params.STDIO:
+        convert_stdio(paths, output, input_format, options)
+        return
+
+    # Archive output keeps directory layout as member paths
+    sink = convert.sinks.archive(output) if output and not output.is_dir() else None
+    out = "." if sink else str(output) if output else None
+
+    # Iterate over each directory and archive to their supported files
+    with archives.ArchiveReader() as reader, sink or nullcontext():
+        entries = files.walk(paths, parent=parent)
+
+        if workers <= 0:
+            for entry in entries:
+                try:
+                    _convert(entry, reader, sink, relative, out, options)
+                    _report(entry, None)
+
+                except Exception as err:
+                    _report(entry, err)
+
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending: dict[Future[None], types.FileEntry] = {}
+
+                for entry in entries:
+                    # Keep walk lazy, archives may hold tens of thousands of members
+                    if len(pending) >= workers * 2:
+                        _drain(pending)
+
+                    pending[executor.submit(_convert, entry, reader, sink, relative, out, options)] = entry
+
+                while pending:
+                    _drain(pending)
+
+    if options.metrics:
+        print(metrics_table(options.metrics))
 
-    # Iterate over each directory to their supported files
-    for entry in files.walk(paths, parent=parent):
-        dest = files.destination(relpath=entry.relpath, relative=relative, output=out)
 
-        # Convert source file
-        try:
-            convert.auto(source=entry.path, output=dest, options=options)
+def _convert(
+    entry: types.FileEntry,
+    reader: archives.ArchiveReader,
+    sink: Optional[convert.sinks.OutputSink],
+    relative: bool,
+    output: Optional[str],
+    options: Options,
+) -> None:
+    dest = files.entry_destination(entry=entry, relative=relative, output=output)
+    convert.auto(source=entry.path, output=dest, options=options, data=reader.load(entry), sink=sink)
+
+
+def _drain(pending: dict[Future[None], types.FileEntry]) -> None:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+    for future in done:
+        _report(pending.pop(future), future.exception())
+
+
+def _report(entry: types.FileEntry, error: Optional[BaseException]) -> None:
+    match error:
+        case None:
             print(L.DONE, f"'{entry.path}'")
 
-        except exceptions.InvalidStructureError as err:
-            print(L.ERROR, str(err), Text.EXCEPTION)
+        case exceptions.InvalidStructureError():
+            print(L.ERROR, str(error), Text.EXCEPTION)
 
-        except exceptions.ScFileException as err:
-            print(L.ERROR, str(err))
+        case exceptions.ScFileException():
+            print(L.ERROR, str(error))
 
-        except Exception as err:
-            print(L.EXCEPTION, f"File '{entry.path}' {repr(err)}.", Text.EXCEPTION)
-            print(traceback.format_exc())
+        case _:
+            print(L.EXCEPTION, f"File '{entry.path}' {repr(error)}.", Text.EXCEPTION)
+            print("".join(traceback.format_exception(error)))
             print()
+
+
+def convert_stdio(
+    paths: types.FilesPaths,
+    output: types.Output,
+    input_format: Optional[str],
+    options: Options,
+) -> None:
+    sources = list(paths)
+    console = Console(stderr=True)
+
+    if len(sources) != 1:
+        raise click.UsageError("Standard streams accept single source.")
+
+    source = sources[0]
+    stdin = source == params.STDIO
+
+    if stdin and not input_format:
+        raise click.UsageError("Reading from standard input requires '--input-format' option.")
+
+    src_format = input_format or convert.detect.format(source)
+
+    if output == params.STDIO and options.model_formats and len(options.model_formats) > 1:
+        raise click.UsageError("Standard output accepts single model format.")
+
+    decoder = convert.decoders().get(src_format)
+    if not decoder:
+        raise click.UsageError(f"Unsupported source format '{src_format}'.")
+
+    encoder = convert.encoders()[convert.detect.target(src_format, options)]
+    src = sys.stdin.buffer if stdin else source
+
+    try:
+        if output and output != params.STDIO:
+            output.mkdir(parents=True, exist_ok=True)
+
+            with open(output / f"stdin{encoder.format.suffix}", "wb") as file:
+                convert.convert.stream(decoder, encoder, src, file, options)
+
+        else:
+            convert.convert.stream(decoder, encoder, src, sys.stdout.buffer, options)
+
+    except exceptions.ScFileException as err:
+        console.print(L.ERROR, str(err))
+        raise click.exceptions.Exit(1)
+
+    if options.metrics:
+        console.print(metrics_table(options.metrics))
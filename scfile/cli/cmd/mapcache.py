@@ -1,6 +1,7 @@
 import os
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import click
 from rich import print
@@ -9,7 +10,7 @@ from scfile import exceptions, types
 from scfile.cli import params
 from scfile.core import Options
 from scfile.enums import CliCommand, L
-from scfile.utils import regions
+from scfile.utils import preview, regions
 
 from . import scfile
 
@@ -23,6 +24,27 @@ def _merge(key: regions.RegionKey, paths: list[Path], output: Path, options: Opt
         print(L.ERROR, repr(err))
 
 
+def _preview(mapping: regions.RegionsMapping, output: Path, workers: int | None, raw: bool, world: bool):
+    print(L.INFO, "Rendering preview...")
+
+    try:
+        options = Options(raw_blocks=raw, chunk_workers=0)
+        previews = preview.regions(mapping, options, workers=0 if workers is not None and workers <= 0 else workers)
+
+    except exceptions.RegionFileError as err:
+        print(L.ERROR, repr(err))
+        return
+
+    if world:
+        preview.save(preview.world(previews), output / "world.png")
+        print(L.DONE, f"world.png rendered {len(previews)} regions")
+        return
+
+    for (rx, rz), pixels in previews:
+        preview.save(pixels, output / f"r.{rx}.{rz}.png")
+        print(L.DONE, f"r.{rx}.{rz}.png rendered")
+
+
 @scfile.command(name=CliCommand.MAPCACHE)
 @click.argument(
     "SOURCE",
@@ -48,11 +70,31 @@ def _merge(key: regions.RegionKey, paths: list[Path], output: Path, options: Opt
     is_flag=True,
     help="Raw blocks without lookup",
 )
+@click.option(
+    "--level",
+    type=click.IntRange(min=0, max=9),
+    default=3,
+    show_default=True,
+    help="Chunks zlib compression level, 0 stores without compression",
+)
+@click.option(
+    "--palette",
+    is_flag=True,
+    help="Write Anvil 1.16 palette sections instead of 1.12 block arrays",
+)
+@click.option(
+    "--preview",
+    type=click.Choice(["region", "world"]),
+    help="Render top-down PNG per region or for whole world instead of merging",
+)
 def mapcache_command(
     source: types.Path,
     output: types.Output,
     workers: int | None,
     raw: bool,
+    level: int,
+    palette: bool,
+    preview: Optional[str],
 ) -> None:
     print(
         L.WARN,
@@ -76,16 +118,26 @@ def mapcache_command(
         output.mkdir(parents=True, exist_ok=True)
 
     print(L.INFO, f"Found {len(mapping)} unique regions")
+
+    if preview:
+        _preview(mapping, output, workers, raw, world=preview == "world")
+        return
+
     print(L.INFO, "Starting merge...")
 
-    options = Options(raw_blocks=raw)
+    sequential = workers is not None and workers <= 0
+
+    # Chunks within region use threads only when regions don't already
+    chunk_workers = None if sequential or len(mapping) == 1 else 0
+    options = Options(raw_blocks=raw, palette=palette, compression_level=level, chunk_workers=chunk_workers)
 
-    if workers is not None and workers <= 0:
+    if sequential:
         for key, paths in mapping.items():
             _merge(key, paths, output, options)
 
     else:
-        max_workers = (workers or os.cpu_count() or 4) * 2
+        # Chunks run sequentially inside each region, so one region per CPU keeps cores busy
+        max_workers = workers or os.cpu_count() or 4
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             for key, paths in mapping.items():
                 executor.submit(_merge, key, paths, output, options)
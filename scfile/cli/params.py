@@ -5,16 +5,20 @@ Click parameter types for commands.
 import click
 
 from scfile import types
-from scfile.consts import OutputFormats
-from scfile.core.options import ON_CONFLICT_OPTIONS
+from scfile.consts import SUPPORTED_FORMATS, OutputFormats
+from scfile.core.options import JSON_BYTES_OPTIONS, ON_CONFLICT_OPTIONS
 
 
+STDIO = types.Path("-")
+"""Dash path for standard input or output."""
+
 Files = click.Path(
     path_type=types.Path,
     dir_okay=True,
     file_okay=True,
     exists=True,
     resolve_path=True,
+    allow_dash=True,
 )
 
 Output = click.Path(
@@ -24,6 +28,14 @@ Output = click.Path(
     resolve_path=True,
 )
 
+StreamOutput = click.Path(
+    path_type=types.Path,
+    dir_okay=True,
+    file_okay=True,
+    resolve_path=True,
+    allow_dash=True,
+)
+
 MapCacheDir = click.Path(
     path_type=types.Path,
     dir_okay=True,
@@ -38,7 +50,17 @@ Formats = click.Choice(
     case_sensitive=False,
 )
 
+InputFormats = click.Choice(
+    choices=sorted(map(str, SUPPORTED_FORMATS)),
+    case_sensitive=False,
+)
+
 OnConflict = click.Choice(
     choices=ON_CONFLICT_OPTIONS,
     case_sensitive=False,
 )
+
+JsonBytes = click.Choice(
+    choices=JSON_BYTES_OPTIONS,
+    case_sensitive=False,
+)
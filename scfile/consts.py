@@ -24,6 +24,9 @@ SUPPORTED_NBT: set[str] = {"itemnames.dat", "prefs", "common", "sd0", "sd1", "sd
 ALLOWED_SUFFIXES: set[str] = SUPPORTED_SUFFIXES | SUPPORTED_NBT
 """All path suffixes available for conversion."""
 
+ARCHIVE_SUFFIXES: set[str] = {".zip", ".pak"}
+"""Archive suffixes whose members are converted without extraction."""
+
 
 class FileSignature:
     """Format magic bytes."""
@@ -2,7 +2,7 @@
 Format conversion utilities and auto-detection.
 """
 
-from . import convert, detect, factory, formats
+from . import convert, detect, factory, formats, sinks
 from .detect import auto
 from .factory import converters, decoders, encoders, registry
 from .formats import (
@@ -34,6 +34,7 @@ __all__ = (
     "convert",
     "detect",
     "formats",
+    "sinks",
     "auto",
     "factory",
     "converters",
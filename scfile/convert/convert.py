@@ -2,11 +2,16 @@
 Basic implementation of converting one format to another.
 """
 
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Type
+from typing import BinaryIO, Optional, Type
 
 from scfile import exceptions, types
-from scfile.core import ContentType, FileDecoder, FileEncoder, Options
+from scfile.core import ContentType, FileDecoder, FileEncoder, IOStream, MeshDecoder, MeshEncoder, Options
+
+from .sinks import OutputSink
 
 
 def convert(
@@ -15,6 +20,8 @@ def convert(
     source: types.PathLike,
     output: types.OutputLike = None,
     options: Optional[Options] = None,
+    data: Optional[bytes] = None,
+    sink: Optional[OutputSink] = None,
 ) -> None:
     """
     Convert one file between formats.
@@ -25,6 +32,10 @@ def convert(
         source: Path to source file.
         output (optional): Path to output file or directory. Defaults to source directory.
         options (optional): Shared handlers options.
+        data (optional): Source content already in memory, such as archive member.
+            Source path is then used only to name output.
+        sink (optional): Output sink, such as single archive.
+            Output is then relative path inside sink. Defaults to sink root.
 
     Raises:
         FileNotFound: Source file does not exist.
@@ -32,13 +43,15 @@ def convert(
     Example:
         - ``convert(McsaDecoder, ObjEncoder, "model.mcsb", "model.obj")``
         - ``convert(McsaDecoder, ObjEncoder, "model.mcsb", "path/to/output/dir")``
+        - ``convert(McsaDecoder, ObjEncoder, "model.mcsb", "path/to/output/dir", data=content)``
+        - ``convert(McsaDecoder, ObjEncoder, "model.mcsb", "models", sink=ZipSink("output.zip"))``
     """
 
     src_path = Path(source)
-    out_path = Path(output or src_path.parent)
+    out_path = Path(output or ("" if sink else src_path.parent))
     options = options or Options()
 
-    if not src_path.exists() or not src_path.is_file():
+    if data is None and (not src_path.exists() or not src_path.is_file()):
         raise exceptions.FileNotFound(str(src_path))
 
     if out_path.suffix == encoder.format.suffix:
@@ -48,6 +61,16 @@ def convert(
         out_dir = out_path
         out_name = f"{src_path.stem}{encoder.format.suffix}"
 
+    if sink is not None:
+        name = sink.reserve(out_dir / out_name, options.on_conflict)
+
+        if name is not None:
+            with decoder(src_path if data is None else data, options) as src:
+                with _encoder(src, encoder) as out:
+                    sink.write(name, out.getvalue())
+
+        return
+
     if not out_dir.exists():
         out_dir.mkdir(exist_ok=True, parents=True)
 
@@ -59,11 +82,105 @@ def convert(
         case "rename":
             output_path = ensure_unique_path(output_path)
 
-    with decoder(src_path, options) as src:
+    with decoder(src_path if data is None else data, options) as src:
+        if isinstance(src, MeshDecoder) and issubclass(encoder, MeshEncoder):
+            _stream_file(src, encoder, output_path)
+            return
+
+        passthrough = encoder.passthrough and not src.forward
+
+        if passthrough or encoder.incremental:
+            _encode_file(src, encoder, output_path, passthrough)
+            return
+
         with src.convert_to(encoder=encoder) as out:
             out.save(path=output_path)
 
 
+def stream(
+    decoder: Type[FileDecoder[ContentType]],
+    encoder: Type[FileEncoder[ContentType]],
+    source: IOStream,
+    output: BinaryIO,
+    options: Optional[Options] = None,
+) -> None:
+    """
+    Convert one stream between formats without touching disk.
+
+    Args:
+        decoder: Decoder class for source format.
+        encoder: Encoder class for output format.
+        source: Source file path, bytes, or binary IO stream. Non-seekable streams are read forward only.
+        output: Binary IO stream for encoded content. Written sequentially, may be non-seekable.
+        options (optional): Shared handlers options.
+
+    Example:
+        - ``stream(McsbDecoder, ObjEncoder, sys.stdin.buffer, sys.stdout.buffer)``
+    """
+
+    options = options or Options()
+
+    with decoder(source, options) as src:
+        with _encoder(src, encoder) as out:
+            out.writeto(output)
+
+    output.flush()
+
+
+def _encoder(
+    src: FileDecoder[ContentType],
+    encoder: Type[FileEncoder[ContentType]],
+) -> FileEncoder[ContentType]:
+    """Encoder for decoded source. Models are converted mesh by mesh where both formats allow it."""
+
+    if isinstance(src, MeshDecoder) and issubclass(encoder, MeshEncoder):
+        return src.stream_to(encoder)
+
+    return src.convert_to(encoder=encoder)
+
+
+def _stream_file(
+    src: MeshDecoder,
+    encoder: Type[MeshEncoder],
+    path: Path,
+) -> None:
+    """Convert mesh by mesh into partial file, moved into place once complete."""
+
+    with _partial(path) as partial:
+        with src.stream_to(encoder, output=partial):
+            pass
+
+
+def _encode_file(
+    src: FileDecoder[ContentType],
+    encoder: Type[FileEncoder[ContentType]],
+    path: Path,
+    passthrough: bool = False,
+) -> None:
+    """
+    Encode straight into partial file, moved into place once complete.
+
+    With ``passthrough``, payloads are copied from source file without reading into memory.
+    """
+
+    with _partial(path) as partial:
+        data = src.decode(passthrough=passthrough)
+        with encoder(data=data, options=src.options, output=partial) as out:
+            out.encode()
+
+
+@contextmanager
+def _partial(path: Path) -> Iterator[Path]:
+    partial = path.with_name(f"{path.name}.part")
+
+    try:
+        yield partial
+        os.replace(partial, path)
+
+    finally:
+        partial.unlink(missing_ok=True)
+
+
 def ensure_unique_path(path: Path) -> Path:
     """Append a counter to path if a file already exists."""
 
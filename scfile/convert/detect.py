@@ -7,11 +7,13 @@ from pathlib import Path
 from typing import Optional
 
 from scfile import exceptions, types
-from scfile.consts import SUPPORTED_NBT
+from scfile.consts import ALLOWED_SUFFIXES, SUPPORTED_NBT
 from scfile.core import Options
 from scfile.enums import FileFormat
+from scfile.utils import archives
 
 from . import factory, formats
+from .sinks import OutputSink
 
 
 def format(
@@ -26,18 +28,50 @@ def format(
     return os.path.splitext(name)[1].lstrip(".")
 
 
+def target(
+    src_format: str,
+    options: Optional[Options] = None,
+) -> str:
+    """
+    Detect output format for source format.
+
+    Models use first of requested formats.
+
+    Raises:
+        UnsupportedFormatError: Source format not supported.
+    """
+
+    src_format = src_format.lower().lstrip(".")
+    options = options or Options()
+    targets = factory.converters(src_format)
+
+    if not targets:
+        raise exceptions.UnsupportedFormatError(src_format, f".{src_format}")
+
+    if src_format in (FileFormat.MCSB, FileFormat.MCSA, FileFormat.MCVD, FileFormat.EFKMODEL):
+        return str((options.model_formats or options.default_model_formats)[0])
+
+    return next(iter(targets))
+
+
 def auto(
     source: types.PathLike,
     output: types.OutputLike = None,
     options: Optional[Options] = None,
+    data: Optional[bytes] = None,
+    sink: Optional[OutputSink] = None,
 ) -> None:
     """
     Automatically convert one file between formats based on its extension.
 
+    Zip archive sources are converted member by member without extraction.
+
     Arguments:
-        source: Path to source file.
+        source: Path to source file or archive.
         output (optional): Path to directory. Defaults to same location as source.
         options (optional): Shared handlers options.
+        data (optional): Source content already in memory. Source path is then used only for detection and naming.
+        sink (optional): Output sink, such as single archive. Output is then relative path inside sink.
 
     Raises:
         InvalidStructureError: Source file is corrupted.
@@ -47,6 +81,8 @@ def auto(
         - ``auto("model.mcsb", "model.obj")``
         - ``auto("model.mcsb", "model.obj", Options(skeleton=True))``
         - ``auto("model.mcsb", "path/to/output/dir")``
+        - ``auto("assets.zip", "path/to/output/dir")``
+        - ``auto("model.mcsb", sink=ZipSink("output.zip"))``
     """
 
     src_path = Path(source)
@@ -55,6 +91,12 @@ def auto(
     options = options or Options()
     model_formats = options.model_formats or options.default_model_formats
 
+    if data is None and archives.is_archive(source):
+        with archives.ArchiveReader() as reader:
+            for entry in archives.entries(str(src_path), tuple(ALLOWED_SUFFIXES)):
+                auto(entry.path, output or (None if sink else src_path.parent), options, reader.load(entry), sink)
+        return
+
     # Detect format by file suffix
     match src_format:
         case FileFormat.MCSB | FileFormat.MCSA | FileFormat.MCVD | FileFormat.EFKMODEL:
@@ -63,22 +105,22 @@ def auto(
 
             # Convert model to all requested formats
             for fmt in model_formats:
-                converters[fmt](source, output, options)
+                converters[fmt](source, output, options, data, sink)
 
         case FileFormat.OL:
-            formats.ol_to_dds(source, output, options)
+            formats.ol_to_dds(source, output, options, data, sink)
 
         case FileFormat.MIC:
-            formats.mic_to_png(source, output, options)
+            formats.mic_to_png(source, output, options, data, sink)
 
         case FileFormat.TEXARR:
-            formats.texarr_to_zip(source, output, options)
+            formats.texarr_to_zip(source, output, options, data, sink)
 
         case FileFormat.NBT:
-            formats.nbt_to_json(source, output, options)
+            formats.nbt_to_json(source, output, options, data, sink)
 
         case FileFormat.MDAT:
-            formats.mdat_to_mca(source, output, options)
+            formats.mdat_to_mca(source, output, options, data, sink)
 
         case _:
             raise exceptions.UnsupportedFormatError(str(src_path), src_path.suffix)
@@ -11,6 +11,7 @@ from scfile.core import ContentType, FileDecoder, FileEncoder, Options
 from scfile.types import PathLike
 
 from .convert import convert
+from .sinks import OutputSink
 
 
 ConverterMap: TypeAlias = dict[str, Callable]
@@ -75,6 +76,8 @@ def converter(
             source: PathLike,
             output: Optional[PathLike] = None,
             options: Optional[Options] = None,
+            data: Optional[bytes] = None,
+            sink: Optional[OutputSink] = None,
         ):
             convert(
                 decoder=decoder,
@@ -82,6 +85,8 @@ def converter(
                 source=source,
                 output=output,
                 options=options,
+                data=data,
+                sink=sink,
             )
 
         _register(
@@ -0,0 +1,250 @@
+"""
+Output sinks for converted files.
+
+Sink collects encoded files under relative names, either into directory or into single archive.
+Archive sinks write members sequentially from one writer thread, so conversion workers only hand over buffers.
+"""
+
+import io
+import os
+import queue
+import tarfile
+import threading
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Optional, Self, TypeAlias
+
+from scfile import types
+from scfile.core.options import OnConflict
+
+
+SinkTarget: TypeAlias = types.PathLike | BinaryIO
+"""Archive file path or writable binary stream."""
+
+TAR_MODES: dict[str, str] = {
+    ".tar": "",
+    ".tar.gz": "gz",
+    ".tgz": "gz",
+    ".tar.bz2": "bz2",
+    ".tar.xz": "xz",
+}
+"""Tar suffixes and their compression."""
+
+
+class OutputSink(ABC):
+    """
+    Destination for converted files.
+
+    Names are relative POSIX paths. Safe to use from multiple threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names: set[str] = set()
+
+    def reserve(
+        self,
+        path: types.PathLike,
+        on_conflict: OnConflict = "overwrite",
+    ) -> Optional[str]:
+        """
+        Claim name for file about to be written.
+
+        Returns:
+            Resolved name, or ``None`` if file should be skipped.
+        """
+
+        name = PurePosixPath(Path(path).as_posix())
+
+        with self._lock:
+            match on_conflict:
+                case "skip" if self.exists(str(name)):
+                    return None
+                case "rename":
+                    name = self._unique(name)
+
+            self._names.add(str(name))
+
+        return str(name)
+
+    def exists(self, name: str) -> bool:
+        """Whether name is already claimed in this sink."""
+
+        return name in self._names
+
+    def _unique(self, name: PurePosixPath) -> PurePosixPath:
+        filename, suffix = name.stem, name.suffix
+        counter = 1
+
+        while self.exists(str(name)):
+            name = name.with_name(f"{filename} ({counter}){suffix}")
+            counter += 1
+
+        return name
+
+    @abstractmethod
+    def write(self, name: str, data: bytes) -> None:
+        """Write file content under reserved name."""
+        ...
+
+    def close(self) -> None:
+        """Flush pending files and release resources."""
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class DirectorySink(OutputSink):
+    """Sink writing regular files under root directory."""
+
+    def __init__(self, root: types.PathLike):
+        super().__init__()
+        self.root = Path(root)
+        self._dirs: set[Path] = set()
+
+    def exists(self, name: str) -> bool:
+        return super().exists(name) or (self.root / name).exists()
+
+    def write(self, name: str, data: bytes) -> None:
+        path = self.root / name
+
+        # Create each directory once instead of per file
+        if path.parent not in self._dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(path.parent)
+
+        path.write_bytes(data)
+
+
+class ArchiveSink(OutputSink, ABC):
+    """
+    Sink writing members into single archive from dedicated writer thread.
+
+    Archive can't replace written member,
+    so ``overwrite`` conflicts add duplicate member that replaces earlier one on extraction.
+    """
+
+    QUEUE_SIZE = 64
+    """Encoded files waiting for writer before producers block."""
+
+    def __init__(self):
+        super().__init__()
+        self._queue: queue.Queue[Optional[tuple[str, bytes]]] = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    def write(self, name: str, data: bytes) -> None:
+        if self._error:
+            raise self._error
+
+        self._queue.put((name, data))
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._finish()
+
+        if self._error:
+            raise self._error
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            # Keep draining after failure so producers never block
+            if self._error is None:
+                try:
+                    self._add(*item)
+                except BaseException as err:
+                    self._error = err
+
+    @abstractmethod
+    def _add(self, name: str, data: bytes) -> None: ...
+
+    @abstractmethod
+    def _finish(self) -> None: ...
+
+
+class ZipSink(ArchiveSink):
+    """Sink writing members into zip archive."""
+
+    def __init__(self, target: SinkTarget, compression: int = zipfile.ZIP_STORED):
+        """
+        Args:
+            target: Archive path or writable binary stream, may be non-seekable.
+            compression (optional): Zip compression method.
+        """
+
+        self._archive = zipfile.ZipFile(target, mode="w", compression=compression)
+        super().__init__()
+
+    def _add(self, name: str, data: bytes) -> None:
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.compress_type = self._archive.compression
+        info.external_attr = 0o644 << 16
+        self._archive.writestr(info, data)
+
+    def _finish(self) -> None:
+        self._archive.close()
+
+
+class TarSink(ArchiveSink):
+    """Sink writing members into tar archive."""
+
+    def __init__(self, target: SinkTarget, compression: str = ""):
+        """
+        Args:
+            target: Archive path or writable binary stream, may be non-seekable.
+            compression (optional): Tar compression: ``gz``, ``bz2``, ``xz`` or empty for none.
+        """
+
+        if isinstance(target, (str, os.PathLike)):
+            self._archive = tarfile.open(target, mode=f"w:{compression}")
+        else:
+            self._archive = tarfile.open(fileobj=target, mode=f"w|{compression}")
+
+        super().__init__()
+
+    def _add(self, name: str, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self._archive.addfile(info, io.BytesIO(data))
+
+    def _finish(self) -> None:
+        self._archive.close()
+
+
+def archive(
+    path: types.PathLike,
+) -> Optional[ArchiveSink]:
+    """
+    Open archive sink matching path suffix.
+
+    Returns:
+        Zip or tar sink, or ``None`` if path is not archive.
+    """
+
+    name = os.path.basename(os.fspath(path)).lower()
+
+    if name.endswith(".zip"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return ZipSink(path)
+
+    for suffix, compression in TAR_MODES.items():
+        if name.endswith(suffix):
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            return TarSink(path, compression)
+
+    return None
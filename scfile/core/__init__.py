@@ -2,7 +2,7 @@
 Abstract core classes for reading and writing binary formats.
 """
 
-from . import base, decoder, encoder, options, structio, types
+from . import base, decoder, encoder, metrics, options, parallel, streaming, streams, structio, types
 from .base import BaseFile, FileMode, IOStream
 from .content import (
     BaseContent,
@@ -17,7 +17,10 @@ from .content import (
 )
 from .decoder import FileDecoder
 from .encoder import FileEncoder
+from .metrics import Metrics
 from .options import Options
+from .streaming import MeshDecoder, MeshEncoder
+from .streams import BufferStream, SourceRange
 from .structio import StructIO
 
 
@@ -25,13 +28,20 @@ __all__ = (
     "base",
     "decoder",
     "encoder",
+    "metrics",
     "options",
+    "parallel",
+    "streaming",
+    "streams",
     "structio",
     "types",
     "BaseFile",
     "FileDecoder",
     "FileEncoder",
+    "MeshDecoder",
+    "MeshEncoder",
     "Options",
+    "Metrics",
     "ContentType",
     "BaseContent",
     "ModelContent",
@@ -41,6 +51,8 @@ __all__ = (
     "TexarrContent",
     "NbtContent",
     "StructIO",
+    "BufferStream",
+    "SourceRange",
     "FileMode",
     "IOStream",
     "NbtValue",
@@ -9,19 +9,22 @@ import io
 import os
 import struct
 from abc import ABC
+from contextlib import AbstractContextManager, nullcontext
 from io import BytesIO, IOBase
 from pathlib import Path
 from typing import IO, Any, BinaryIO, Literal, Optional, TypeAlias, cast
 
-from scfile.enums import FileFormat
+from scfile.enums import ByteOrder, FileFormat
 from scfile.exceptions import InvalidStructureError
 from scfile.types import PathLike
 
+from .metrics import FileMetrics, Operation
 from .options import Options
+from .streams import BufferStream, ForwardStream
 from .structio import StructIO
 
 
-IOStream: TypeAlias = str | bytes | PathLike | BinaryIO
+IOStream: TypeAlias = str | bytes | bytearray | memoryview | PathLike | BinaryIO
 FileMode: TypeAlias = Literal["rb", "rb+", "wb", "wb+", "ab", "ab+"]
 TempContext: TypeAlias = dict[str, Any]
 
@@ -40,6 +43,8 @@ class BaseFile(StructIO, ABC):
 
     _location: str
     _stream: IO[bytes]
+    _metrics: Optional[FileMetrics] = None
+    _size: Optional[int] = None
 
     def __init__(
         self,
@@ -48,7 +53,7 @@ class BaseFile(StructIO, ABC):
     ):
         """
         Args:
-            stream: Source input. File path, bytes, or binary IO stream.
+            stream: Source input. File path, binary IO stream, or buffer (bytes, memoryview, mmap, ndarray).
             mode: File mode (binary) for opening when ``stream`` is path.
         """
 
@@ -56,15 +61,20 @@ class BaseFile(StructIO, ABC):
             self._location = os.fspath(stream)
             self._stream = open(self._location, mode)
 
-        elif isinstance(stream, bytes):
-            self._stream = BytesIO(stream)
-            self._location = f"<bytes at {hex(id(self._stream))}>"
-
         elif isinstance(stream, IOBase):
             self._stream = cast(IO[bytes], stream)
 
             name = self._stream.name if hasattr(self._stream, "name") else None
-            self._location = name or f"<{type(stream).__name__} at {hex(id(stream))}>"
+            self._location = str(name or f"<{type(stream).__name__} at {hex(id(stream))}>")
+
+            # Pipes, sockets and standard input are read forward only
+            if mode == "rb" and not stream.seekable():
+                self._stream = cast(IO[bytes], ForwardStream(self._stream))
+
+        elif _is_buffer(stream):
+            # Read-only buffers are wrapped without copy
+            self._stream = cast(IO[bytes], BufferStream(stream) if mode == "rb" else BytesIO(stream))
+            self._location = f"<{type(stream).__name__} at {hex(id(self._stream))}>"
 
         else:
             raise TypeError(f"Expected IOStream, got {type(stream).__name__}")
@@ -83,24 +93,39 @@ class BaseFile(StructIO, ABC):
     def closed(self) -> bool:
         return self._stream.closed
 
+    @property
+    def forward(self) -> bool:
+        """Whether source stream is read forward only."""
+
+        return isinstance(self._stream, ForwardStream)
+
     def size(self) -> int:
-        current = self.tell()
-        self.seek(0, 2)
-        size = self.tell()
-        self.seek(current)
-        return size
+        if self.forward:
+            raise io.UnsupportedOperation("Size of forward-only stream is unknown")
+
+        # Cached until next write
+        if self._size is None:
+            current = self.tell()
+            self.seek(0, 2)
+            self._size = self.tell()
+            self.seek(current)
+        return self._size
 
     def read(self, size: int = -1) -> bytes:
         return self._stream.read(size)
 
-    def write(self, data: bytes) -> int:
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        self._size = None
         return self._stream.write(data)
 
     def seek(self, pos: int, whence: int = 0) -> int:
         return self._stream.seek(pos, whence)
 
     def skip(self, size: int):
-        self.seek(size, io.SEEK_CUR)
+        if isinstance(self._stream, ForwardStream):
+            self._stream.skip(size)
+        else:
+            self.seek(size, io.SEEK_CUR)
 
     def tell(self) -> int:
         return self._stream.tell()
@@ -131,8 +156,51 @@ class BaseFile(StructIO, ABC):
         return data
 
     def is_eof(self) -> bool:
+        if isinstance(self._stream, ForwardStream):
+            return self._stream.at_eof()
         return self.size() <= self.tell()
 
+    def _readview(self, size: int) -> bytes | memoryview:
+        if isinstance(self._stream, BufferStream):
+            return self._stream.readview(size)
+        return self.read(size)
+
+    def _readarray(self, dtype: str, count: int, order: Optional[ByteOrder] = None):
+        if self._metrics:
+            self._metrics.arrays += 1
+
+        array = super()._readarray(dtype, count, order)
+
+        # Decoded content outlives stream, views would keep buffer sources such as mmap open
+        return array.copy() if isinstance(self._stream, BufferStream) else array
+
+    def _measure(self, operation: Operation) -> None:
+        """Start collecting metrics of pipeline run, if enabled by options."""
+
+        if self.options.metrics is None:
+            self._metrics = None
+            return
+
+        self._metrics = FileMetrics(format=str(self.format), operation=operation, location=self.location)
+
+    def _stage(self, name: str) -> AbstractContextManager:
+        """Measure pipeline stage. No-op without metrics."""
+
+        if self._metrics is None:
+            return nullcontext()
+        return self._metrics.stage(name)
+
+    def _collect(self, bytes_read: int = 0, bytes_written: int = 0) -> None:
+        """Pass finished pipeline run metrics to collector."""
+
+        if self._metrics is None or self.options.metrics is None:
+            return
+
+        self._metrics.bytes_read = bytes_read
+        self._metrics.bytes_written = bytes_written
+        self.options.metrics.record(self._metrics)
+        self._metrics = None
+
     def _unpack(self, fmt: str) -> tuple[Any, ...]:
         try:
             return super()._unpack(fmt)
@@ -143,3 +211,12 @@ class BaseFile(StructIO, ABC):
     def __repr__(self) -> str:
         closed = "closed" if self.closed else "open"
         return f"<{type(self).__name__} {self.location} [{closed}]>"
+
+
+def _is_buffer(stream: Any) -> bool:
+    try:
+        memoryview(stream).release()
+        return True
+
+    except TypeError:
+        return False
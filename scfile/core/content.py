@@ -14,6 +14,8 @@ from scfile.structures.models import ModelFlags, ModelScene
 from scfile.structures.regions import RegionChunk
 from scfile.structures.textures import CubemapTexture, DefaultTexture, TextureType
 
+from .streams import SourceRange
+
 
 NbtValue: TypeAlias = None | int | float | bytes | str | list[int] | list["NbtValue"] | dict[str, "NbtValue"]
 
@@ -87,7 +89,7 @@ class ImageContent(BaseContent):
 
     type: FileType = field(default=FileType.IMAGE)
 
-    image: bytes = field(default_factory=bytes)
+    image: bytes | SourceRange = field(default_factory=bytes)
 
 
 @dataclass
@@ -97,7 +99,7 @@ class TexarrContent(BaseContent):
     type: FileType = field(default=FileType.TEXARR)
 
     count: int = 0
-    textures: list[tuple[str, bytes]] = field(default_factory=list)
+    textures: list[tuple[str, bytes | SourceRange]] = field(default_factory=list)
 
 
 @dataclass
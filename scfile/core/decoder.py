@@ -11,10 +11,11 @@ from typing import Generic, Optional, Type, TypeVar
 from scfile import exceptions
 from scfile.enums import ByteOrder, F
 from scfile.enums import SafetyLimit as Limit
+from scfile.structures.models import Flag
 
 from .base import BaseFile, IOStream
 from .content import ContentType
-from .encoder import FileEncoder
+from .encoder import EncoderAttributes, FileEncoder
 from .options import Options
 
 
@@ -30,6 +31,12 @@ class FileDecoder(BaseFile, Generic[ContentType], ABC):
 
     _content: type[ContentType]
 
+    attributes: EncoderAttributes = None
+    """Model vertex attributes requested for current decoding. All attributes if not set."""
+
+    passthrough: bool = False
+    """Whether byte-preserved payloads are recorded as :class:`~scfile.core.streams.SourceRange` instead of read."""
+
     def __init__(
         self,
         stream: IOStream,
@@ -55,21 +62,37 @@ class FileDecoder(BaseFile, Generic[ContentType], ABC):
     def decode(
         self,
         seek: bool = True,
+        attributes: EncoderAttributes = None,
+        passthrough: bool = False,
     ) -> ContentType:
         """
         Runs decoding pipeline.
 
         Args:
-            seek: Reset stream position to the beginning after parsing.
+            seek: Reset stream position to the beginning after parsing. Ignored for forward-only streams.
+            attributes (optional): Model vertex attributes to parse. Others are skipped. Defaults to all.
+            passthrough (optional): Record byte-preserved payloads as source ranges instead of reading them.
+                Source must stay open until content is encoded. Ignored for forward-only streams.
 
         Returns:
             Parsed content data.
         """
 
-        self.prelude()
-        self.validate_signature()
-        self.parse()
-        if seek:
+        self.data = self._content()
+        self.attributes = attributes
+        self.passthrough = passthrough and not self.forward
+
+        self._measure("decode")
+
+        with self._stage("prelude"):
+            self.prelude()
+        with self._stage("signature"):
+            self.validate_signature()
+        with self._stage("parse"):
+            self.parse()
+
+        self._collect(bytes_read=self.tell())
+        if seek and not self.forward:
             self.seek(0)
         return self.data
 
@@ -92,7 +115,7 @@ class FileDecoder(BaseFile, Generic[ContentType], ABC):
         """
 
         options = options or self.options
-        data = self.decode()
+        data = self.decode(attributes=encoder.attributes)
 
         return encoder(data=data, options=options, output=output)
 
@@ -134,14 +157,24 @@ class FileDecoder(BaseFile, Generic[ContentType], ABC):
             `EmptyFileError` or `InvalidSignatureError` on failure.
         """
 
-        if self.size() <= len(self.signature or bytes()):
-            raise exceptions.EmptyFileError(self.location)
+        signature = self.signature or bytes()
+
+        if self.forward:
+            # Size is unknown, check that content follows signature instead
+            read = self.read(len(signature))
+            if len(read) < len(signature) or self.is_eof():
+                raise exceptions.EmptyFileError(self.location)
+
+        else:
+            if self.size() <= len(signature):
+                raise exceptions.EmptyFileError(self.location)
+            read = self.read(len(signature))
 
-        if self.signature:
-            read = self.read(len(self.signature))
+        if read != signature:
+            raise exceptions.InvalidSignatureError(self.location, read, signature)
 
-            if read != self.signature:
-                raise exceptions.InvalidSignatureError(self.location, read, self.signature)
+    def _requested(self, attribute: Flag) -> bool:
+        return self.attributes is None or attribute in self.attributes
 
     def _checklimit(self, value: int, limit: IntEnum) -> int:
         maximum = int(limit)
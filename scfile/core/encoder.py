@@ -6,7 +6,7 @@ Defines the contract for serializing structured content into binary data.
 
 from abc import ABC, abstractmethod
 from io import BytesIO
-from typing import Generic, Optional, Self, TypeAlias
+from typing import BinaryIO, Generic, Optional, Self, TypeAlias
 
 from scfile.structures.models import Flag
 from scfile.structures.models.transforms import SceneTransform
@@ -15,9 +15,11 @@ from scfile.types import PathLike
 from .base import BaseFile, FileMode, IOStream
 from .content import ContentType, ModelContent
 from .options import Options
+from .streams import SourceRange
 
 
 EncoderTransforms: TypeAlias = Optional[list[SceneTransform]]
+EncoderAttributes: TypeAlias = Optional[frozenset[Flag]]
 
 
 class FileEncoder(BaseFile, Generic[ContentType], ABC):
@@ -30,6 +32,15 @@ class FileEncoder(BaseFile, Generic[ContentType], ABC):
     transforms: EncoderTransforms = None
     """Format-specific transforms applied to model data before serialization."""
 
+    attributes: EncoderAttributes = None
+    """Model vertex attributes used in serialization. Decoders skip others. All attributes if not set."""
+
+    passthrough: bool = False
+    """Whether payloads may be :class:`~scfile.core.streams.SourceRange`, copied without reading into memory."""
+
+    incremental: bool = False
+    """Whether serialization writes output in parts, so file conversion writes it straight to disk."""
+
     def __init__(
         self,
         data: ContentType,
@@ -68,10 +79,18 @@ class FileEncoder(BaseFile, Generic[ContentType], ABC):
             Self (chaining).
         """
 
-        self.prelude()
-        self.transform(transforms=transforms)
-        self.add_signature()
-        self.serialize()
+        self._measure("encode")
+
+        with self._stage("prelude"):
+            self.prelude()
+        with self._stage("transform"):
+            self.transform(transforms=transforms)
+        with self._stage("signature"):
+            self.add_signature()
+        with self._stage("serialize"):
+            self.serialize()
+
+        self._collect(bytes_written=self.size())
         return self
 
     def prelude(self) -> None:
@@ -102,6 +121,15 @@ class FileEncoder(BaseFile, Generic[ContentType], ABC):
         """Write ``self.data`` to the output stream. Called by :meth:`encode`."""
         ...
 
+    def copy(self, data: bytes | SourceRange) -> int:
+        """Write payload to the output stream. Source range is copied by kernel where both streams are files."""
+
+        if isinstance(data, SourceRange):
+            self._size = None
+            return data.copy_to(self._stream)
+
+        return self.write(data)
+
     def save_as(
         self,
         path: PathLike,
@@ -115,11 +143,8 @@ class FileEncoder(BaseFile, Generic[ContentType], ABC):
             mode: File mode (binary).
         """
 
-        if self.size() == 0:
-            self.encode()
-
         with open(path, mode=mode) as fp:
-            fp.write(self.getvalue())
+            self.writeto(fp)
 
         return self
 
@@ -179,6 +204,23 @@ class FileEncoder(BaseFile, Generic[ContentType], ABC):
         finally:
             self.close()
 
+    def writeto(self, stream: BinaryIO) -> int:
+        """
+        Write encoded data to binary stream. In-memory output is written as view, without copy.
+
+        Args:
+            stream: Writable binary stream.
+        """
+
+        if self.size() == 0:
+            self.encode()
+
+        if isinstance(self._stream, BytesIO):
+            with self._stream.getbuffer() as view:
+                return stream.write(view)
+
+        return stream.write(self.getvalue())
+
     def getvalue(self) -> bytes:
         if self.size() == 0:
             self.encode()
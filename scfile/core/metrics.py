@@ -0,0 +1,137 @@
+"""
+Opt-in instrumentation for decoding and encoding pipelines.
+
+Collects wall time per pipeline stage, bytes read and written,
+and array counts per file, aggregated by format.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Literal, Optional, TypeAlias
+
+
+Operation: TypeAlias = Literal["decode", "encode"]
+
+
+@dataclass
+class FileMetrics:
+    """Measurements of single pipeline run."""
+
+    format: str
+    operation: Operation
+    location: str
+
+    stages: dict[str, float] = field(default_factory=dict)
+    """Wall time in seconds per pipeline stage."""
+
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    arrays: int = 0
+    """Count of arrays read from stream."""
+
+    @property
+    def elapsed(self) -> float:
+        return sum(self.stages.values())
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure wall time of wrapped block as *name* stage."""
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+
+
+@dataclass
+class FormatMetrics:
+    """Measurements aggregated by format and operation."""
+
+    format: str
+    operation: Operation
+
+    files: int = 0
+    stages: dict[str, float] = field(default_factory=dict)
+    bytes_read: int = 0
+    bytes_written: int = 0
+    arrays: int = 0
+
+    @property
+    def elapsed(self) -> float:
+        return sum(self.stages.values())
+
+    def add(self, record: FileMetrics) -> None:
+        self.files += 1
+        self.bytes_read += record.bytes_read
+        self.bytes_written += record.bytes_written
+        self.arrays += record.arrays
+
+        for name, elapsed in record.stages.items():
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+
+MetricsCallback: TypeAlias = Callable[[FileMetrics], None]
+
+
+class Metrics:
+    """
+    Thread-safe collector of pipeline measurements.
+
+    Pass instance with :attr:`Options.metrics` to enable instrumentation.
+    """
+
+    def __init__(self, callback: Optional[MetricsCallback] = None):
+        """
+        Args:
+            callback (optional): Called with each file record after it is collected.
+        """
+
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._files: list[FileMetrics] = []
+        self._formats: dict[tuple[str, Operation], FormatMetrics] = {}
+
+    @property
+    def files(self) -> list[FileMetrics]:
+        """Collected records per file."""
+
+        with self._lock:
+            return list(self._files)
+
+    @property
+    def formats(self) -> list[FormatMetrics]:
+        """Collected records aggregated by format and operation."""
+
+        with self._lock:
+            return [self._formats[key] for key in sorted(self._formats)]
+
+    def record(self, metrics: FileMetrics) -> None:
+        """Collect single file record."""
+
+        key = (metrics.format, metrics.operation)
+
+        with self._lock:
+            self._files.append(metrics)
+
+            if key not in self._formats:
+                self._formats[key] = FormatMetrics(format=metrics.format, operation=metrics.operation)
+            self._formats[key].add(metrics)
+
+        if self.callback:
+            self.callback(metrics)
+
+    def reset(self) -> None:
+        """Drop all collected records."""
+
+        with self._lock:
+            self._files.clear()
+            self._formats.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._files)
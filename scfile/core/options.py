@@ -7,10 +7,15 @@ from typing import Literal, Optional
 
 from scfile.consts import DefaultModelFormats, Formats
 
+from .metrics import Metrics
+
 
 OnConflict = Literal["overwrite", "rename", "skip"]
 ON_CONFLICT_OPTIONS: list[OnConflict] = ["overwrite", "rename", "skip"]
 
+JsonBytes = Literal["string", "base64", "list"]
+JSON_BYTES_OPTIONS: list[JsonBytes] = ["string", "base64", "list"]
+
 
 @dataclass
 class Options:
@@ -25,12 +30,36 @@ class Options:
     animation: bool = False
     """Handle built-in animation clips from models."""
 
+    quantize: bool = False
+    """Store model vertex attributes as normalized integers where supported (GLB ``KHR_mesh_quantization``)."""
+
     raw_blocks: bool = False
     """Keep raw block IDs in chunks without lookup table replacement."""
 
     full_chunk: bool = False
     """Handle full chunk data including metadata (no export)."""
 
+    palette: bool = False
+    """Write Anvil 1.16 palette-based region sections instead of 1.12 block arrays."""
+
+    compression_level: int = 3
+    """Zlib level of region chunks, from ``0`` (stored, fastest) to ``9`` (smallest)."""
+
+    chunk_workers: Optional[int] = None
+    """Threads compressing and decompressing chunks within single region. Sequential on ``0``, shared pool on unset."""
+
+    json_compact: bool = False
+    """Write JSON without indentation and whitespace."""
+
+    json_bytes: JsonBytes = "string"
+    """
+    JSON encoding of byte arrays.
+
+    - `"string"` Python bytes literal (e.g. `"b'\\x01'"`).
+    - `"base64"` Base64 string.
+    - `"list"` Array of integers, like int arrays.
+    """
+
     on_conflict: OnConflict = "overwrite"
     """
     Action on output file name conflict (if already exists).
@@ -40,6 +69,9 @@ class Options:
     - `"rename"` Add a numeric suffix (e.g. `model (1).obj`).
     """
 
+    metrics: Optional[Metrics] = None
+    """Collector of per-stage timings and byte counters. Instrumentation disabled on unset."""
+
     @property
     def default_model_formats(self) -> Formats:
         """Default output formats for models based on current options."""
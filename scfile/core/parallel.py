@@ -0,0 +1,67 @@
+"""
+Thread pool helpers for independent work items within single file.
+
+Compression libraries release GIL, so threads scale across cores.
+"""
+
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_lock = threading.Lock()
+_local = threading.local()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _mark() -> None:
+    _local.shared = True
+
+
+def shared() -> ThreadPoolExecutor:
+    """
+    Process-wide executor sized by CPU count.
+
+    Files and regions processed concurrently share it, so nested work never multiplies threads.
+    """
+
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4,
+                thread_name_prefix="scfile-parallel",
+                initializer=_mark,
+            )
+        return _executor
+
+
+def imap(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    workers: Optional[int] = None,
+) -> list[R]:
+    """
+    Apply function to each item, keeping items order.
+
+    Args:
+        func: Function to apply.
+        items: Work items.
+        workers (optional): Number of threads. Sequential on ``0``, shared executor on unset.
+    """
+
+    # Shared executor threads would wait on themselves
+    if workers == 0 or len(items) < 2 or getattr(_local, "shared", False):
+        return [func(item) for item in items]
+
+    if workers is None:
+        return list(shared().map(func, items))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,123 @@
+"""
+Mesh by mesh conversion for model formats read and written sequentially.
+
+Streaming decoder yields meshes one at a time without keeping them in scene,
+streaming encoder writes each mesh before next one is parsed.
+Peak memory is then bounded by single mesh instead of whole model.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import Optional, Self, TypeAlias, TypeVar
+
+from scfile.structures.models import ModelMesh
+from scfile.structures.models.transforms import MeshTransform
+
+from .base import IOStream
+from .content import ModelContent
+from .decoder import FileDecoder
+from .encoder import EncoderAttributes, FileEncoder
+from .options import Options
+
+
+MeshTransforms: TypeAlias = Optional[list[MeshTransform]]
+
+MeshEncoderType = TypeVar("MeshEncoderType", bound="MeshEncoder")
+
+
+class MeshEncoder(FileEncoder[ModelContent], ABC):
+    """Model encoder able to write meshes one at a time."""
+
+    mesh_transforms: MeshTransforms = None
+    """Per-mesh counterparts of :attr:`transforms`, applied incrementally on streaming."""
+
+    @abstractmethod
+    def serialize_mesh(self, mesh: ModelMesh) -> None:
+        """Write single mesh to the output stream. Called for each mesh in order."""
+        ...
+
+    def serialize(self) -> None:
+        for mesh in self.data.scene.meshes:
+            self.serialize_mesh(mesh)
+
+    def encode_meshes(
+        self,
+        meshes: Iterable[ModelMesh],
+    ) -> Self:
+        """
+        Runs encoding pipeline over meshes stream instead of ``self.data.scene``.
+
+        Each mesh is transformed and written before next one is requested.
+
+        Args:
+            meshes: Meshes in output order. ``self.data`` provides header, such as flags.
+
+        Returns:
+            Self (chaining).
+        """
+
+        self._measure("encode")
+
+        with self._stage("prelude"):
+            self.prelude()
+
+        for tr in self.mesh_transforms or []:
+            meshes = tr(meshes)
+
+        with self._stage("signature"):
+            self.add_signature()
+
+        for mesh in meshes:
+            with self._stage("serialize"):
+                self.serialize_mesh(mesh)
+
+        self._collect(bytes_written=self.size())
+        return self
+
+
+class MeshDecoder(FileDecoder[ModelContent], ABC):
+    """Model decoder able to yield meshes one at a time."""
+
+    @abstractmethod
+    def iter_meshes(
+        self,
+        attributes: EncoderAttributes = None,
+    ) -> Iterator[ModelMesh]:
+        """
+        Decode model header into ``self.data`` and return iterator of meshes in file order.
+
+        Each mesh is parsed on request and not added to scene. Skeleton and animation are not parsed.
+
+        Args:
+            attributes (optional): Model vertex attributes to parse. Others are skipped. Defaults to all.
+        """
+        ...
+
+    def stream_to(
+        self,
+        encoder: type[MeshEncoderType],
+        options: Optional[Options] = None,
+        output: Optional[IOStream] = None,
+    ) -> MeshEncoderType:
+        """
+        Convert mesh by mesh to given streaming encoder format.
+
+        Args:
+            encoder: Streaming encoder class to use for conversion.
+            options (optional): Shared handlers options.
+            output (optional): File path or binary IO stream. Defaults to in-memory buffer.
+
+        Returns:
+            Encoder instance with encoded content.
+        """
+
+        options = options or self.options
+        meshes = self.iter_meshes(attributes=encoder.attributes)
+        enc = encoder(data=self.data, options=options, output=output)
+
+        try:
+            return enc.encode_meshes(meshes)
+
+        except BaseException:
+            enc.close()
+            raise
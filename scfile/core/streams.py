@@ -0,0 +1,301 @@
+"""
+Stream adapters for sources without file-like interface.
+"""
+
+import io
+import os
+from typing import IO, Any, NamedTuple, Optional
+
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class BufferStream(io.BufferedIOBase):
+    """
+    Read-only seekable stream over any buffer-protocol object.
+
+    Wraps ``bytes``, ``bytearray``, ``memoryview``, ``mmap`` or ``ndarray`` without copying.
+    """
+
+    def __init__(self, buffer: Any):
+        """
+        Args:
+            buffer: C-contiguous object supporting buffer protocol.
+
+        Raises:
+            TypeError: If *buffer* does not support buffer protocol or is not contiguous.
+        """
+
+        self._view = memoryview(buffer).cast("B").toreadonly()
+        self._position = 0
+
+    @property
+    def view(self) -> memoryview:
+        """Read-only view of whole buffer."""
+
+        return self._view
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        # Drop buffer export, so source such as mmap can be closed
+        self._view.release()
+        super().close()
+
+    def readview(self, size: int = -1) -> memoryview:
+        """Read up to *size* bytes as view into buffer."""
+
+        self._checkClosed()
+
+        start = min(self._position, len(self._view))
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        self._position = end
+        return self._view[start:end]
+
+    def read(self, size: int | None = -1) -> bytes:
+        return self.readview(-1 if size is None else size).tobytes()
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        target = memoryview(buffer).cast("B")
+        data = self.readview(len(target))
+        target[: len(data)] = data
+        return len(data)
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        self._checkClosed()
+
+        match whence:
+            case io.SEEK_SET:
+                position = pos
+            case io.SEEK_CUR:
+                position = self._position + pos
+            case io.SEEK_END:
+                position = len(self._view) + pos
+            case _:
+                raise ValueError(f"Invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        self._checkClosed()
+        return self._position
+
+    def getvalue(self) -> bytes:
+        return self._view.tobytes()
+
+
+class ForwardStream(io.BufferedIOBase):
+    """
+    Forward-only reader over non-seekable stream, such as pipe, socket or standard input.
+
+    Forward seeks are read and discarded into reusable scratch buffer.
+    End of stream is detected by reading ahead single byte.
+    """
+
+    SCRATCH_SIZE = 64 * 1024
+
+    def __init__(self, stream: IO[bytes]):
+        """
+        Args:
+            stream: Readable binary stream.
+        """
+
+        self._stream = stream
+        self._position = 0
+        self._pending = b""
+        self._scratch: Optional[bytearray] = None
+
+    @property
+    def name(self) -> Optional[str]:
+        return getattr(self._stream, "name", None)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return False
+
+    def read(self, size: int | None = -1) -> bytes:
+        self._checkClosed()
+
+        if size == 0:
+            return b""
+
+        if size is not None and 0 < size <= len(self._pending):
+            data, self._pending = self._pending[:size], self._pending[size:]
+            self._position += size
+            return data
+
+        chunks = [self._pending]
+        self._pending = b""
+
+        if size is None or size < 0:
+            chunks.append(self._stream.read())
+
+        else:
+            # Raw streams may return fewer bytes than requested
+            remaining = size - len(chunks[0])
+            while remaining > 0:
+                chunk = self._stream.read(remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+
+        data = b"".join(chunks)
+        self._position += len(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def skip(self, size: int) -> int:
+        """Read and discard *size* bytes. Returns count of skipped bytes."""
+
+        self._checkClosed()
+
+        skipped = min(len(self._pending), size)
+        self._pending = self._pending[skipped:]
+
+        if self._scratch is None:
+            self._scratch = bytearray(self.SCRATCH_SIZE)
+
+        scratch = memoryview(self._scratch)
+        while skipped < size:
+            count = self._stream.readinto(scratch[: min(size - skipped, len(scratch))])
+            if not count:
+                break
+            skipped += count
+
+        self._position += skipped
+        return skipped
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                offset = pos - self._position
+            case io.SEEK_CUR:
+                offset = pos
+            case _:
+                raise io.UnsupportedOperation("Forward-only stream can't seek relative to end")
+
+        if offset < 0:
+            raise io.UnsupportedOperation("Forward-only stream can't seek backward")
+
+        self.skip(offset)
+        return self._position
+
+    def tell(self) -> int:
+        self._checkClosed()
+        return self._position
+
+    def peek(self, size: int = 1) -> bytes:
+        """Return up to *size* next bytes without advancing position."""
+
+        self._checkClosed()
+
+        while len(self._pending) < size:
+            chunk = self._stream.read(size - len(self._pending))
+            if not chunk:
+                break
+            self._pending += chunk
+
+        return self._pending[:size]
+
+    def at_eof(self) -> bool:
+        """Whether stream is exhausted."""
+
+        if not self._pending:
+            self._pending = self._stream.read(1)
+        return not self._pending
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stream.close()
+        super().close()
+
+
+class SourceRange(NamedTuple):
+    """Byte range of source stream, copied to output without passing through memory where possible."""
+
+    stream: IO[bytes]
+    offset: int
+    size: int
+
+    def read(self) -> bytes:
+        """Read range into memory."""
+
+        self.stream.seek(self.offset)
+        return self.stream.read(self.size)
+
+    def copy_to(self, target: IO[bytes]) -> int:
+        """
+        Copy range to current position of target stream.
+
+        Copied by kernel with ``os.copy_file_range`` where both streams are files, in chunks otherwise.
+
+        Returns:
+            Count of copied bytes. Less than size if source ends before range.
+        """
+
+        copied = 0
+        source_fd, target_fd = _fileno(self.stream), _fileno(target)
+
+        if source_fd is not None and target_fd is not None and hasattr(os, "copy_file_range"):
+            target.flush()
+            position = target.tell()
+
+            try:
+                while copied < self.size:
+                    count = os.copy_file_range(
+                        source_fd, target_fd, self.size - copied, self.offset + copied, position + copied
+                    )
+                    if not count:
+                        break
+                    copied += count
+
+            except OSError:
+                # Filesystems without support continue with chunked copy
+                pass
+
+            # Explicit offsets leave file positions unchanged
+            target.seek(position + copied)
+
+            if copied == self.size:
+                return copied
+
+        self.stream.seek(self.offset + copied)
+        read = getattr(self.stream, "readview", self.stream.read)
+
+        while copied < self.size:
+            chunk = read(min(COPY_CHUNK_SIZE, self.size - copied))
+            if not chunk:
+                break
+            target.write(chunk)
+            copied += len(chunk)
+
+        return copied
+
+
+def _fileno(stream: IO[bytes]) -> Optional[int]:
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError):
+        return None
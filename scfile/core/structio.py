@@ -40,13 +40,18 @@ class StructIO(io.IOBase):
         data = self.read(size)
         return struct.unpack(fmt, data)
 
+    def _readview(self, size: int) -> bytes | memoryview:
+        """Read *size* bytes. Subclasses may return view into source buffer instead of copy."""
+
+        return self.read(size)
+
     def _readarray(self, dtype: str, count: int, order: Optional[ByteOrder] = None):
         """Read an array of *count* elements of type *dtype*."""
 
         order = order or self.order
         datatype = np.dtype(f"{order}{dtype}")
         datasize = count * datatype.itemsize
-        return np.frombuffer(self.read(datasize), dtype=datatype, count=count)
+        return np.frombuffer(self._readview(datasize), dtype=datatype, count=count)
 
     def _readb(self, fmt: str, order: Optional[ByteOrder] = None) -> Any:
         """Read single primitive value."""
@@ -73,6 +78,11 @@ class StructIO(io.IOBase):
         data = self._pack(f"{order}{fmt}", *values)
         self.write(data)
 
+    def _writearray(self, array: np.ndarray) -> None:
+        """Write raw *array* data in its own dtype. Contiguous arrays are written without intermediate copy."""
+
+        self.write(memoryview(np.ascontiguousarray(array).reshape(-1).view(np.uint8)))
+
     def _writenull(self, size: int = 4) -> None:
         """Write *size* null bytes."""
 
@@ -141,3 +141,10 @@ class MergeInterrupted(RegionError):
 
     def __str__(self):
         return "Merge interrupted"
+
+
+class ConvertInterrupted(ScFileException):
+    """Raised when batch conversion is interrupted by user."""
+
+    def __str__(self):
+        return "Convert interrupted"
@@ -28,6 +28,7 @@ class DaeEncoder(FileEncoder[ModelContent]):
     order = ByteOrder.LITTLE
 
     transforms = [T.unique_names, T.invert_uv, T.skeleton_to_local, T.build_hierarchy]
+    attributes = frozenset({Flag.UV, Flag.NORMALS})
 
     def serialize(self):
         self.ctx["ROOT"] = Element("COLLADA", xmlns=XMLNS, version=VERSION)
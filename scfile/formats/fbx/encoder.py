@@ -18,6 +18,7 @@ class FbxEncoder(FileEncoder[ModelContent], FbxFileIO):
     order = ByteOrder.LITTLE
 
     transforms = [T.unique_names, T.flip_uv]
+    attributes = frozenset({Flag.UV, Flag.UV2, Flag.NORMALS})
 
     def serialize(self):
         self.ctx["NODES"] = []
@@ -76,4 +76,4 @@ class FbxFileIO(StructIO):
         self._writeb(F.U32, len(arr))
         self._writeb(F.U32, 0)
         self._writeb(F.U32, len(arr) * size)
-        self.write(arr.tobytes())
+        self._writearray(arr)
@@ -4,21 +4,27 @@ from typing import Any, Optional, TypeAlias
 
 import numpy as np
 
-from scfile.consts import FileSignature
+from scfile.consts import Factor, FileSignature
 from scfile.core import FileEncoder, ModelContent
 from scfile.enums import ByteOrder, F, FileFormat
-from scfile.structures.models import Flag
+from scfile.structures.models import Flag, ModelMesh
 from scfile.structures.models import transforms as T
 
-from . import base
+from . import base, quantize
 from .enums import BufferTarget, ComponentType
+from .quantize import Quantized
 
 
 VERSION = 2
 
+HEADER_SIZE = 12
+"""Magic, version and total length."""
+CHUNK_HEADER_SIZE = 8
+"""Chunk length and type."""
+
 Node: TypeAlias = dict[str, Any]
 BufferView: TypeAlias = dict[str, int]
-Accessor: TypeAlias = dict[str, str | int]
+Accessor: TypeAlias = dict[str, str | int | bool]
 
 
 class GlbEncoder(FileEncoder[ModelContent]):
@@ -29,41 +35,33 @@ class GlbEncoder(FileEncoder[ModelContent]):
     transforms = [T.unique_names, T.build_hierarchy, T.skeleton_to_local, T.animation_to_absolute]
 
     def serialize(self):
-        self._add_header()
         self._create_gltf()
-        self._add_json_chunk()
-        self._add_binary_chunk()
-        self._update_total_size()
 
-    def _add_header(self):
-        self._writeb(F.U32, VERSION)
+        # Sizes are known from buffer views, so header is written once without seeking back
+        gltf_bytes = self._gltf_bytes()
+        bin_size = self.ctx["BUFFER_VIEW_OFFSET"]
 
-        # Total Size Placeholder
-        self.ctx["TOTAL_SIZE_POS"] = self.tell()
-        self._writeb(F.U32, 0)
+        self._add_header(total_size=HEADER_SIZE + CHUNK_HEADER_SIZE * 2 + len(gltf_bytes) + bin_size)
+        self._add_json_chunk(gltf_bytes)
+        self._add_binary_chunk(bin_size)
 
-    def _update_total_size(self):
-        self.seek(self.ctx["TOTAL_SIZE_POS"])
-        self._writeb(F.U32, len(self.getvalue()))
+    def _add_header(self, total_size: int):
+        self._writeb(F.U32, VERSION)
+        self._writeb(F.U32, total_size)
 
-    def _add_json_chunk(self):
+    def _gltf_bytes(self) -> bytes:
         # Serialize gltf json
-        gltf = json.dumps(self.ctx["GLTF"])
-        gltf_bytes = gltf.encode()
-        json_length = len(gltf_bytes)
+        gltf_bytes = json.dumps(self.ctx["GLTF"]).encode()
 
-        # Validate padding length
-        padding_length = (4 - (json_length % 4)) % 4
+        # Pad with spaces to 4 bytes alignment
+        padding_length = (4 - (len(gltf_bytes) % 4)) % 4
+        return gltf_bytes + b"\x20" * padding_length
 
-        # Write json
-        self._writeb(F.U32, json_length + padding_length)
+    def _add_json_chunk(self, gltf_bytes: bytes):
+        self._writeb(F.U32, len(gltf_bytes))
         self.write(b"JSON")
         self.write(gltf_bytes)
 
-        # Add padding if necessary
-        if padding_length > 0:
-            self.write(b"\x20" * padding_length)
-
     def _create_gltf(self):
         self.ctx["GLTF"] = deepcopy(base.GLTF)
         self.ctx["BUFFER_VIEW_OFFSET"] = 0
@@ -109,50 +107,70 @@ class GlbEncoder(FileEncoder[ModelContent]):
         return len(self.ctx["GLTF"]["accessors"])
 
     def _create_meshes(self):
+        self.ctx["QUANTIZED"] = []
+
         for index, mesh in enumerate(self.data.scene.meshes):
             primitive: Node = deepcopy(base.PRIMITIVE)
             skeleton_presented = self._skeleton_presented and mesh.max_influences > 0
 
+            quantized = self._quantize(mesh, skeleton_presented)
+            self.ctx["QUANTIZED"].append(quantized)
+
             # XYZ Position
             primitive["attributes"]["POSITION"] = self._accessor_index()
-            self._create_bufferview(byte_length=len(mesh.vertices) * 3 * 4)
-            self._create_accessor(len(mesh.vertices), "VEC3", array=mesh.vertices)
+            if position := quantized.get("POSITION"):
+                self._create_quantized(position, "VEC3", ComponentType.SHORT, bounds=True)
+            else:
+                self._create_bufferview(byte_length=mesh.count_vertices * 3 * 4)
+                self._create_accessor(mesh.count_vertices, "VEC3", array=mesh.vertices)
 
             # UV Texture
             if self.data.flags[Flag.UV]:
                 primitive["attributes"]["TEXCOORD_0"] = self._accessor_index()
-                self._create_bufferview(byte_length=len(mesh.vertices) * 2 * 4)
-                self._create_accessor(len(mesh.vertices), "VEC2")
+                if uv1 := quantized.get("TEXCOORD_0"):
+                    self._create_quantized(uv1, "VEC2", ComponentType.SHORT)
+                else:
+                    self._create_bufferview(byte_length=mesh.count_vertices * 2 * 4)
+                    self._create_accessor(mesh.count_vertices, "VEC2")
 
             # UV Texture (2)
             if self.data.flags[Flag.UV2]:
                 primitive["attributes"]["TEXCOORD_1"] = self._accessor_index()
-                self._create_bufferview(byte_length=len(mesh.vertices) * 2 * 4)
-                self._create_accessor(len(mesh.vertices), "VEC2")
+                if uv2 := quantized.get("TEXCOORD_1"):
+                    self._create_quantized(uv2, "VEC2", ComponentType.SHORT)
+                else:
+                    self._create_bufferview(byte_length=mesh.count_vertices * 2 * 4)
+                    self._create_accessor(mesh.count_vertices, "VEC2")
 
             # XYZ Normals
             if self.data.flags[Flag.NORMALS]:
                 primitive["attributes"]["NORMAL"] = self._accessor_index()
-                self._create_bufferview(byte_length=len(mesh.vertices) * 3 * 4)
-                self._create_accessor(len(mesh.vertices), "VEC3")
+                if normals := quantized.get("NORMAL"):
+                    self._create_quantized(normals, "VEC3", ComponentType.BYTE)
+                else:
+                    self._create_bufferview(byte_length=mesh.count_vertices * 3 * 4)
+                    self._create_accessor(mesh.count_vertices, "VEC3")
 
             # XYZW Tangents
             if self.data.flags[Flag.TANGENTS]:
                 primitive["attributes"]["TANGENT"] = self._accessor_index()
-                self._create_bufferview(byte_length=len(mesh.vertices) * 4 * 4)
-                self._create_accessor(len(mesh.vertices), "VEC4")
+                if tangents := quantized.get("TANGENT"):
+                    self._create_quantized(tangents, "VEC4", ComponentType.BYTE)
+                else:
+                    self._create_bufferview(byte_length=mesh.count_vertices * 4 * 4)
+                    self._create_accessor(mesh.count_vertices, "VEC4")
 
             # Bone Links
             if skeleton_presented:
                 # Joint Indices
                 primitive["attributes"]["JOINTS_0"] = self._accessor_index()
-                self._create_bufferview(byte_length=len(mesh.vertices) * 4 * 1)
-                self._create_accessor(len(mesh.vertices), "VEC4", ComponentType.UBYTE)
+                self._create_bufferview(byte_length=mesh.count_vertices * 4 * 1)
+                self._create_accessor(mesh.count_vertices, "VEC4", ComponentType.UBYTE)
 
                 # Joint Weights
                 primitive["attributes"]["WEIGHTS_0"] = self._accessor_index()
-                self._create_bufferview(byte_length=len(mesh.vertices) * 4 * 4)
-                self._create_accessor(len(mesh.vertices), "VEC4", ComponentType.FLOAT)
+                self._create_bufferview(byte_length=mesh.count_vertices * 4 * 4)
+                self._create_accessor(mesh.count_vertices, "VEC4", ComponentType.FLOAT)
 
             # ABC Polygons
             primitive["indices"] = self._accessor_index()
@@ -166,11 +184,69 @@ class GlbEncoder(FileEncoder[ModelContent]):
             if skeleton_presented:
                 node["skin"] = 0
 
+            # Dequantize positions
+            if position:
+                node["scale"] = [position.scale] * 3
+
             # Add to GLTF
             self.ctx["GLTF"]["nodes"].append(node)
             self.ctx["GLTF"]["meshes"].append(dict(name=mesh.name, primitives=[primitive]))
             self.ctx["GLTF"]["materials"].append(dict(name=mesh.material, pbrMetallicRoughness=base.PBR))
 
+        if any(self.ctx["QUANTIZED"]):
+            self.ctx["GLTF"]["extensionsUsed"] = [quantize.EXTENSION]
+            self.ctx["GLTF"]["extensionsRequired"] = [quantize.EXTENSION]
+
+    def _quantize(self, mesh: ModelMesh, skeleton_presented: bool) -> dict[str, Quantized]:
+        if not self.options.quantize:
+            return {}
+
+        quantized: dict[str, Quantized] = {}
+
+        # Node transform is ignored for skinned meshes, positions stay float
+        if not skeleton_presented:
+            raw = quantize.reuse(mesh.raw("vertices"), columns=4)
+            quantized["POSITION"] = raw or quantize.positions(mesh.vertices)
+
+        if self.data.flags[Flag.UV] and (uv1 := self._quantize_uv(mesh, "uv1")):
+            quantized["TEXCOORD_0"] = uv1
+
+        if self.data.flags[Flag.UV2] and (uv2 := self._quantize_uv(mesh, "uv2")):
+            quantized["TEXCOORD_1"] = uv2
+
+        if self.data.flags[Flag.NORMALS]:
+            quantized["NORMAL"] = quantize.normalized(mesh.normals, F.I8, Factor.I8, columns=4)
+
+        if self.data.flags[Flag.TANGENTS]:
+            quantized["TANGENT"] = quantize.normalized(mesh.tangents, F.I8, Factor.I8)
+
+        return quantized
+
+    def _quantize_uv(self, mesh: ModelMesh, name: str) -> Optional[Quantized]:
+        # No textures to carry texture transform, only coordinates in normalized range
+        raw = quantize.reuse(mesh.raw(name))
+        if raw and raw.scale == 1.0:
+            return raw
+
+        uv = getattr(mesh, name)
+        return quantize.normalized(uv, F.I16, Factor.I16) if quantize.fits(uv) else None
+
+    def _create_quantized(
+        self,
+        quantized: Quantized,
+        accessor_type: str,
+        component_type: ComponentType,
+        bounds: bool = False,
+    ):
+        data = quantized.data
+        padded = data.shape[1] != quantized.columns
+
+        self._create_bufferview(byte_length=data.nbytes, stride=quantized.stride if padded else None)
+
+        # Bounds are stored as raw integers, normalization does not apply to them
+        array = data[:, : quantized.columns] if bounds else None
+        self._create_accessor(len(data), accessor_type, component_type, array=array, normalized=True)
+
     def _create_bones(self):
         self.ctx["BONE_INDEXES"] = []
         self.ctx["ROOT_INDEXES"] = []
@@ -246,6 +322,7 @@ class GlbEncoder(FileEncoder[ModelContent]):
         self,
         byte_length: int,
         target: Optional[BufferTarget] = BufferTarget.ARRAY_BUFFER,
+        stride: Optional[int] = None,
     ):
         view: BufferView = dict(
             buffer=0,
@@ -253,6 +330,9 @@ class GlbEncoder(FileEncoder[ModelContent]):
             byteOffset=self.ctx["BUFFER_VIEW_OFFSET"],
         )
 
+        if stride:
+            view["byteStride"] = stride
+
         if target:
             view["target"] = target.value
 
@@ -265,6 +345,7 @@ class GlbEncoder(FileEncoder[ModelContent]):
         accessor_type: str,
         component_type: ComponentType = ComponentType.FLOAT,
         array: Optional[np.ndarray] = None,
+        normalized: bool = False,
     ):
         buffer_view_idx = len(self.ctx["GLTF"]["bufferViews"]) - 1
         accessor: Accessor = dict(
@@ -274,77 +355,70 @@ class GlbEncoder(FileEncoder[ModelContent]):
             type=accessor_type,
         )
 
+        if normalized:
+            accessor["normalized"] = True
+
         if array is not None:
             accessor["min"] = np.min(array, axis=0).tolist()
             accessor["max"] = np.max(array, axis=0).tolist()
 
         self.ctx["GLTF"]["accessors"].append(accessor)
 
-    def _add_binary_chunk(self):
-        self._add_bin_size()
-        self.ctx["BIN_START"] = self.tell()
+    def _add_binary_chunk(self, bin_size: int):
+        self._writeb(F.U32, bin_size)
+        self.write(b"BIN\0")
 
         self._add_meshes()
 
         if self._skeleton_presented:
             bindpose = self.data.scene.skeleton.inverse_bind_matrices(transpose=True)
-            self.write(bindpose.tobytes())
+            self._writearray(bindpose)
 
         if self._animation_presented:
             self._add_animation()
 
-        self.ctx["BIN_END"] = self.tell()
-        self._update_bin_size()
-
-    def _add_bin_size(self):
-        # BIN Size Placeholder
-        self.ctx["BIN_SIZE_POS"] = self.tell()
-        self._writeb(F.U32, 0)
-        self.write(b"BIN\0")
-
-    def _update_bin_size(self):
-        size = self.ctx["BIN_END"] - self.ctx["BIN_START"]
-        self.seek(self.ctx["BIN_SIZE_POS"])
-        self._writeb(F.U32, size)
-
     def _add_meshes(self):
-        for mesh in self.data.scene.meshes:
+        for mesh, quantized in zip(self.data.scene.meshes, self.ctx["QUANTIZED"]):
             skeleton_presented = self._skeleton_presented and mesh.max_influences > 0
 
             # XYZ Position
-            self.write(mesh.vertices.tobytes())
+            self._add_attribute(quantized.get("POSITION"), mesh, "vertices")
 
             # UV Texture
             if self.data.flags[Flag.UV]:
-                self.write(mesh.uv1.tobytes())
+                self._add_attribute(quantized.get("TEXCOORD_0"), mesh, "uv1")
 
             # UV Texture (2)
             if self.data.flags[Flag.UV2]:
-                self.write(mesh.uv2.tobytes())
+                self._add_attribute(quantized.get("TEXCOORD_1"), mesh, "uv2")
 
             # XYZ Normals
             if self.data.flags[Flag.NORMALS]:
-                self.write(mesh.normals.tobytes())
+                self._add_attribute(quantized.get("NORMAL"), mesh, "normals")
 
             # XYZW Tangents
             if self.data.flags[Flag.TANGENTS]:
-                self.write(mesh.tangents.tobytes())
+                self._add_attribute(quantized.get("TANGENT"), mesh, "tangents")
 
             # Bone Links
             if skeleton_presented:
                 # Joint Indices
-                self.write(mesh.links_ids.tobytes())
+                self._writearray(mesh.links_ids)
 
                 # Joint Weights
-                self.write(mesh.links_weights.tobytes())
+                self._writearray(mesh.links_weights)
 
             # ABC Polygons
-            self.write(mesh.polygons.flatten().astype(F.U32).tobytes())
+            self._writearray(mesh.polygons.astype(F.U32, copy=False))
+
+    def _add_attribute(self, quantized: Optional[Quantized], mesh: ModelMesh, name: str):
+        # Float values are only converted when not quantized
+        self._writearray(quantized.data if quantized else getattr(mesh, name))
 
     def _add_animation(self):
         for clip in self.data.scene.animation.clips:
-            self.write(clip.times.tobytes())
+            self._writearray(clip.times)
 
             for bone in self.data.scene.skeleton.bones:
-                self.write(clip.translations[:, bone.id, :].tobytes())
-                self.write(clip.rotations[:, bone.id, :].tobytes())
+                self._writearray(clip.translations[:, bone.id, :])
+                self._writearray(clip.rotations[:, bone.id, :])
@@ -2,7 +2,9 @@ from enum import IntEnum
 
 
 class ComponentType(IntEnum):
+    BYTE = 5120
     UBYTE = 5121
+    SHORT = 5122
     FLOAT = 5126
     UINT16 = 5123
     UINT32 = 5125
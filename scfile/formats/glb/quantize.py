@@ -0,0 +1,71 @@
+"""
+Vertex attributes quantization as defined by KHR_mesh_quantization.
+
+Attributes are stored as normalized integers.
+Vertex attribute elements must be aligned to 4 bytes, so VEC3 data is padded to 4 components.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from scfile.consts import Factor
+from scfile.enums import F
+from scfile.structures.models import QuantizedAttribute
+
+
+EXTENSION = "KHR_mesh_quantization"
+
+
+class Quantized(NamedTuple):
+    data: np.ndarray
+    """Integer components, padded to aligned element size."""
+
+    columns: int
+    """Count of meaningful components per element."""
+
+    scale: float = 1.0
+    """Scale folded into node transform."""
+
+    @property
+    def stride(self) -> int:
+        return self.data.shape[1] * self.data.itemsize
+
+
+def positions(vertices: np.ndarray) -> Quantized:
+    """Quantize positions to normalized I16, scaled by largest absolute component."""
+
+    scale = float(np.abs(vertices).max()) if vertices.size else 0.0
+    scale = scale or 1.0
+
+    data, columns, _ = normalized(vertices / scale, F.I16, Factor.I16, columns=4)
+    return Quantized(data=data, columns=columns, scale=scale)
+
+
+def reuse(attribute: Optional[QuantizedAttribute], columns: int = 0) -> Optional[Quantized]:
+    """Reuse raw I16 values read from source, skipping float conversion."""
+
+    if attribute is None or attribute.finalize or attribute.factor != Factor.I16 or attribute.data.dtype != np.int16:
+        return None
+
+    units = attribute.columns or attribute.data.shape[1]
+    data = np.zeros((attribute.count, max(columns, units)), dtype=F.I16)
+    data[:, :units] = attribute.data[:, :units]
+
+    return Quantized(data=data, columns=units, scale=attribute.scale)
+
+
+def normalized(array: np.ndarray, dtype: str, factor: int, columns: int = 0) -> Quantized:
+    """Quantize values in ``[-1, 1]`` range to normalized integers."""
+
+    count, units = array.shape
+    data = np.zeros((count, max(columns, units)), dtype=dtype)
+    data[:, :units] = np.rint(np.clip(array, -1.0, 1.0) * factor)
+
+    return Quantized(data=data, columns=units)
+
+
+def fits(array: np.ndarray) -> bool:
+    """Whether values fit normalized range without transform."""
+
+    return array.size == 0 or float(np.abs(array).max()) <= 1.0
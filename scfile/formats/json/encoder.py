@@ -1,3 +1,4 @@
+import base64
 import json
 
 from scfile.core import FileEncoder, NbtContent
@@ -7,8 +8,43 @@ from scfile.enums import ByteOrder, FileFormat
 class JsonEncoder(FileEncoder[NbtContent]):
     format = FileFormat.JSON
     order = ByteOrder.LITTLE
+    incremental = True
+
+    CHUNK_SIZE = 64 * 1024
+    """Characters buffered before writing to output stream."""
 
     def serialize(self):
-        data = json.dumps(self.data.value, default=str, ensure_ascii=False, indent=2)
-        data = data.encode()
-        self.write(data)
+        compact = self.options.json_compact
+
+        encoder = json.JSONEncoder(
+            ensure_ascii=False,
+            indent=None if compact else 2,
+            separators=(",", ":") if compact else None,
+            default=self._default,
+        )
+
+        # Written in chunks, so whole document is never held as single string
+        parts: list[str] = []
+        size = 0
+
+        for part in encoder.iterencode(self.data.value):
+            parts.append(part)
+            size += len(part)
+
+            if size >= self.CHUNK_SIZE:
+                self.write("".join(parts).encode())
+                parts.clear()
+                size = 0
+
+        if parts:
+            self.write("".join(parts).encode())
+
+    def _default(self, value: object):
+        if isinstance(value, bytes):
+            match self.options.json_bytes:
+                case "base64":
+                    return base64.b64encode(value).decode("ascii")
+                case "list":
+                    return list(value)
+
+        return str(value)
@@ -0,0 +1,71 @@
+import numpy as np
+
+from .mapping import BLOCKS_MAPPING
+
+
+COLORS: dict[int, tuple[int, int, int]] = {
+    1: (125, 125, 125),  # stone
+    2: (95, 159, 53),  # grass
+    3: (134, 96, 67),  # dirt
+    4: (122, 122, 122),  # cobblestone
+    5: (157, 128, 79),  # planks
+    7: (84, 84, 84),  # bedrock
+    8: (47, 67, 244),  # water
+    9: (47, 67, 244),  # water (still)
+    10: (207, 91, 19),  # lava
+    11: (207, 91, 19),  # lava (still)
+    12: (219, 207, 163),  # sand
+    13: (136, 126, 126),  # gravel
+    17: (102, 81, 51),  # log
+    18: (60, 120, 30),  # leaves
+    20: (192, 220, 224),  # glass
+    24: (216, 203, 155),  # sandstone
+    31: (110, 160, 60),  # tall grass
+    32: (123, 79, 25),  # dead bush
+    35: (221, 221, 221),  # wool
+    37: (240, 220, 40),  # dandelion
+    38: (190, 40, 30),  # poppy
+    42: (220, 220, 220),  # iron block
+    43: (160, 160, 160),  # double stone slab
+    44: (160, 160, 160),  # stone slab
+    45: (150, 97, 83),  # bricks
+    48: (100, 120, 100),  # mossy cobblestone
+    49: (20, 18, 29),  # obsidian
+    57: (97, 219, 213),  # diamond block
+    65: (121, 95, 52),  # ladder
+    78: (240, 251, 251),  # snow layer
+    79: (160, 188, 255),  # ice
+    80: (240, 251, 251),  # snow
+    81: (13, 99, 24),  # cactus
+    82: (160, 166, 179),  # clay
+    83: (148, 192, 101),  # reeds
+    85: (157, 128, 79),  # fence
+    87: (111, 54, 52),  # netherrack
+    98: (122, 121, 122),  # stone bricks
+    101: (109, 108, 106),  # iron bars
+    106: (50, 110, 20),  # vines
+    112: (44, 21, 26),  # nether bricks
+    159: (150, 92, 66),  # terracotta
+    166: (200, 40, 40),  # barrier
+    172: (150, 92, 66),  # hardened clay
+    174: (141, 180, 250),  # packed ice
+    251: (207, 213, 214),  # concrete
+}
+"""Top-down map colors of common vanilla blocks."""
+
+UNKNOWN_COLOR = (150, 150, 150)
+
+
+def build_palette(colors: dict[int, tuple[int, int, int]]) -> np.ndarray:
+    """Color of each vanilla block ID, as ``(256, 3)`` table. Air is black."""
+
+    palette = np.array([colors.get(block, UNKNOWN_COLOR) for block in range(256)], dtype=np.uint8)
+    palette[0] = 0
+    return palette
+
+
+PALETTE = build_palette(COLORS)
+"""Colors of vanilla block IDs."""
+
+BLOCKS_COLORS = PALETTE[np.frombuffer(BLOCKS_MAPPING, dtype=np.uint8)]
+"""Colors of raw block IDs, through blocks mapping."""
@@ -1,17 +1,23 @@
 import struct
 import zlib
 
-from scfile.core import FileEncoder, RegionContent
+import numpy as np
+
+from scfile.core import FileEncoder, RegionContent, parallel
 from scfile.enums import ByteOrder, FileFormat
 from scfile.formats.nbt import nbt
 from scfile.formats.nbt.enums import Tag
 from scfile.structures.regions import RegionChunk
 
+from . import palette
 from .mapping import BLOCKS_MAPPING
 
 
 _VERSION = nbt.encode_int(b"DataVersion", 1343)  # Anvil 1.12.2
 
+_PALETTE_VERSION = nbt.encode_int(b"DataVersion", palette.DATA_VERSION)
+_STATUS = nbt.encode_string(b"Status", b"full")
+
 _CURRENT_TIME = 0
 _TIMESTAMPS = struct.pack(">I", _CURRENT_TIME) * 1024
 
@@ -46,13 +52,13 @@ class McaEncoder(FileEncoder[RegionContent]):
         payload = [locations, timestamps]
         current_sector = len(payload)
 
-        for chunk in self.data.chunks:
+        # Chunks are compressed concurrently, sectors are laid out in chunks order
+        compressed = parallel.imap(self._compress, self.data.chunks, self.options.chunk_workers)
+
+        for chunk, compressed_data in zip(self.data.chunks, compressed):
             lx, lz = chunk.index % 32, chunk.index // 32
-            cx, cz = self.data.rx * 32 + lx, self.data.rz * 32 + lz
 
             compression_type = b"\x02"
-            compressed_data = zlib.compress(self._chunk(cx, cz, chunk), level=3)
-
             data = struct.pack(">I", len(compressed_data) + len(compression_type)) + compression_type + compressed_data
 
             total_bytes = len(data)
@@ -70,6 +76,12 @@ class McaEncoder(FileEncoder[RegionContent]):
 
         self.write(b"".join(payload))
 
+    def _compress(self, chunk: RegionChunk) -> bytes:
+        lx, lz = chunk.index % 32, chunk.index // 32
+        cx, cz = self.data.rx * 32 + lx, self.data.rz * 32 + lz
+
+        return zlib.compress(self._chunk(cx, cz, chunk), level=self.options.compression_level)
+
     def _chunk(self, cx: int, cz: int, chunk: RegionChunk) -> bytes:
         blocks = chunk.blocks if self.options.raw_blocks else chunk.blocks.translate(BLOCKS_MAPPING)
         mask = chunk.header.blocks_mask
@@ -79,13 +91,20 @@ class McaEncoder(FileEncoder[RegionContent]):
         present = [y for y in range(16) if (mask >> y) & 1]
         for idx, y in enumerate(present):
             section = blocks[idx * 4096 : (idx + 1) * 4096]
-            sections.append(b"".join([_Y_HEAD, _Y_PACKED[y], _BLOCKS_HEAD, _SECTION_SIZE, section, _PAYLOAD_CHUNK]))
+
+            if not self.options.palette:
+                sections.append(b"".join([_Y_HEAD, _Y_PACKED[y], _BLOCKS_HEAD, _SECTION_SIZE, section, _PAYLOAD_CHUNK]))
+
+            # Empty sections are implied in palette format
+            elif (values := np.frombuffer(section, dtype=np.uint8)).any():
+                sections.append(palette.section(y, values))
 
         return b"".join(
             [
                 _ROOT_COMPOUND,
-                _VERSION,
+                _PALETTE_VERSION if self.options.palette else _VERSION,
                 _LEVEL_HEAD,
+                _STATUS if self.options.palette else b"",
                 _XPOS_HEAD,
                 struct.pack(">i", cx),
                 _ZPOS_HEAD,
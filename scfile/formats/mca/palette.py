@@ -0,0 +1,125 @@
+"""
+Palette-based sections of Anvil 1.16+ chunks.
+
+Each section stores palette of block names and block indices bit-packed into longs.
+Indices never span two longs.
+"""
+
+import struct
+
+import numpy as np
+
+from scfile.formats.nbt import nbt
+from scfile.formats.nbt.enums import Tag
+
+
+DATA_VERSION = 2586  # Anvil 1.16.5
+
+MIN_BITS = 4
+
+SECTION_BLOCKS = 16 * 16 * 16  # 4096
+
+# fmt: off
+NAMES: tuple[str, ...] = (
+    "air", "stone", "grass_block", "dirt", "cobblestone", "oak_planks", "oak_sapling", "bedrock", "water", "water",
+    "lava", "lava", "sand", "gravel", "gold_ore", "iron_ore", "coal_ore", "oak_log", "oak_leaves", "sponge", "glass",
+    "lapis_ore", "lapis_block", "dispenser", "sandstone", "note_block", "red_bed", "powered_rail", "detector_rail",
+    "sticky_piston", "cobweb", "grass", "dead_bush", "piston", "piston_head", "white_wool", "moving_piston",
+    "dandelion", "poppy", "brown_mushroom", "red_mushroom", "gold_block", "iron_block", "smooth_stone",
+    "smooth_stone_slab", "bricks", "tnt", "bookshelf", "mossy_cobblestone", "obsidian", "torch", "fire", "spawner",
+    "oak_stairs", "chest", "redstone_wire", "diamond_ore", "diamond_block", "crafting_table", "wheat", "farmland",
+    "furnace", "furnace", "oak_sign", "oak_door", "ladder", "rail", "cobblestone_stairs", "oak_wall_sign", "lever",
+    "stone_pressure_plate", "iron_door", "oak_pressure_plate", "redstone_ore", "redstone_ore", "redstone_torch",
+    "redstone_torch", "stone_button", "snow", "ice", "snow_block", "cactus", "clay", "sugar_cane", "jukebox",
+    "oak_fence", "carved_pumpkin", "netherrack", "soul_sand", "glowstone", "nether_portal", "jack_o_lantern", "cake",
+    "repeater", "repeater", "white_stained_glass", "oak_trapdoor", "infested_stone", "stone_bricks",
+    "brown_mushroom_block", "red_mushroom_block", "iron_bars", "glass_pane", "melon", "pumpkin_stem", "melon_stem",
+    "vine", "oak_fence_gate", "brick_stairs", "stone_brick_stairs", "mycelium", "lily_pad", "nether_bricks",
+    "nether_brick_fence", "nether_brick_stairs", "nether_wart", "enchanting_table", "brewing_stand", "cauldron",
+    "end_portal", "end_portal_frame", "end_stone", "dragon_egg", "redstone_lamp", "redstone_lamp", "oak_slab",
+    "oak_slab", "cocoa", "sandstone_stairs", "emerald_ore", "ender_chest", "tripwire_hook", "tripwire", "emerald_block",
+    "spruce_stairs", "birch_stairs", "jungle_stairs", "command_block", "beacon", "cobblestone_wall", "flower_pot",
+    "carrots", "potatoes", "oak_button", "skeleton_skull", "anvil", "trapped_chest", "light_weighted_pressure_plate",
+    "heavy_weighted_pressure_plate", "comparator", "comparator", "daylight_detector", "redstone_block",
+    "nether_quartz_ore", "hopper", "quartz_block", "quartz_stairs", "activator_rail", "dropper", "white_terracotta",
+    "white_stained_glass_pane", "acacia_leaves", "acacia_log", "acacia_stairs", "dark_oak_stairs", "slime_block",
+    "barrier", "iron_trapdoor", "prismarine", "sea_lantern", "hay_block", "white_carpet", "terracotta", "coal_block",
+    "packed_ice", "sunflower", "white_banner", "white_wall_banner", "daylight_detector", "red_sandstone",
+    "red_sandstone_stairs", "red_sandstone_slab", "red_sandstone_slab", "spruce_fence_gate", "birch_fence_gate",
+    "jungle_fence_gate", "dark_oak_fence_gate", "acacia_fence_gate", "spruce_fence", "birch_fence", "jungle_fence",
+    "dark_oak_fence", "acacia_fence", "spruce_door", "birch_door", "jungle_door", "acacia_door", "dark_oak_door",
+    "end_rod", "chorus_plant", "chorus_flower", "purpur_block", "purpur_pillar", "purpur_stairs", "purpur_slab",
+    "purpur_slab", "end_stone_bricks", "beetroots", "grass_path", "end_gateway", "repeating_command_block",
+    "chain_command_block", "frosted_ice", "magma_block", "nether_wart_block", "red_nether_bricks", "bone_block",
+    "structure_void", "observer", "white_shulker_box", "orange_shulker_box", "magenta_shulker_box",
+    "light_blue_shulker_box", "yellow_shulker_box", "lime_shulker_box", "pink_shulker_box", "gray_shulker_box",
+    "light_gray_shulker_box", "cyan_shulker_box", "purple_shulker_box", "blue_shulker_box", "brown_shulker_box",
+    "green_shulker_box", "red_shulker_box", "black_shulker_box", "white_glazed_terracotta", "orange_glazed_terracotta",
+    "magenta_glazed_terracotta", "light_blue_glazed_terracotta", "yellow_glazed_terracotta", "lime_glazed_terracotta",
+    "pink_glazed_terracotta", "gray_glazed_terracotta", "light_gray_glazed_terracotta", "cyan_glazed_terracotta",
+    "purple_glazed_terracotta", "blue_glazed_terracotta", "brown_glazed_terracotta", "green_glazed_terracotta",
+    "red_glazed_terracotta", "black_glazed_terracotta", "white_concrete", "white_concrete_powder", "air", "air",
+    "structure_block",
+)
+"""Modern block name of each legacy block ID, in default state."""
+# fmt: on
+
+# Legacy IDs sharing modern name point to first of them, so palette has no duplicates
+_CANONICAL = np.array([NAMES.index(name) for name in NAMES], dtype=np.uint8)
+
+_PALETTE_ENTRIES = [nbt.encode_string(b"Name", f"minecraft:{name}".encode()) + b"\x00" for name in NAMES]
+
+_Y_HEAD = nbt.encode(Tag.BYTE, b"Y")
+_PALETTE_HEAD = nbt.encode(Tag.LIST, b"Palette")
+
+
+def bits(count: int) -> int:
+    """Bits per block index for palette of *count* entries."""
+
+    return max(MIN_BITS, (count - 1).bit_length())
+
+
+def pack(indices: np.ndarray, size: int) -> np.ndarray:
+    """
+    Pack indices into big-endian longs, lowest bits first.
+
+    Args:
+        indices: Palette index of each block.
+        size: Bits per index.
+    """
+
+    per_long = 64 // size
+    count = -(-len(indices) // per_long)
+
+    padded = np.zeros(count * per_long, dtype=np.uint64)
+    padded[: len(indices)] = indices
+
+    shifts = np.arange(per_long, dtype=np.uint64) * np.uint64(size)
+    longs = np.bitwise_or.reduce(padded.reshape(count, per_long) << shifts, axis=1)
+
+    return longs.astype(">u8")
+
+
+def section(y: int, blocks: np.ndarray) -> bytes:
+    """
+    Encode section compound payload, without tag header.
+
+    Args:
+        y: Section Y index.
+        blocks: Legacy block IDs of section, in ``y, z, x`` order.
+    """
+
+    palette, indices = np.unique(_CANONICAL[blocks], return_inverse=True)
+    longs = pack(indices.reshape(-1), bits(len(palette)))
+
+    return b"".join(
+        [
+            _Y_HEAD,
+            struct.pack(">b", y),
+            _PALETTE_HEAD,
+            struct.pack(">bi", Tag.COMPOUND, len(palette)),
+            b"".join(_PALETTE_ENTRIES[block] for block in palette.tolist()),
+            nbt.encode_la(b"BlockStates", longs.tobytes()),
+            b"\x00",
+        ]
+    )
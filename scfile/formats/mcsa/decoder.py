@@ -1,17 +1,23 @@
 from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 
+import numpy as np
+
 from scfile import formats
 from scfile.consts import Factor, FileSignature, ModelDefaults
-from scfile.core import FileDecoder, ModelContent
+from scfile.core import ModelContent
+from scfile.core.encoder import EncoderAttributes
+from scfile.core.streaming import MeshDecoder
 from scfile.enums import ByteOrder, F, FileFormat
 from scfile.enums import SafetyLimit as Limit
+from scfile.exceptions import InvalidStructureError
 from scfile.structures import models as S
 from scfile.structures.models import Flag
 
 from .consts import McsaUnits
 from .exceptions import McsaVersionUnsupported
-from .io import McsaFileIO
+from .io import McsaBlockIO, McsaFileIO, polygons_format
 from .versions import SUPPORTED_VERSIONS, VERSION_MAP
 
 
@@ -24,7 +30,7 @@ class MeshCounts:
     blend_shapes: int = 0
 
 
-class McsaDecoder(FileDecoder[ModelContent], McsaFileIO):
+class McsaDecoder(MeshDecoder, McsaFileIO):
     format = FileFormat.MCSA
     signature = FileSignature.MCSA
     order = ByteOrder.LITTLE
@@ -90,9 +96,32 @@ class McsaDecoder(FileDecoder[ModelContent], McsaFileIO):
         self.ctx["COUNT_MESHES"] = self._readcount(F.I32, Limit.MESHES)
 
         for _ in range(self.ctx["COUNT_MESHES"]):
-            self._parse_mesh()
+            self.data.scene.meshes.append(self._parse_mesh())
+
+    def iter_meshes(self, attributes: EncoderAttributes = None) -> Iterator[S.ModelMesh]:
+        self.data = self._content()
+        self.attributes = attributes
+        self._measure("decode")
+
+        with self._stage("prelude"):
+            self.prelude()
+        with self._stage("signature"):
+            self.validate_signature()
+        with self._stage("parse"):
+            self._parse_header()
+            self.ctx["COUNT_MESHES"] = self._readcount(F.I32, Limit.MESHES)
+
+        return self._yield_meshes()
+
+    def _yield_meshes(self) -> Iterator[S.ModelMesh]:
+        for _ in range(self.ctx["COUNT_MESHES"]):
+            with self._stage("parse"):
+                mesh = self._parse_mesh()
+            yield mesh
+
+        self._collect(bytes_read=self.tell())
 
-    def _parse_mesh(self):
+    def _parse_mesh(self) -> S.ModelMesh:
         mesh = S.ModelMesh()
 
         # Name & Material
@@ -107,8 +136,8 @@ class McsaDecoder(FileDecoder[ModelContent], McsaFileIO):
             counts.local_bones = self._readb(F.U8)
 
             # Local bones mapping
-            for index in range(counts.local_bones):
-                mesh.bones[S.LocalBoneId(index)] = S.SkeletonBoneId(self._readb(F.U8))
+            mapping = self._readarray(F.U8, counts.local_bones).tolist()
+            mesh.bones = {S.LocalBoneId(index): S.SkeletonBoneId(bone) for index, bone in enumerate(mapping)}
 
         # Geometry counts
         counts.vertices = self._readcount(F.U32, Limit.VERTICES)
@@ -138,42 +167,45 @@ class McsaDecoder(FileDecoder[ModelContent], McsaFileIO):
         if self.data.version >= 11.0:
             mesh.bounds.radius = self._readb(F.F32)
 
+        # Vertices and polygons data, read at once
+        block = self._readblock(self._blocksize(counts, mesh.quads, blend_shapes))
+
         # Vertices geometric
-        self._parse_positions(mesh, counts.vertices)
+        self._parse_positions(block, mesh, counts.vertices)
 
         # Texture coordinates (atlas)
         if self.data.flags[Flag.UV]:
-            self._parse_uv1(mesh, counts.vertices)
+            self._parse_uv1(block, mesh, counts.vertices)
 
         # Texture coordinates (AO)
         if self.data.flags[Flag.UV2]:
-            self._parse_uv2(mesh, counts.vertices)
+            self._parse_uv2(block, mesh, counts.vertices)
 
         # Vertices normals
         if self.data.flags[Flag.NORMALS]:
-            mesh.normals = self._readnormals(counts.vertices)
+            self._parse_normals(block, mesh, counts.vertices)
 
         # ? Not parsed
         # Vertices tangents
         if self.data.flags[Flag.TANGENTS]:
-            mesh.tangents = self._readtangents(counts.vertices)
+            self._parse_tangents(block, mesh, counts.vertices)
 
         # ? Not parsed
         # Vertices rgba colors
         if self.data.flags[Flag.COLORS]:
-            self.skip(counts.vertices * 4)
+            block.skip(counts.vertices * 4)
 
         # Vertices bones links
         if self.data.flags[Flag.SKELETON]:
-            self._parse_links(mesh, counts.vertices, counts.max_influences)
+            self._parse_links(block, mesh, counts.vertices, counts.max_influences)
 
         # ? Not parsed
         # Blend Shape Mapping
         if self.data.version >= 15.0 and blend_shapes:
-            self.skip(counts.vertices * 2)
+            block.skip(counts.vertices * 2)
 
         # Polygon faces
-        mesh.polygons = self._readpolygons(counts.polygons, mesh.quads)
+        mesh.polygons = block._readpolygons(counts.polygons, mesh.quads)
 
         # ? Not parsed
         # Blend Shape Data
@@ -184,59 +216,121 @@ class McsaDecoder(FileDecoder[ModelContent], McsaFileIO):
             [self._readutf8() for _ in range(active_shape_count)]
             self.skip(active_shape_count * base_vertex_count * 4)
 
-        self.data.scene.meshes.append(mesh)
+        return mesh
+
+    def _readblock(self, size: int) -> McsaBlockIO:
+        position = self.tell()
+
+        # Copied once per block, deferred arrays must not pin buffer sources such as mmap
+        data = self.read(size)
+
+        if len(data) < size:
+            raise InvalidStructureError(self.location, position=position)
+
+        return McsaBlockIO(data)
+
+    def _blocksize(self, counts: MeshCounts, quads: bool, blend_shapes: bool) -> int:
+        flags = self.data.flags
+
+        # Vertex attributes sizes in bytes
+        vertex = McsaUnits.POSITIONS * 2
+        vertex += McsaUnits.TEXTURES * 2 * (flags[Flag.UV] + flags[Flag.UV2])
+        vertex += McsaUnits.NORMALS * flags[Flag.NORMALS]
+        vertex += McsaUnits.TANGENTS * flags[Flag.TANGENTS]
+        vertex += 4 * flags[Flag.COLORS]
 
-    def _parse_positions(self, mesh: S.ModelMesh, count: int):
-        mesh.vertices = self._readvertex(
+        if flags[Flag.SKELETON]:
+            match counts.max_influences:
+                case 1 | 2:
+                    vertex += McsaUnits.LINKS
+                case 3 | 4:
+                    vertex += McsaUnits.LINKS * 2
+
+        if self.data.version >= 15.0 and blend_shapes:
+            vertex += 2
+
+        units = McsaUnits.QUADS if quads else McsaUnits.TRIANGLES
+        itemsize = np.dtype(polygons_format(counts.polygons, quads)).itemsize
+
+        return counts.vertices * vertex + counts.polygons * units * itemsize
+
+    def _parse_positions(self, block: McsaBlockIO, mesh: S.ModelMesh, count: int):
+        positions = block._readquantized(
             fmt=F.I16,
             factor=Factor.I16,
             units=McsaUnits.POSITIONS,
             scale=self.data.scene.scale.position,
             count=count,
-        )[:, :3]
+            columns=3,
+        )
+        mesh.defer("vertices", positions)
+
+    def _parse_uv1(self, block: McsaBlockIO, mesh: S.ModelMesh, count: int):
+        if not self._requested(Flag.UV):
+            block.skip(count * McsaUnits.TEXTURES * 2)
+            return
 
-    def _parse_uv1(self, mesh: S.ModelMesh, count: int):
-        mesh.uv1 = self._readvertex(
+        textures = block._readquantized(
             fmt=F.I16,
             factor=Factor.I16,
             units=McsaUnits.TEXTURES,
             scale=self.data.scene.scale.uv,
             count=count,
         )
+        mesh.defer("uv1", textures)
 
-    def _parse_uv2(self, mesh: S.ModelMesh, count: int):
-        mesh.uv2 = self._readvertex(
+    def _parse_uv2(self, block: McsaBlockIO, mesh: S.ModelMesh, count: int):
+        if not self._requested(Flag.UV2):
+            block.skip(count * McsaUnits.TEXTURES * 2)
+            return
+
+        textures = block._readquantized(
             fmt=F.I16,
             factor=Factor.I16,
             units=McsaUnits.TEXTURES,
             scale=self.data.scene.scale.uv2,
             count=count,
         )
+        mesh.defer("uv2", textures)
+
+    def _parse_normals(self, block: McsaBlockIO, mesh: S.ModelMesh, count: int):
+        if self._requested(Flag.NORMALS):
+            mesh.defer("normals", block._readnormals(count))
+
+        else:
+            block.skip(count * McsaUnits.NORMALS)
+
+    def _parse_tangents(self, block: McsaBlockIO, mesh: S.ModelMesh, count: int):
+        if self._requested(Flag.TANGENTS):
+            mesh.defer("tangents", block._readtangents(count))
+
+        else:
+            block.skip(count * McsaUnits.TANGENTS)
 
-    def _parse_links(self, mesh: S.ModelMesh, count: int, max_influences: int):
+    def _parse_links(self, block: McsaBlockIO, mesh: S.ModelMesh, count: int, max_influences: int):
         match max_influences:
             case 1 | 2:
-                self._parse_packed_links(mesh, count)
+                self._parse_packed_links(block, mesh, count)
             case 3 | 4:
-                self._parse_plain_links(mesh, count)
+                self._parse_plain_links(block, mesh, count)
             case _:
                 return
 
-    def _parse_packed_links(self, mesh: S.ModelMesh, count: int):
+    def _parse_packed_links(self, block: McsaBlockIO, mesh: S.ModelMesh, count: int):
         if self.options.skeleton:
-            links = self._readpackedlinks(count, mesh.bones)
+            links = block._readpackedlinks(count, mesh.bones)
             mesh.links_ids, mesh.links_weights = links
 
         else:
-            self.skip(count * 4)
+            block.skip(count * 4)
 
-    def _parse_plain_links(self, mesh: S.ModelMesh, count: int):
+    def _parse_plain_links(self, block: McsaBlockIO, mesh: S.ModelMesh, count: int):
         if self.options.skeleton:
-            links = self._readplainlinks(count, mesh.bones)
+            links = block._readplainlinks(count, mesh.bones)
             mesh.links_ids, mesh.links_weights = links
 
         else:
-            self.skip(count * 8)
+            block.skip(count * 8)
 
     def _parse_skeleton(self):
         self.ctx["COUNT_BONES"] = self._readb(F.U8)
@@ -2,61 +2,60 @@
 Extensions for MCSA file format with custom struct-based I/O methods.
 """
 
+from collections.abc import Callable
+from typing import Optional
+
 import numpy as np
 
 from scfile.consts import Factor
 from scfile.core import StructIO
-from scfile.enums import F
+from scfile.enums import ByteOrder, F
 from scfile.structures import models as S
 
 from .consts import McsaUnits
 
 
 class McsaFileIO(StructIO):
-    def _readvertex(self, fmt: str, factor: float, units: int, count: int, scale: float = 1.0):
+    def _readquantized(
+        self,
+        fmt: str,
+        factor: float,
+        units: int,
+        count: int,
+        scale: float = 1.0,
+        columns: Optional[int] = None,
+        finalize: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    ) -> S.QuantizedAttribute:
         # Read array
         data = self._readarray(fmt, count * units)
 
-        # Scale values to floats
-        data = data.astype(F.F32) * np.float32(scale / factor)
-
         # Reshape to vertex[attribute[units]]
-        # attribute = position[3] / normal[3] / uv[2]
-        return data.reshape(-1, units)
+        # attribute = position[4] / normal[4] / uv[2]
+        # Values are scaled to floats on first access
+        return S.QuantizedAttribute(data.reshape(-1, units), scale, factor, columns, finalize)
 
-    def _readnormals(self, count: int):
-        normals = self._readvertex(
+    def _readnormals(self, count: int) -> S.QuantizedAttribute:
+        return self._readquantized(
             fmt=F.I8,
             factor=Factor.I8,
             units=McsaUnits.NORMALS,
             count=count,
-        )[:, :3]
-        norm = np.linalg.norm(normals, axis=1, keepdims=True)
-        return np.divide(normals, norm, out=np.zeros_like(normals), where=norm != 0)
+            columns=3,
+            finalize=_normals,
+        )
 
-    def _readtangents(self, count: int):
-        tangents = self._readvertex(
+    def _readtangents(self, count: int) -> S.QuantizedAttribute:
+        return self._readquantized(
             fmt=F.I8,
             factor=Factor.I8,
             units=McsaUnits.TANGENTS,
             count=count,
+            finalize=_tangents,
         )
 
-        xyz = tangents[:, :3]
-        norm = np.linalg.norm(xyz, axis=1, keepdims=True)
-        tangents[:, :3] = np.divide(xyz, norm, out=np.zeros_like(xyz), where=norm != 0)
-
-        w = tangents[:, 3]
-        tangents[:, 3] = np.where(w >= 0, 1.0, -1.0)
-
-        return tangents
-
     def _readpolygons(self, count: int, quads: bool = False):
         units = McsaUnits.QUADS if quads else McsaUnits.TRIANGLES
-
-        # ? Validate that indexes fits into U16 range, otherwise use U32.
-        indexes = count * units
-        fmt = F.U16 if indexes <= Factor.U16 else F.U32
+        fmt = polygons_format(count, quads)
 
         # Read array
         data = self._readarray(fmt, count * units)
@@ -124,6 +123,60 @@ class McsaFileIO(StructIO):
         return _links(ids, weights, bones)
 
 
+class McsaBlockIO(McsaFileIO):
+    """
+    In-memory block of MCSA data.
+
+    Whole block is read from source stream at once,
+    arrays are parsed as views at offsets of single buffer.
+    """
+
+    def __init__(self, data: bytes | memoryview):
+        self._view = memoryview(data)
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size < 0 else self._position + size
+        data = self._view[self._position : end].tobytes()
+        self._position += len(data)
+        return data
+
+    def skip(self, size: int):
+        self._position += size
+
+    def tell(self) -> int:
+        return self._position
+
+    def _readarray(self, dtype: str, count: int, order: Optional[ByteOrder] = None):
+        order = order or self.order
+        datatype = np.dtype(f"{order}{dtype}")
+        array = np.frombuffer(self._view, dtype=datatype, count=count, offset=self._position)
+        self._position += array.nbytes
+        return array
+
+
+def polygons_format(count: int, quads: bool = False) -> str:
+    # ? Validate that indexes fits into U16 range, otherwise use U32.
+    indexes = count * (McsaUnits.QUADS if quads else McsaUnits.TRIANGLES)
+    return F.U16 if indexes <= Factor.U16 else F.U32
+
+
+def _normals(normals: np.ndarray) -> S.Vector3D:
+    norm = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, norm, out=np.zeros_like(normals), where=norm != 0)
+
+
+def _tangents(tangents: np.ndarray) -> S.Vector4D:
+    xyz = tangents[:, :3]
+    norm = np.linalg.norm(xyz, axis=1, keepdims=True)
+    tangents[:, :3] = np.divide(xyz, norm, out=np.zeros_like(xyz), where=norm != 0)
+
+    w = tangents[:, 3]
+    tangents[:, 3] = np.where(w >= 0, 1.0, -1.0)
+
+    return tangents
+
+
 def _padded(arr: np.ndarray) -> np.ndarray:
     width = ((0, 0), (0, max(0, 4 - arr.shape[-1])))
     return np.pad(arr, width, mode="constant")
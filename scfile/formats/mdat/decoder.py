@@ -1,7 +1,9 @@
+import threading
+
 import zstandard as zstd
 
 from scfile import formats
-from scfile.core import FileDecoder, RegionContent
+from scfile.core import FileDecoder, RegionContent, parallel
 from scfile.enums import ByteOrder, F, FileFormat
 from scfile.structures import regions as S
 
@@ -9,6 +11,10 @@ from scfile.structures import regions as S
 CHUNKS_COUNT = 32 * 32  # 1024
 SECTION_SIZE = 16 * 16 * 16  # 4096
 NIBBLE_SIZE = 16 * 16 * 8  # 2048
+HEADER_SIZE = 5 * 4  # 20
+
+PARALLEL_MIN_SIZE = 64 * 1024
+"""Compressed chunks size from which chunks are decompressed in parallel by default."""
 
 
 class MdatDecoder(FileDecoder[RegionContent]):
@@ -17,6 +23,8 @@ class MdatDecoder(FileDecoder[RegionContent]):
 
     _content = RegionContent
 
+    _local = threading.local()
+
     def as_mca(self):
         return self.convert_to(formats.mca.McaEncoder)
 
@@ -24,8 +32,8 @@ class MdatDecoder(FileDecoder[RegionContent]):
         table = [(self._readb(F.I32), self._readb(F.I32), self.read(16)) for _ in range(CHUNKS_COUNT)]
         offsets, counts, uuids = map(list, zip(*table))
 
-        dctx = zstd.ZstdDecompressor()
-        chunks: list[S.RegionChunk] = []
+        # Payloads are read sequentially, then decompressed concurrently
+        payloads: list[tuple[int, S.ChunkHeader, bytes]] = []
 
         for index in range(CHUNKS_COUNT):
             offset = offsets[index]
@@ -34,34 +42,51 @@ class MdatDecoder(FileDecoder[RegionContent]):
 
             self.seek(offset * SECTION_SIZE)
 
-            # header
-            full_size, blocks_mask, add_mask, fixed_size, compressed_size = self._readarray(F.U32, 5).tolist()
+            header = S.ChunkHeader(*self._readarray(F.U32, 5).tolist())
+            payloads.append((index, header, self.read(header.compressed_size)))
 
-            # read raw data
-            compressed = self.read(compressed_size)
-            decompressed = dctx.decompress(compressed)
+        workers = self.options.chunk_workers
+        if workers is None and sum(header.compressed_size for _, header, _ in payloads) < PARALLEL_MIN_SIZE:
+            workers = 0
 
-            # split data
-            pos = 0
-            sections_count = bin(blocks_mask).count("1")
-            blocks = decompressed[pos : (pos := pos + sections_count * SECTION_SIZE)]
+        self.data.offsets = offsets
+        self.data.counts = counts
+        self.data.uuid = uuids
+        self.data.chunks = parallel.imap(self._parse_chunk, payloads, workers)
 
-            chunk = S.RegionChunk(
-                index=index,
-                header=S.ChunkHeader(full_size, blocks_mask, add_mask, fixed_size, compressed_size),
-                blocks=blocks,
-            )
+    def _parse_chunk(self, payload: tuple[int, S.ChunkHeader, bytes]) -> S.RegionChunk:
+        index, header, compressed = payload
 
-            if self.options.full_chunk:
-                add_count = bin(add_mask).count("1")
-                chunk.meta = decompressed[pos : (pos := pos + sections_count * NIBBLE_SIZE)]
-                chunk.light = decompressed[pos : (pos := pos + sections_count * NIBBLE_SIZE * 3)]
-                chunk.add = decompressed[pos : (pos := pos + add_count * NIBBLE_SIZE)]
-                chunk.extra = decompressed[pos:]
+        sections_count = bin(header.blocks_mask).count("1")
+        blocks_size = sections_count * SECTION_SIZE
 
-            chunks.append(chunk)
+        # Blocks come first, so the rest of frame is not decompressed unless requested
+        size = max(header.full_size - HEADER_SIZE, blocks_size) if self.options.full_chunk else blocks_size
+        decompressed = self._decompress(compressed, size)
 
-        self.data.offsets = offsets
-        self.data.counts = counts
-        self.data.uuid = uuids
-        self.data.chunks = chunks
+        pos = 0
+        chunk = S.RegionChunk(
+            index=index,
+            header=header,
+            blocks=decompressed[pos : (pos := pos + blocks_size)],
+        )
+
+        if self.options.full_chunk:
+            add_count = bin(header.add_mask).count("1")
+            chunk.meta = decompressed[pos : (pos := pos + sections_count * NIBBLE_SIZE)]
+            chunk.light = decompressed[pos : (pos := pos + sections_count * NIBBLE_SIZE * 3)]
+            chunk.add = decompressed[pos : (pos := pos + add_count * NIBBLE_SIZE)]
+            chunk.extra = decompressed[pos:]
+
+        return chunk
+
+    def _decompress(self, compressed: bytes, size: int) -> bytes:
+        """Decompress up to *size* bytes of frame."""
+
+        # Decompression contexts are not thread-safe, so each thread keeps own
+        dctx = getattr(self._local, "dctx", None)
+        if dctx is None:
+            dctx = self._local.dctx = zstd.ZstdDecompressor()
+
+        with dctx.stream_reader(compressed) as reader:
+            return reader.read(size)
@@ -1,6 +1,6 @@
 from scfile import formats
 from scfile.consts import FileSignature
-from scfile.core import FileDecoder, ImageContent
+from scfile.core import FileDecoder, ImageContent, SourceRange
 from scfile.enums import ByteOrder, FileFormat
 
 
@@ -15,4 +15,9 @@ class MicDecoder(FileDecoder[ImageContent]):
         return self.convert_to(formats.png.PngEncoder)
 
     def parse(self):
-        self.data.image = self.read()
+        if self.passthrough:
+            offset = self.tell()
+            self.data.image = SourceRange(self._stream, offset, self.size() - offset)
+
+        else:
+            self.data.image = self.read()
@@ -3,6 +3,7 @@ import numpy as np
 from scfile.consts import FileSignature, ModelDefaults
 from scfile.core import FileEncoder, ModelContent
 from scfile.enums import ByteOrder, F, FileFormat
+from scfile.structures.models import Flag
 from scfile.structures.models import transforms as T
 
 from .io import Ms3dFileIO
@@ -36,6 +37,13 @@ TRIANGLE_DTYPE = np.dtype(
     ]
 )
 
+LINKS_DTYPE = np.dtype(
+    [
+        ("ids", "i1", 3),
+        ("weights", "u1", 3),
+    ]
+)
+
 
 class Ms3dEncoder(FileEncoder[ModelContent], Ms3dFileIO):
     format = FileFormat.MS3D
@@ -43,6 +51,7 @@ class Ms3dEncoder(FileEncoder[ModelContent], Ms3dFileIO):
     order = ByteOrder.LITTLE
 
     transforms = [T.unique_names, T.skeleton_to_local]
+    attributes = frozenset({Flag.UV, Flag.NORMALS})
 
     def serialize(self):
         self._writeb(F.I32, VERSION)
@@ -60,13 +69,14 @@ class Ms3dEncoder(FileEncoder[ModelContent], Ms3dFileIO):
 
         reference_count = 0xFF  # ? necessary only for optimization, calculation too expensive
 
+        # Written per mesh from its own arrays, so scene is never copied into whole buffers
         for mesh in self.data.scene.meshes:
             vertices = np.empty(len(mesh.vertices), dtype=VERTEX_DTYPE)
             vertices["flags"] = 0
             vertices["position"] = mesh.vertices
             vertices["bone_id"] = mesh.links_ids[:, 0] if self._skeleton_presented else ModelDefaults.ROOT_BONE_ID
             vertices["reference_count"] = reference_count
-            self.write(vertices.tobytes())
+            self._writearray(vertices)
 
     def _add_triangles(self):
         # polygons count
@@ -84,7 +94,7 @@ class Ms3dEncoder(FileEncoder[ModelContent], Ms3dFileIO):
             triangles["v"] = uv[:, :, 1]
             triangles["smoothing_group"] = 1
             triangles["group_index"] = index
-            self.write(triangles.tobytes())
+            self._writearray(triangles)
 
             offset += len(mesh.vertices)
 
@@ -99,7 +109,7 @@ class Ms3dEncoder(FileEncoder[ModelContent], Ms3dFileIO):
             count = len(mesh.polygons)
             self._writeb(F.U16, count)  # triangles count
             indices = np.arange(offset, offset + count, dtype="<u2")
-            self.write(indices.tobytes())
+            self._writearray(indices)
             self._writeb(F.I8, index)  # material index
 
             offset += count
@@ -150,11 +160,8 @@ class Ms3dEncoder(FileEncoder[ModelContent], Ms3dFileIO):
         self._writeb(F.I32, VERTEX_EXTRA_VERSION)  # vertex extra version
 
         # i8 ids[3], u8 weights[3]
-        fmt = f"{F.I8 * 3}{F.U8 * 3}"
-
         for mesh in self.data.scene.meshes:
-            links_ids = mesh.links_ids.astype(F.I8)
-            links_weights = (mesh.links_weights * 255).astype(F.U8)
-
-            for ids, weights in zip(links_ids, links_weights):
-                self._writeb(fmt, *ids[:3], *weights[:3])
+            links = np.empty(len(mesh.links_ids), dtype=LINKS_DTYPE)
+            links["ids"] = mesh.links_ids[:, :3].astype(F.I8)
+            links["weights"] = (mesh.links_weights[:, :3] * 255).astype(F.U8)
+            self._writearray(links)
@@ -12,6 +12,9 @@ Example::
 
     with formats.nbt.NbtDecoder("itemnames.dat") as nbt:
         data = nbt.decode()
+
+    with formats.nbt.NbtDecoder("itemnames.dat") as nbt:
+        values = nbt.select("items[0].name", "version")
 """
 
 from .decoder import NbtDecoder
@@ -1,13 +1,23 @@
 import gzip
+import io
+from collections.abc import Iterator
+from typing import IO, cast
 
 import zstandard as zstd
 
 from scfile import formats
 from scfile.core import FileDecoder, NbtContent
+from scfile.core.content import NbtValue
+from scfile.core.streams import BufferStream, ForwardStream
 from scfile.enums import ByteOrder, FileFormat
 
+from . import query
 from .enums import Tag
-from .io import NbtBufferIO
+from .io import NbtStreamIO
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
 
 
 class NbtDecoder(FileDecoder[NbtContent]):
@@ -16,34 +26,99 @@ class NbtDecoder(FileDecoder[NbtContent]):
 
     _content = NbtContent
 
+    BUFFER_SIZE = 64 * 1024
+    """Decompressed bytes buffered ahead of parser."""
+
     def as_json(self):
         return self.convert_to(formats.json.JsonEncoder)
 
     def parse(self):
-        data = self._decompress()
-        stream = NbtBufferIO(data)
-
-        # Read root tag
-        tag = stream._read_tag()
+        stream, tag = self._root()
         if tag == Tag.END:
             return
 
-        _ = stream._readutf8()  # Skip name
         self.data.value = stream._parse_tag(tag)
 
-    def _decompress(self):
-        data = self.read()
+    def select(self, *paths: str) -> dict[str, NbtValue]:
+        """
+        Parse only values at given paths, such as ``"a.b[3].c"``. Other subtrees are skipped unparsed.
+
+        Args:
+            paths: Paths from root compound. Keys are separated by dots, list indices are in brackets.
+
+        Returns:
+            Values by requested path. Missing paths are omitted.
+
+        Raises:
+            ValueError: Path has invalid syntax.
+        """
+
+        keys = {path: query.parse(path) for path in paths}
+        found = {}
+
+        stream, tag = self._root()
+        if tag != Tag.END:
+            stream._select(tag, query.build(list(keys.values())), (), found)
+
+        self._rewind()
+        return {path: found[key] for path, key in keys.items() if key in found}
+
+    def events(self) -> Iterator[tuple[str, NbtValue]]:
+        """
+        Stream leaf values in file order, without building tree.
+
+        Yields:
+            Path and value of each scalar, string and array tag.
+        """
+
+        stream, tag = self._root()
+        if tag != Tag.END:
+            for path, value in stream._events(tag, ()):
+                yield query.format(path), value
+
+        self._rewind()
+
+    def _root(self) -> tuple[NbtStreamIO, Tag]:
+        if not self.forward:
+            self.seek(0)
+
+        stream = NbtStreamIO(self._decompress())
+
+        # Read root tag
+        tag = stream._read_tag()
+        if tag != Tag.END:
+            _ = stream._readutf8()  # Skip name
+
+        return stream, tag
+
+    def _rewind(self) -> None:
+        # Keep source reusable, like after decode
+        if not self.forward:
+            self.seek(0)
+
+    def _decompress(self) -> IO[bytes]:
+        source = cast(IO[bytes], self._stream)
+        magic = self._peek(len(ZSTD_MAGIC))
+
+        # Gzip is standard nbt compression
+        if magic.startswith(GZIP_MAGIC):
+            return io.BufferedReader(gzip.GzipFile(fileobj=source, mode="rb"), self.BUFFER_SIZE)
+
+        # Some synced configs use zstd, possibly written as multiple frames
+        if magic == ZSTD_MAGIC:
+            reader = zstd.ZstdDecompressor().stream_reader(source, closefd=False, read_across_frames=True)
+            return io.BufferedReader(reader, self.BUFFER_SIZE)
 
-        try:
-            # Gzip is standard nbt compression
-            data = gzip.decompress(data)
+        # Otherwise first byte is root tag. In-memory source is already whole, so copied into faster buffer
+        if isinstance(source, BufferStream):
+            return io.BytesIO(source.read())
 
-        except Exception:
-            try:
-                # Some synced configs use zstd
-                data = zstd.decompress(data)
+        return source
 
-            except Exception:
-                pass
+    def _peek(self, size: int) -> bytes:
+        if isinstance(self._stream, ForwardStream):
+            return self._stream.peek(size)
 
+        data = self.read(size)
+        self.seek(-len(data), io.SEEK_CUR)
         return data
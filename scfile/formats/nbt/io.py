@@ -1,11 +1,13 @@
-from io import BytesIO
-from typing import Callable, ClassVar, Self
+from collections.abc import Iterator
+from io import SEEK_CUR, BytesIO
+from typing import IO, Callable, ClassVar, Self
 
 from scfile.core import StructIO
 from scfile.core.content import NbtValue
 from scfile.enums import ByteOrder, F
 
 from .enums import Tag
+from .query import SELECTED, NbtPath, Query
 
 
 class NbtIO(StructIO):
@@ -27,6 +29,22 @@ class NbtIO(StructIO):
         Tag.LONG_ARRAY: lambda s: s._read_long_array(),
     }
 
+    _SIZES: ClassVar[dict[Tag, int]] = {
+        Tag.END: 0,
+        Tag.BYTE: 1,
+        Tag.SHORT: 2,
+        Tag.INT: 4,
+        Tag.LONG: 8,
+        Tag.FLOAT: 4,
+        Tag.DOUBLE: 8,
+    }
+
+    _ITEM_SIZES: ClassVar[dict[Tag, int]] = {
+        Tag.BYTE_ARRAY: 1,
+        Tag.INT_ARRAY: 4,
+        Tag.LONG_ARRAY: 8,
+    }
+
     def _parse_tag(self, tag: Tag) -> NbtValue:
         return self._HANDLERS[tag](self)
 
@@ -60,5 +78,119 @@ class NbtIO(StructIO):
             data[key] = self._parse_tag(tag)
         return data
 
+    def skip(self, size: int) -> None:
+        self.seek(size, SEEK_CUR)
+
+    def _skip_tag(self, tag: Tag) -> None:
+        """Skip tag payload without parsing, using length prefixes."""
+
+        if tag in self._SIZES:
+            self.skip(self._SIZES[tag])
+
+        elif tag in self._ITEM_SIZES:
+            length = self._readb(F.I32)
+            self.skip(length * self._ITEM_SIZES[tag])
+
+        elif tag == Tag.STRING:
+            self.skip(self._readb(F.U16))
+
+        elif tag == Tag.LIST:
+            item = self._read_tag()
+            length = self._readb(F.I32)
+
+            if item in self._SIZES:
+                self.skip(length * self._SIZES[item])
+            else:
+                for _ in range(length):
+                    self._skip_tag(item)
+
+        elif tag == Tag.COMPOUND:
+            while (item := self._read_tag()) != Tag.END:
+                self.skip(self._readb(F.U16))
+                self._skip_tag(item)
+
+    def _select(self, tag: Tag, query: Query, path: NbtPath, found: dict[NbtPath, NbtValue]) -> None:
+        """Parse only values requested by query into *found*, skipping other subtrees."""
+
+        if SELECTED in query:
+            value = self._parse_tag(tag)
+            found[path] = value
+            _resolve(value, query, path, found)
+
+        elif tag == Tag.COMPOUND:
+            while (item := self._read_tag()) != Tag.END:
+                key = self._readutf8()
+                if key in query:
+                    self._select(item, query[key], (*path, key), found)
+                else:
+                    self._skip_tag(item)
+
+        elif tag == Tag.LIST:
+            item = self._read_tag()
+            length = self._readb(F.I32)
+
+            for index in range(length):
+                if index in query:
+                    self._select(item, query[index], (*path, index), found)
+                else:
+                    self._skip_tag(item)
+
+        else:
+            self._skip_tag(tag)
+
+    def _events(self, tag: Tag, path: NbtPath) -> Iterator[tuple[NbtPath, NbtValue]]:
+        """Yield path and value of each scalar and array tag, in file order."""
+
+        if tag == Tag.COMPOUND:
+            while (item := self._read_tag()) != Tag.END:
+                key = self._readutf8()
+                yield from self._events(item, (*path, key))
+
+        elif tag == Tag.LIST:
+            item = self._read_tag()
+            length = self._readb(F.I32)
+
+            for index in range(length):
+                yield from self._events(item, (*path, index))
+
+        else:
+            yield path, self._parse_tag(tag)
+
+
+def _resolve(value: NbtValue, query: Query, path: NbtPath, found: dict[NbtPath, NbtValue]) -> None:
+    # Deeper paths under already parsed value are taken from it
+    for key, sub in query.items():
+        if key == SELECTED:
+            continue
+
+        match value:
+            case dict() if isinstance(key, str) and key in value:
+                child = value[key]
+            case list() if isinstance(key, int) and key < len(value):
+                child = value[key]
+            case _:
+                continue
+
+        if SELECTED in sub:
+            found[(*path, key)] = child
+        _resolve(child, sub, (*path, key), found)
+
 
 class NbtBufferIO(NbtIO, BytesIO): ...
+
+
+class NbtStreamIO(NbtIO):
+    """NBT reader over readable stream, such as decompressing reader. Source stream is left open."""
+
+    def __init__(self, stream: IO[bytes]):
+        self._stream = stream
+        self._seekable = stream.seekable()
+
+        # Bound directly, since parser reads many small values
+        self.read = stream.read
+
+    def skip(self, size: int) -> None:
+        if self._seekable:
+            self._stream.seek(size, SEEK_CUR)
+        else:
+            self._stream.read(size)
@@ -33,3 +33,11 @@ def encode_ba(name: bytes, v: bytes) -> bytes:
 
 def encode_ia(name: bytes, arr: tuple[int, ...]) -> bytes:
     return encode(Tag.INT_ARRAY, name) + struct.pack(f">i{len(arr)}i", len(arr), *arr)
+
+
+def encode_string(name: bytes, v: bytes) -> bytes:
+    return encode(Tag.STRING, name) + struct.pack(">H", len(v)) + v
+
+
+def encode_la(name: bytes, arr: bytes) -> bytes:
+    return encode(Tag.LONG_ARRAY, name) + struct.pack(">i", len(arr) // 8) + arr
@@ -0,0 +1,76 @@
+"""
+Paths into NBT tree, such as ``a.b[3].c``.
+
+Keys are separated by dots, list indices are written in brackets.
+"""
+
+import re
+from typing import TypeAlias
+
+
+NbtKey: TypeAlias = str | int
+NbtPath: TypeAlias = tuple[NbtKey, ...]
+
+Query: TypeAlias = dict[NbtKey, "Query"]
+"""Tree of requested keys. Requested path ends with :data:`SELECTED` key."""
+
+SELECTED = -1
+"""Marker key of requested path end, never valid list index."""
+
+_TOKEN = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+
+def parse(path: str) -> NbtPath:
+    """
+    Split path string into compound keys and list indices.
+
+    Raises:
+        ValueError: Path has invalid syntax.
+    """
+
+    keys: list[NbtKey] = []
+    pos = 0
+
+    while pos < len(path):
+        # Keys after first one are preceded by dot, indices are not
+        dotted = bool(keys) and path[pos] == "."
+        if dotted:
+            pos += 1
+
+        match = _TOKEN.match(path, pos)
+        if not match or (keys and dotted == bool(match.group(2))):
+            raise ValueError(f"Invalid NBT path '{path}' at position {pos}")
+
+        key, index = match.groups()
+        keys.append(key if index is None else int(index))
+        pos = match.end()
+
+    return tuple(keys)
+
+
+def format(path: NbtPath) -> str:
+    """Join keys into path string."""
+
+    parts: list[str] = []
+
+    for key in path:
+        if isinstance(key, int):
+            parts.append(f"[{key}]")
+        else:
+            parts.append(f".{key}" if parts else key)
+
+    return "".join(parts)
+
+
+def build(paths: list[NbtPath]) -> Query:
+    """Merge paths into query tree."""
+
+    root: Query = {}
+
+    for path in paths:
+        node = root
+        for key in path:
+            node = node.setdefault(key, {})
+        node[SELECTED] = {}
+
+    return root
@@ -1,6 +1,6 @@
 import numpy as np
 
-from scfile.core import FileEncoder, ModelContent
+from scfile.core.streaming import MeshEncoder
 from scfile.enums import ByteOrder, FileFormat
 from scfile.structures import models as S
 from scfile.structures.models import Flag
@@ -9,34 +9,33 @@ from scfile.structures.models import transforms as T
 from . import faces
 
 
-class ObjEncoder(FileEncoder[ModelContent]):
+class ObjEncoder(MeshEncoder):
     format = FileFormat.OBJ
     order = ByteOrder.LITTLE
 
     transforms = [T.unique_names, T.flip_uv]
+    mesh_transforms = [T.stream_unique_names, T.stream_flip_uv]
+    attributes = frozenset({Flag.UV, Flag.NORMALS})
 
-    def serialize(self):
-        self._add_meshes()
+    def prelude(self):
+        self.ctx["OFFSET"] = 1
 
-    def _add_meshes(self):
-        offset = 1
+    def serialize_mesh(self, mesh: S.ModelMesh):
+        self._writeutf8(f"o {mesh.name}\n")
+        self._writeutf8(f"usemtl {mesh.material}\n")
 
-        for mesh in self.data.scene.meshes:
-            self._writeutf8(f"o {mesh.name}\n")
-            self._writeutf8(f"usemtl {mesh.material}\n")
+        self._add_geometric_vertices(mesh)
 
-            self._add_geometric_vertices(mesh)
+        if self.data.flags[Flag.UV]:
+            self._add_texture_coordinates(mesh)
 
-            if self.data.flags[Flag.UV]:
-                self._add_texture_coordinates(mesh)
+        if self.data.flags[Flag.NORMALS] or self.data.flags[Flag.TANGENTS]:
+            self._add_vertex_normals(mesh)
 
-            if self.data.flags[Flag.NORMALS] or self.data.flags[Flag.TANGENTS]:
-                self._add_vertex_normals(mesh)
+        self._writeutf8(f"g {mesh.name}\n")
+        self._add_polygonal_faces(mesh, self.ctx["OFFSET"])
 
-            self._writeutf8(f"g {mesh.name}\n")
-            self._add_polygonal_faces(mesh, offset)
-
-            offset += len(mesh.vertices)
+        self.ctx["OFFSET"] += len(mesh.vertices)
 
     def _vectorize(self, template: bytes, data: np.ndarray, count: int):
         return (template * count) % tuple(data.ravel().tolist())
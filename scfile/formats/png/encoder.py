@@ -8,5 +8,7 @@ class PngEncoder(FileEncoder[ImageContent]):
     signature = FileSignature.PNG
     order = ByteOrder.LITTLE
 
+    passthrough = True
+
     def serialize(self):
-        self.write(self.data.image)
+        self.copy(self.data.image)
@@ -0,0 +1,64 @@
+"""
+Minimal writer of 8-bit truecolor PNG from pixel arrays.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+from scfile.consts import FileSignature
+from scfile.core import ImageContent
+
+
+COLOR_TYPES = {3: 2, 4: 6}
+"""Color type of PNG by channels count (RGB, RGBA)."""
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode(
+    pixels: np.ndarray,
+    level: int = 6,
+) -> bytes:
+    """
+    Encode pixels as complete PNG file.
+
+    Args:
+        pixels: Array of shape ``(height, width, 3 | 4)`` and uint8 type.
+        level (optional): Zlib compression level.
+
+    Raises:
+        ValueError: Pixels shape or type is not supported.
+    """
+
+    if pixels.ndim != 3 or pixels.shape[2] not in COLOR_TYPES or pixels.dtype != np.uint8:
+        raise ValueError(f"Expected (height, width, 3 | 4) uint8 pixels, got {pixels.shape} {pixels.dtype}")
+
+    height, width, channels = pixels.shape
+    header = struct.pack(">IIBBBBB", width, height, 8, COLOR_TYPES[channels], 0, 0, 0)
+
+    # Each scanline starts with filter type byte, none here
+    rows = np.zeros((height, width * channels + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, -1)
+
+    return b"".join(
+        [
+            FileSignature.PNG,
+            b"\r\n\x1a\n",
+            _chunk(b"IHDR", header),
+            _chunk(b"IDAT", zlib.compress(rows, level)),
+            _chunk(b"IEND", b""),
+        ]
+    )
+
+
+def image(
+    pixels: np.ndarray,
+    level: int = 6,
+) -> ImageContent:
+    """Image content for :class:`PngEncoder` from pixels."""
+
+    return ImageContent(image=encode(pixels, level)[len(FileSignature.PNG) :])
@@ -13,9 +13,14 @@ Example::
 
     with formats.texarr.TexarrDecoder("blocks.texarr") as texarr:
         data = texarr.decode()
+
+    with formats.texarr.TexarrDecoder("blocks.texarr") as texarr:
+        texarr.extract("textures", pattern="blocks/stone*")
+
+Indexed access (``index``, ``load``, ``extract``) requires seekable source.
 """
 
-from .decoder import TexarrDecoder
+from .decoder import TexarrDecoder, TexarrEntry
 
 
-__all__ = ("TexarrDecoder",)
+__all__ = ("TexarrDecoder", "TexarrEntry")
@@ -1,12 +1,32 @@
+import io
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import NamedTuple
+
 from scfile import formats
-from scfile.core import FileDecoder, TexarrContent
+from scfile.core import FileDecoder, SourceRange, TexarrContent
 from scfile.enums import ByteOrder, F, FileFormat
+from scfile.exceptions import InvalidStructureError
+from scfile.types import PathLike
 
 
 DELIMITER = ":"
 FORMAT = FileFormat.DDS.suffix
 
 
+class TexarrEntry(NamedTuple):
+    """Texture entry of array, without payload."""
+
+    path: str
+    """Texture path inside array, with ``.dds`` suffix."""
+
+    offset: int
+    """Payload position in source."""
+
+    size: int
+    """Payload size in bytes."""
+
+
 class TexarrDecoder(FileDecoder[TexarrContent]):
     format = FileFormat.TEXARR
     order = ByteOrder.BIG
@@ -22,9 +42,117 @@ class TexarrDecoder(FileDecoder[TexarrContent]):
         for _ in range(self.data.count):
             self._parse_texture()
 
+    def index(self) -> list[TexarrEntry]:
+        """
+        Read entries table, skipping texture payloads.
+
+        Returns:
+            Entries in array order.
+
+        Raises:
+            io.UnsupportedOperation: Source is forward-only.
+        """
+
+        self._rewind()
+        entries: list[TexarrEntry] = []
+
+        for _ in range(self._readb(F.U32)):
+            entry = self._read_entry()
+            entries.append(entry)
+            self.skip(entry.size)
+
+        self._rewind()
+        return entries
+
+    def entries(self, pattern: str = "*") -> list[TexarrEntry]:
+        """Entries with path matching glob pattern, such as ``"blocks/*.dds"``."""
+
+        return [entry for entry in self.index() if fnmatchcase(entry.path, pattern)]
+
+    def load(self, entry: TexarrEntry) -> bytes:
+        """Read single texture payload. Source must be seekable."""
+
+        self._seekable()
+
+        try:
+            return self._range(entry).read()
+
+        finally:
+            self._rewind()
+
+    def extract(
+        self,
+        output: PathLike,
+        pattern: str = "*",
+    ) -> list[Path]:
+        """
+        Write textures matching glob pattern into directory, keeping their paths.
+
+        Payloads are copied from source one by one, so array is never loaded whole.
+
+        Args:
+            output: Output directory.
+            pattern (optional): Glob pattern matched against entry paths. Defaults to all.
+
+        Returns:
+            Paths of written textures.
+
+        Raises:
+            io.UnsupportedOperation: Source is forward-only.
+            InvalidStructureError: Entry path leads outside output directory.
+        """
+
+        paths: list[Path] = []
+
+        for entry in self.entries(pattern):
+            path = Path(output, self._safe_path(entry))
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(path, "wb") as fp:
+                self._range(entry).copy_to(fp)
+
+            paths.append(path)
+
+        self._rewind()
+        return paths
+
     def _parse_texture(self):
+        entry = self._read_entry()
+
+        if self.passthrough:
+            texture = self._range(entry)
+            self.skip(entry.size)
+
+        else:
+            texture = self.read(entry.size)
+
+        self.data.textures.append((entry.path, texture))
+
+    def _read_entry(self) -> TexarrEntry:
         path = self._readutf8().replace(DELIMITER, "/") + FORMAT
         size = self._readb(F.U32)
-        texture = self.read(size)
+        return TexarrEntry(path, self.tell(), size)
+
+    def _seekable(self) -> None:
+        # Entries are located by offset, pipes can only be decoded once
+        if self.forward:
+            raise io.UnsupportedOperation("Indexed TEXARR access requires seekable source")
+
+    def _rewind(self) -> None:
+        # Keep source reusable, like after decode
+        self._seekable()
+        self.seek(0)
+
+    def _range(self, entry: TexarrEntry) -> SourceRange:
+        return SourceRange(self._stream, entry.offset, entry.size)
+
+    def _safe_path(self, entry: TexarrEntry) -> PurePosixPath:
+        path = PurePosixPath(entry.path)
+
+        # Backslashes, drives and UNC shares are separators on Windows
+        windows = PureWindowsPath(entry.path)
+
+        if path.is_absolute() or windows.anchor or ".." in windows.parts:
+            raise InvalidStructureError(self.location, position=entry.offset)
 
-        self.data.textures.append((path, texture))
+        return path
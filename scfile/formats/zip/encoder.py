@@ -1,6 +1,7 @@
+import time
 import zipfile
 
-from scfile.core import FileEncoder, TexarrContent
+from scfile.core import FileEncoder, SourceRange, TexarrContent
 from scfile.enums import ByteOrder, FileFormat
 
 
@@ -8,7 +9,24 @@ class TexarrEncoder(FileEncoder[TexarrContent]):
     format = FileFormat.ZIP
     order = ByteOrder.LITTLE
 
+    passthrough = True
+
     def serialize(self):
         with zipfile.ZipFile(self, mode="w", compression=zipfile.ZIP_STORED) as zip:
             for path, data in self.data.textures:
-                zip.writestr(path, data)
+                if isinstance(data, SourceRange):
+                    # Copied in chunks, so texture is never held in memory whole
+                    with zip.open(_member(path, data.size), mode="w") as member:
+                        data.copy_to(member)
+
+                else:
+                    zip.writestr(path, data)
+
+
+def _member(path: str, size: int) -> zipfile.ZipInfo:
+    # Same header as written by writestr
+    info = zipfile.ZipInfo(path, date_time=time.localtime(time.time())[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = 0o600 << 16
+    info.file_size = size
+    return info
@@ -46,9 +46,11 @@ DATA: dict[Lang, dict[str, str]] = {
         "option.onconflict.rename": "Rename",
         "option.mapcache.resolve": "Resolve Paths",
         "option.mapcache.raw": "Raw Block IDs",
+        "option.stats": "Statistics",
         "hint.onconflict": "Action on output file name conflict",
         "hint.mapcache.resolve": "Auto-complete path to data folder",
         "hint.mapcache.raw": "Keep original block IDs instead of lookup table replacement",
+        "hint.stats": "Log stage timings and data sizes after conversion",
         "tooltip.path_browse": "LMB: Select directory\nRMB: Open in Explorer",
         "tooltip.invalid.output": "Specify an output folder",
         "tooltip.invalid.sources": "Add sources to convert",
@@ -69,6 +71,7 @@ DATA: dict[Lang, dict[str, str]] = {
         "update.available": "Update available",
         "update.error": "Update check failed",
         "update.manual": "Check manually",
+        "stats.summary": "{files} files in {elapsed:.2f} s, read {read}, written {written}",
         "placeholder.path": "Specify path...",
         "converter.hint": "Drag & Drop files and folders\nor use buttons above",
         "mapcache.info": "Format: Anvil 1343 (Minecraft 1.12.2+)\nExperimental decoder designed for basic geometry preview.\nFull environment replication or accurate block states are NOT planned.",
@@ -102,9 +105,11 @@ DATA: dict[Lang, dict[str, str]] = {
         "option.onconflict.rename": "Копия",
         "option.mapcache.resolve": "Исправление путей",
         "option.mapcache.raw": "Исходные ID",
+        "option.stats": "Статистика",
         "hint.onconflict": "Действие при совпадении имени выходного файла",
         "hint.mapcache.resolve": "Автоматически достраивать путь до папки с данными",
         "hint.mapcache.raw": "Сохранять исходные ID блоков вместо подмены по таблице",
+        "hint.stats": "Выводить время этапов и объём данных после конвертации",
         "tooltip.path_browse": "ЛКМ: Выбрать папку\nПКМ: Открыть в проводнике",
         "tooltip.invalid.output": "Укажите папку для сохранения",
         "tooltip.invalid.sources": "Добавьте источники для конвертации",
@@ -125,6 +130,7 @@ DATA: dict[Lang, dict[str, str]] = {
         "update.available": "Доступно обновление",
         "update.error": "Ошибка проверки обновлений",
         "update.manual": "Проверьте вручную",
+        "stats.summary": "Файлов: {files} за {elapsed:.2f} с, прочитано {read}, записано {written}",
         "placeholder.path": "Укажите путь...",
         "converter.hint": "Перетащите файлы и папки сюда\nлибо добавьте их кнопками выше",
         "mapcache.info": "Формат: Anvil 1343 (Minecraft 1.12.2+)\nЭкспериментальный декодер для просмотра базовой геометрии.\nИдеальное воссоздание окружения и состояний блоков НЕ планируется.",
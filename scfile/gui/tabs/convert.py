@@ -16,13 +16,13 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from scfile.core import Options
+from scfile.core import Metrics, Options
 from scfile.core.options import ON_CONFLICT_OPTIONS
 from scfile.gui import workers
 from scfile.gui.shared import consts, strings
 from scfile.gui.shared.consts import FT
 from scfile.gui.shared.styles import Styles
-from scfile.gui.widgets import PathInputWidget, SourcesWidget, WarningsWidget
+from scfile.gui.widgets import OptionWidget, PathInputWidget, SourcesWidget, WarningsWidget
 from scfile.gui.workers.convert import ConvertContext, ConvertWorker
 from scfile.gui.workers.counter import CounterWorker
 
@@ -134,6 +134,9 @@ class ConverterTab(QWidget):
 
         # Output conflicts
         self._build_onconflict()
+
+        # Statistics
+        self._build_stats()
         self.right.addStretch()
 
         # Warnings
@@ -315,6 +318,16 @@ class ConverterTab(QWidget):
         self.right.addSpacing(10)
         self.right.addWidget(group)
 
+    def _build_stats(self):
+        self.stats = OptionWidget(
+            text=strings.get("option.stats"),
+            hint=strings.get("hint.stats"),
+            checked=False,
+        )
+
+        self.right.addSpacing(10)
+        self.right.addWidget(self.stats)
+
     def _handle_sources(self):
         self._sync_counter()
         self._sync_button()
@@ -405,6 +418,7 @@ class ConverterTab(QWidget):
                 skeleton=ft_skeleton.isEnabled() and ft_skeleton.isChecked(),
                 animation=ft_animation.isEnabled() and ft_animation.isChecked(),
                 on_conflict=on_conflict.property("conflict_option") if on_conflict else "overwrite",
+                metrics=Metrics() if self.stats.isChecked() else None,
             ),
             output=(Path(self.output_path.text()) if self.output_to_custom.isChecked() else None),
             relative=self.output_tree.isChecked(),
@@ -179,7 +179,8 @@ class MapCacheTab(QWidget):
     def _merge(self):
         source = Path(self.source.text().strip())
         output = Path(self.output.text().strip())
-        options = Options(raw_blocks=self.raw_blocks.isChecked())
+        # Regions already run in worker pool, chunks within region stay sequential
+        options = Options(raw_blocks=self.raw_blocks.isChecked(), chunk_workers=0)
 
         self.merge.setEnabled(False)
 
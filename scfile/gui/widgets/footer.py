@@ -1,6 +1,8 @@
-from PySide6.QtWidgets import QHBoxLayout, QWidget
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QWidget
 
 from scfile import __repository__ as REPO
+from scfile.gui.shared.styles import Styles
+from scfile.gui.workers.logs import logger
 
 from .link import LinkWidget
 from .updates import VersionWidget
@@ -17,6 +19,15 @@ class FooterWidget(QWidget):
         version = VersionWidget()
         repo = LinkWidget(text=f"{REPO}", url=f"https://github.com/{REPO}")
 
+        self.stats = QLabel()
+        self.stats.setStyleSheet(Styles.HINT)
+        logger.stats.connect(self._on_stats)
+
         layout.addWidget(version)
         layout.addWidget(repo)
         layout.addStretch()
+        layout.addWidget(self.stats)
+
+    def _on_stats(self, text: str, details: str):
+        self.stats.setText(text)
+        self.stats.setToolTip(details)
@@ -1,13 +1,17 @@
 import traceback
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Callable, Optional
 
 from PySide6.QtCore import QRunnable, QThreadPool
+from rich.filesize import decimal
 
 from scfile import convert, exceptions, types
 from scfile.consts import Text
-from scfile.core import Options
-from scfile.utils import files
+from scfile.core import Metrics, Options
+from scfile.gui.shared import strings
+from scfile.utils import archives, files
 
 from .base import Worker
 from .logs import logger
@@ -21,21 +25,42 @@ class ConvertContext:
     relative: bool
 
 
+def summary(metrics: Metrics) -> tuple[str, str]:
+    decoded = [item for item in metrics.formats if item.operation == "decode"]
+    text = strings.get("stats.summary").format(
+        files=sum(item.files for item in decoded),
+        elapsed=sum(item.elapsed for item in metrics.formats),
+        read=decimal(sum(item.bytes_read for item in metrics.formats)),
+        written=decimal(sum(item.bytes_written for item in metrics.formats)),
+    )
+
+    details = "\n".join(
+        f"{item.format} {item.operation}: {item.files} × "
+        + ", ".join(f"{name} {elapsed:.3f} s" for name, elapsed in item.stages.items())
+        for item in metrics.formats
+    )
+
+    return text, details
+
+
 class ConvertTask(QRunnable):
     def __init__(
         self,
         src: str,
         dst: str | None,
         options: Options,
+        load: Optional[Callable[[], Optional[bytes]]] = None,
     ):
         super().__init__()
         self.src = src
         self.dst = dst
         self.options = options
+        self.load = load
 
     def run(self):
         try:
-            convert.auto(source=self.src, output=self.dst, options=self.options)
+            data = self.load() if self.load else None
+            convert.auto(source=self.src, output=self.dst, options=self.options, data=data)
             logger.done(f"'{self.src}'")
 
         except exceptions.InvalidStructureError as err:
@@ -59,6 +84,7 @@ class ConvertWorker(Worker):
         self.sources = sources
         self.context = context
         self.pool = QThreadPool()
+        self.reader = archives.ArchiveReader()
 
     def run(self):
         try:
@@ -72,8 +98,9 @@ class ConvertWorker(Worker):
                     self.pool.clear()
                     break
 
-                dst = files.destination(relpath=entry.relpath, relative=self.context.relative, output=output)
-                self.pool.start(ConvertTask(src=entry.path, dst=dst, options=self.context.options))
+                dst = files.entry_destination(entry=entry, relative=self.context.relative, output=output)
+                load = partial(self.reader.load, entry) if entry.member is not None else None
+                self.pool.start(ConvertTask(src=entry.path, dst=dst, options=self.context.options, load=load))
 
         except Exception as err:
             logger.exception(repr(err))
@@ -81,8 +108,12 @@ class ConvertWorker(Worker):
 
         finally:
             self.pool.waitForDone()
+            self.reader.close()
             self.finished.emit()
 
+            if metrics := self.context.options.metrics:
+                logger.stats.emit(*summary(metrics))
+
             if self.thread().isInterruptionRequested():
                 logger.aborted("Converting\n")
             else:
@@ -6,6 +6,7 @@ from scfile.enums import L
 
 class _Logger(QObject):
     message = Signal(str)
+    stats = Signal(str, str)
 
     def info(self, msg: str) -> None:
         self.message.emit(f"{L.INFO} {msg}")
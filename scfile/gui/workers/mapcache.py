@@ -78,7 +78,7 @@ class MapCacheWorker(Worker):
             logger.info(f"Found {len(mapping)} unique regions")
             logger.info("Starting merging...")
 
-            self.pool.setMaxThreadCount((os.cpu_count() or 4) * 2)
+            self.pool.setMaxThreadCount(os.cpu_count() or 4)
             for key, paths in mapping.items():
                 if self.thread().isInterruptionRequested():
                     self.pool.clear()
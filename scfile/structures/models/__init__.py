@@ -14,7 +14,7 @@ from .enums import (
     UVSign,
 )
 from .matrices import create_rotation_matrix, create_transform_matrix, euler_to_quat
-from .mesh import MeshBounds, ModelMesh
+from .mesh import MeshBounds, ModelMesh, QuantizedAttribute
 from .scene import ModelScene, SceneScales
 from .skeleton import ModelSkeleton, SkeletonBone
 from .types import (
@@ -48,6 +48,7 @@ __all__ = (
     "ModelAnimation",
     "ModelMesh",
     "ModelScene",
+    "QuantizedAttribute",
     "SceneScales",
     "SkeletonBone",
     "ModelSkeleton",
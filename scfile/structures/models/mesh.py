@@ -2,7 +2,10 @@
 Data structures for meshes.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Optional
 
 import numpy as np
 
@@ -19,6 +22,37 @@ class MeshBounds:
     radius: float = 0.0
 
 
+@dataclass
+class QuantizedAttribute:
+    """Integer vertex attribute with deferred conversion to floats."""
+
+    data: np.ndarray
+    """Raw integer values, shaped as vertex[units]."""
+
+    scale: float = 1.0
+    factor: float = 1.0
+
+    columns: Optional[int] = None
+    """Count of leading units exposed as floats. All units if not set."""
+
+    finalize: Optional[Callable[[np.ndarray], np.ndarray]] = None
+    """Post-processing of converted floats, such as normalization."""
+
+    @property
+    def count(self) -> int:
+        return len(self.data)
+
+    def dequantize(self) -> np.ndarray:
+        # Single float allocation, conversion and scaling fused into one pass
+        values = np.empty(self.data.shape, dtype=np.float32)
+        np.multiply(self.data, np.float32(self.scale / self.factor), out=values, dtype=np.float32)
+
+        if self.columns is not None:
+            values = values[:, : self.columns]
+
+        return self.finalize(values) if self.finalize else values
+
+
 @dataclass
 class ModelMesh:
     """Mesh geometry container."""
@@ -47,8 +81,66 @@ class ModelMesh:
     uv_origin: UVOrigin = UVOrigin.TOP_LEFT
     uv_sign: UVSign = UVSign.POSITIVE
 
+    quantized: dict[str, QuantizedAttribute] = field(default_factory=dict, repr=False, compare=False)
+    """Attributes not yet converted to floats, by field name."""
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for deferred attributes, missing from instance dict
+        quantized = self.__dict__.get("quantized")
+
+        if quantized and name in quantized:
+            value = quantized[name].dequantize()
+            object.__setattr__(self, name, value)
+            return value
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Assigned values replace raw attribute
+        quantized = self.__dict__.get("quantized")
+
+        if quantized:
+            quantized.pop(name, None)
+
+        # Derived stats are cached until source attribute is reassigned
+        if name == "links_weights":
+            self.__dict__.pop("max_influences", None)
+
+        object.__setattr__(self, name, value)
+
+    def defer(self, name: str, attribute: QuantizedAttribute) -> None:
+        """Store raw attribute, converted to floats on first access."""
+
+        self.__dict__.pop(name, None)
+        self.quantized[name] = attribute
+
+    def raw(self, name: str) -> Optional[QuantizedAttribute]:
+        """Raw attribute, unless already converted to floats, which may have been edited in place since."""
+
+        if name in self.__dict__:
+            return None
+        return self.quantized.get(name)
+
+    def copy(self) -> "ModelMesh":
+        """Shallow copy, deferred attributes stay deferred."""
+
+        mesh = object.__new__(type(self))
+        mesh.__dict__.update(self.__dict__)
+        mesh.__dict__["quantized"] = dict(self.quantized)
+        return mesh
+
     @property
+    def count_vertices(self) -> int:
+        """Vertex count without converting deferred positions."""
+
+        if attribute := self.quantized.get("vertices"):
+            return attribute.count
+        return len(self.vertices)
+
+    @cached_property
     def max_influences(self) -> int:
+        """Largest count of bones affecting single vertex. Cached until ``links_weights`` is reassigned."""
+
         if self.links_weights.size == 0:
             return 0
         return int((self.links_weights > 0).sum(axis=1).max())
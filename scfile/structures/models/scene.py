@@ -31,7 +31,7 @@ class ModelScene:
 
     @property
     def total_vertices(self):
-        return sum(len(mesh.vertices) for mesh in self.meshes)
+        return sum(mesh.count_vertices for mesh in self.meshes)
 
     @property
     def total_polygons(self):
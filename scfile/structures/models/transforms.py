@@ -2,6 +2,7 @@
 Scene transformation functions.
 """
 
+from collections.abc import Iterable, Iterator
 from dataclasses import replace
 from typing import Callable, TypeAlias
 
@@ -17,15 +18,21 @@ from .skeleton import SkeletonBone
 
 
 SceneTransform: TypeAlias = Callable[[ModelScene], ModelScene]
+MeshTransform: TypeAlias = Callable[[Iterable[ModelMesh]], Iterator[ModelMesh]]
 
 
 def unique_names(scene: ModelScene) -> ModelScene:
     """Ensure all meshes have unique names."""
 
+    return replace(scene, meshes=list(stream_unique_names(scene.meshes)))
+
+
+def stream_unique_names(meshes: Iterable[ModelMesh]) -> Iterator[ModelMesh]:
+    """Ensure all meshes have unique names, one mesh at a time."""
+
     seen_names: set[str] = set()
-    meshes: list[ModelMesh] = []
 
-    for mesh in scene.meshes:
+    for mesh in meshes:
         name = mesh.name or "noname"
 
         base_name, count = name, 2
@@ -36,31 +43,33 @@ def unique_names(scene: ModelScene) -> ModelScene:
             count += 1
 
         seen_names.add(unique_name)
-        meshes.append(replace(mesh, name=unique_name))
-
-    return replace(scene, meshes=meshes)
+        new_mesh = mesh.copy()
+        new_mesh.name = unique_name
+        yield new_mesh
 
 
 def flip_uv(scene: ModelScene) -> ModelScene:
     """Flip V axis (TOP_LEFT → BOTTOM_LEFT)."""
 
-    meshes: list[ModelMesh] = []
+    return replace(scene, meshes=list(stream_flip_uv(scene.meshes)))
 
-    for mesh in scene.meshes:
+
+def stream_flip_uv(meshes: Iterable[ModelMesh]) -> Iterator[ModelMesh]:
+    """Flip V axis (TOP_LEFT → BOTTOM_LEFT), one mesh at a time."""
+
+    for mesh in meshes:
         if mesh.uv_origin == UVOrigin.BOTTOM_LEFT and mesh.uv_sign == UVSign.POSITIVE:
-            meshes.append(mesh)
+            yield mesh
             continue
 
-        new_mesh = replace(mesh)
+        new_mesh = mesh.copy()
         new_mesh.uv1 = mesh.uv1.copy()
         new_mesh.uv2 = mesh.uv2.copy()
         new_mesh.uv1[:, 1] = 1.0 - new_mesh.uv1[:, 1]
         new_mesh.uv2[:, 1] = 1.0 - new_mesh.uv2[:, 1]
         new_mesh.uv_origin = UVOrigin.BOTTOM_LEFT
         new_mesh.uv_sign = UVSign.POSITIVE
-        meshes.append(new_mesh)
-
-    return replace(scene, meshes=meshes)
+        yield new_mesh
 
 
 def invert_uv(scene: ModelScene) -> ModelScene:
@@ -73,7 +82,7 @@ def invert_uv(scene: ModelScene) -> ModelScene:
             meshes.append(mesh)
             continue
 
-        new_mesh = replace(mesh)
+        new_mesh = mesh.copy()
         new_mesh.uv1 = mesh.uv1.copy()
         new_mesh.uv2 = mesh.uv2.copy()
         new_mesh.uv1[:, 1] *= -1.0
@@ -4,6 +4,13 @@ Data structures for world regions.
 
 from dataclasses import dataclass, field
 
+import numpy as np
+
+
+SECTIONS_COUNT = 16
+SECTION_SIDE = 16
+SECTION_SIZE = SECTION_SIDE**3  # 4096
+
 
 @dataclass
 class ChunkHeader:
@@ -29,3 +36,18 @@ class RegionChunk:
     light: bytes = field(default_factory=bytes)
     add: bytes = field(default_factory=bytes)
     extra: bytes = field(default_factory=bytes)
+
+    @property
+    def sections(self) -> np.ndarray:
+        """Y index of each stored section, from ``blocks_mask``."""
+
+        mask = self.header.blocks_mask
+        return np.array([y for y in range(SECTIONS_COUNT) if (mask >> y) & 1], dtype=np.int32)
+
+    @property
+    def volume(self) -> np.ndarray:
+        """View of blocks as ``(sections, y, z, x)`` volumes, without copy."""
+
+        count = len(self.blocks) // SECTION_SIZE
+        data = np.frombuffer(self.blocks, dtype=np.uint8, count=count * SECTION_SIZE)
+        return data.reshape(count, SECTION_SIDE, SECTION_SIDE, SECTION_SIDE)
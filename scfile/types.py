@@ -31,6 +31,8 @@ class FileEntry(NamedTuple):
     root: str
     path: str
     relpath: str
+    member: Optional[str] = None
+    """Member name inside ``root`` archive, if entry comes from archive."""
 
 
 FilesWalk: TypeAlias = Iterator[FileEntry]
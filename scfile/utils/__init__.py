@@ -2,13 +2,16 @@
 Internal utility modules.
 """
 
-from . import cli, files, regions, updates, versions
+from . import analytics, archives, cli, files, preview, regions, updates, versions
 
 
 __all__ = (
     "files",
+    "archives",
     "versions",
     "cli",
     "updates",
     "regions",
+    "analytics",
+    "preview",
 )
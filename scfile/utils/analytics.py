@@ -0,0 +1,260 @@
+"""Vectorized world analytics over decoded map cache regions."""
+
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple, Optional, TypeAlias
+
+import numpy as np
+
+from scfile import Options
+from scfile.core import RegionContent, parallel
+from scfile.structures.regions import SECTION_SIDE
+
+from .regions import RegionKey, RegionsMapping, load
+
+
+REGION_CHUNKS = 32
+REGION_SIDE = REGION_CHUNKS * SECTION_SIDE  # 512
+AIR = 0
+
+Lookup: TypeAlias = Optional[bytes | np.ndarray]
+"""Block ID remapping table of 256 entries, such as ``BLOCKS_MAPPING``."""
+
+
+class RegionVolume(NamedTuple):
+    """All stored sections of region in single array."""
+
+    sections: np.ndarray
+    """Blocks of shape ``(count, y, z, x)``."""
+
+    chunks: np.ndarray
+    """Chunk index of each section."""
+
+    ys: np.ndarray
+    """Y index of each section within its chunk."""
+
+
+class Columns(NamedTuple):
+    """Top-down view of region, indexed ``[z, x]``."""
+
+    heights: np.ndarray
+    """Y of highest non-air block, ``-1`` for empty column."""
+
+    blocks: np.ndarray
+    """Block ID of highest non-air block, ``0`` for empty column."""
+
+
+class Bounds(NamedTuple):
+    """Inclusive world coordinates box, as ``(x, y, z)``."""
+
+    min: tuple[int, int, int]
+    max: tuple[int, int, int]
+
+    def union(self, other: "Bounds") -> "Bounds":
+        return Bounds(
+            min=(min(self.min[0], other.min[0]), min(self.min[1], other.min[1]), min(self.min[2], other.min[2])),
+            max=(max(self.max[0], other.max[0]), max(self.max[1], other.max[1]), max(self.max[2], other.max[2])),
+        )
+
+
+class RegionStats(NamedTuple):
+    """Statistics of single region."""
+
+    key: RegionKey
+    chunks: int
+    histogram: np.ndarray
+    bounds: Optional[Bounds]
+    coverage: np.ndarray
+
+
+class WorldStats(NamedTuple):
+    """Statistics of all regions in map cache."""
+
+    regions: dict[RegionKey, RegionStats]
+
+    @property
+    def chunks(self) -> int:
+        return sum(region.chunks for region in self.regions.values())
+
+    @property
+    def histogram(self) -> np.ndarray:
+        """Count of each block ID across world."""
+
+        return sum((region.histogram for region in self.regions.values()), np.zeros(256, dtype=np.int64))
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        """Box of non-air content across world."""
+
+        boxes = [region.bounds for region in self.regions.values() if region.bounds]
+        if not boxes:
+            return None
+
+        result = boxes[0]
+        for box in boxes[1:]:
+            result = result.union(box)
+        return result
+
+
+def volume(
+    content: RegionContent,
+    lookup: Lookup = None,
+) -> RegionVolume:
+    """
+    Stack stored sections of all region chunks.
+
+    Args:
+        content: Decoded region.
+        lookup (optional): Block ID remapping table.
+    """
+
+    volumes = [chunk.volume for chunk in content.chunks]
+    counts = [len(vol) for vol in volumes]
+
+    sections = np.concatenate(volumes) if volumes else np.empty((0, *(SECTION_SIDE,) * 3), dtype=np.uint8)
+    if lookup is not None:
+        sections = _table(lookup)[sections]
+
+    chunks = np.repeat(np.array([chunk.index for chunk in content.chunks], dtype=np.int32), counts)
+    ys = np.concatenate([chunk.sections[:count] for chunk, count in zip(content.chunks, counts)] or [[]])
+
+    return RegionVolume(sections=sections, chunks=chunks, ys=ys.astype(np.int32))
+
+
+def histogram(
+    content: RegionContent,
+    lookup: Lookup = None,
+) -> np.ndarray:
+    """Count of each block ID in region, air included."""
+
+    counts = np.zeros(256, dtype=np.int64)
+
+    for chunk in content.chunks:
+        data = np.frombuffer(chunk.blocks, dtype=np.uint8)
+        counts += np.bincount(data if lookup is None else _table(lookup)[data], minlength=256)
+
+    return counts
+
+
+def columns(
+    content: RegionContent,
+    lookup: Lookup = None,
+) -> Columns:
+    """Highest non-air block of each region column."""
+
+    vol = volume(content, lookup)
+    solid = vol.sections != AIR
+
+    # Highest solid Y within each section column, searched from top
+    found = solid.any(axis=1)
+    local = SECTION_SIDE - 1 - np.argmax(solid[:, ::-1], axis=1)
+    top = np.take_along_axis(vol.sections, local[:, np.newaxis], axis=1)[:, 0]
+
+    # Height and block packed into one key, so maximum picks both from highest section
+    height = vol.ys[:, np.newaxis, np.newaxis] * SECTION_SIDE + local
+    keys = np.where(found, (height << 8) | top, -1)
+
+    packed = np.full((REGION_CHUNKS * REGION_CHUNKS, SECTION_SIDE, SECTION_SIDE), -1, dtype=np.int64)
+    np.maximum.at(packed, vol.chunks, keys)
+
+    # Chunk index is lx + lz * 32, columns are laid out as [lz, z, lx, x]
+    packed = packed.reshape(REGION_CHUNKS, REGION_CHUNKS, SECTION_SIDE, SECTION_SIDE)
+    packed = packed.transpose(0, 2, 1, 3).reshape(REGION_SIDE, REGION_SIDE)
+
+    empty = packed < 0
+    heights = np.where(empty, -1, packed >> 8).astype(np.int16)
+    blocks = np.where(empty, AIR, packed & 0xFF).astype(np.uint8)
+
+    return Columns(heights=heights, blocks=blocks)
+
+
+def heightmap(
+    content: RegionContent,
+    lookup: Lookup = None,
+) -> np.ndarray:
+    """Y of highest non-air block of each region column, indexed ``[z, x]``."""
+
+    return columns(content, lookup).heights
+
+
+def bounds(
+    content: RegionContent,
+    lookup: Lookup = None,
+) -> Optional[Bounds]:
+    """World coordinates box of non-air blocks in region, ``None`` if region is empty."""
+
+    vol = volume(content, lookup)
+    solid = vol.sections != AIR
+
+    offsets = np.arange(SECTION_SIDE)
+    cx = content.rx * REGION_CHUNKS + vol.chunks % REGION_CHUNKS
+    cz = content.rz * REGION_CHUNKS + vol.chunks // REGION_CHUNKS
+
+    xs = (cx[:, np.newaxis] * SECTION_SIDE + offsets)[solid.any(axis=(1, 2))]
+    ys = (vol.ys[:, np.newaxis] * SECTION_SIDE + offsets)[solid.any(axis=(2, 3))]
+    zs = (cz[:, np.newaxis] * SECTION_SIDE + offsets)[solid.any(axis=(1, 3))]
+
+    if not len(ys):
+        return None
+
+    return Bounds(
+        min=(int(xs.min()), int(ys.min()), int(zs.min())),
+        max=(int(xs.max()), int(ys.max()), int(zs.max())),
+    )
+
+
+def coverage(
+    content: RegionContent,
+) -> np.ndarray:
+    """Presence of each region chunk, indexed ``[lz, lx]``."""
+
+    present = np.zeros(REGION_CHUNKS * REGION_CHUNKS, dtype=bool)
+    present[[chunk.index for chunk in content.chunks]] = True
+    return present.reshape(REGION_CHUNKS, REGION_CHUNKS)
+
+
+def analyze(
+    mapping: RegionsMapping,
+    options: Optional[Options] = None,
+    workers: Optional[int] = None,
+    lookup: Lookup = None,
+) -> WorldStats:
+    """
+    Collect statistics of all regions, decoded in parallel.
+
+    Args:
+        mapping: Map cache paths grouped by region.
+        options (optional): Decoder options.
+        workers (optional): Number of threads. Sequential on ``0``.
+        lookup (optional): Block ID remapping table.
+
+    Raises:
+        RegionFileError: Map cache file can't be decoded.
+    """
+
+    # Regions run in parallel, so chunks within region are decoded sequentially
+    options = options or Options(chunk_workers=0)
+    stats = parallel.imap(partial(_region, options=options, lookup=lookup), list(mapping.items()), workers)
+
+    return WorldStats(regions={region.key: region for region in stats})
+
+
+def _table(lookup: bytes | np.ndarray) -> np.ndarray:
+    return np.frombuffer(lookup, dtype=np.uint8) if isinstance(lookup, bytes) else lookup
+
+
+def _region(
+    item: tuple[RegionKey, list[Path]],
+    options: Options,
+    lookup: Lookup,
+) -> RegionStats:
+    key, paths = item
+    content = load(key, paths, options)
+
+    return RegionStats(
+        key=key,
+        chunks=len(content.chunks),
+        histogram=histogram(content, lookup),
+        bounds=bounds(content, lookup),
+        coverage=coverage(content),
+    )
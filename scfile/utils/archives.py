@@ -0,0 +1,107 @@
+"""Convertible files inside zip archives, read without extraction."""
+
+import os
+import threading
+import zipfile
+from typing import Optional, Self
+
+from scfile import types
+from scfile.consts import ARCHIVE_SUFFIXES
+
+
+def is_archive(
+    path: types.PathLike,
+) -> bool:
+    """Whether path is existing zip archive with archive suffix."""
+
+    path = os.fspath(path)
+    return path.lower().endswith(tuple(ARCHIVE_SUFFIXES)) and os.path.isfile(path) and zipfile.is_zipfile(path)
+
+
+def parts(
+    member: str,
+) -> list[str]:
+    """Split member name into safe path components, dropping empty, current and parent references."""
+
+    return [part for part in member.replace("\\", "/").split("/") if part not in ("", ".", "..")]
+
+
+def entries(
+    root: str,
+    whitelist: tuple[str, ...],
+    parent: bool = False,
+) -> types.FilesWalk:
+    """
+    Walk through archive members, filtering by whitelist.
+
+    Member paths become entry relative paths. With ``parent``, they are nested under archive name.
+    """
+
+    prefix = os.path.splitext(os.path.basename(root))[0] if parent else ""
+
+    with zipfile.ZipFile(root) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith(whitelist):
+                continue
+
+            components = parts(info.filename)
+            if not components:
+                continue
+
+            yield types.FileEntry(
+                root=root,
+                path=os.path.join(root, *components),
+                relpath=os.path.join(prefix, *components),
+                member=info.filename,
+            )
+
+
+class ArchiveReader:
+    """
+    Thread-safe reader of walked archive members.
+
+    Each archive is opened once and shared between threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._archives: dict[str, zipfile.ZipFile] = {}
+        self._closed = False
+
+    def open(self, path: str) -> zipfile.ZipFile:
+        """
+        Open archive or reuse already opened one.
+
+        Raises:
+            ValueError: Reader is closed.
+        """
+
+        with self._lock:
+            # Late jobs must not reopen archives that would never be closed
+            if self._closed:
+                raise ValueError("Archive reader is closed")
+
+            if path not in self._archives:
+                self._archives[path] = zipfile.ZipFile(path)
+            return self._archives[path]
+
+    def load(self, entry: types.FileEntry) -> Optional[bytes]:
+        """Content of archive member, or ``None`` for regular file entry."""
+
+        if entry.member is None:
+            return None
+
+        return self.open(entry.root).read(entry.member)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            for archive in self._archives.values():
+                archive.close()
+            self._archives.clear()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -2,10 +2,13 @@ from typing import Optional
 
 import click
 from rich import print
+from rich.filesize import decimal
+from rich.table import Table
 
 from scfile import __version__ as SEMVER
 from scfile import types
 from scfile.consts import Text
+from scfile.core import Metrics
 from scfile.enums import L, UpdateStatus
 
 from . import updates
@@ -24,6 +27,34 @@ def check_feature_unsupported(
         print(L.WARN, f"Specified formats [b]({suffixes})[/] doesn't support {feature}.")
 
 
+def metrics_table(metrics: Metrics) -> Table:
+    table = Table(title="Statistics")
+    table.add_column("Format", style="cyan")
+    table.add_column("Operation")
+    table.add_column("Files", justify="right")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("Stages")
+    table.add_column("Read", justify="right")
+    table.add_column("Written", justify="right")
+    table.add_column("Arrays", justify="right")
+
+    for summary in metrics.formats:
+        stages = sorted(summary.stages.items(), key=lambda item: item[1], reverse=True)
+
+        table.add_row(
+            summary.format,
+            summary.operation,
+            f"{summary.files:,}",
+            f"{summary.elapsed:.3f} s",
+            ", ".join(f"{name} {elapsed:.3f} s" for name, elapsed in stages),
+            decimal(summary.bytes_read),
+            decimal(summary.bytes_written),
+            f"{summary.arrays:,}",
+        )
+
+    return table
+
+
 def version_callback(
     ctx: click.Context,
     param: Optional[click.Parameter],
@@ -7,6 +7,8 @@ from pathlib import Path
 from scfile import types
 from scfile.consts import ALLOWED_SUFFIXES
 
+from . import archives
+
 
 def resource(
     path: types.PathLike,
@@ -45,7 +47,11 @@ def walk(
     whitelist: types.FilesWhitelist | None = None,
     parent: bool = False,
 ) -> types.FilesWalk:
-    """Walk through files in given sources, optionally filtering by whitelist."""
+    """
+    Walk through files in given sources, optionally filtering by whitelist.
+
+    Archive sources and archives found in directories are walked through their members without extraction.
+    """
 
     paths = resolve(sources)
     paths = list(map(str, paths))
@@ -54,6 +60,10 @@ def walk(
     for root in paths:
         base = os.path.dirname(root) if parent else root
 
+        if archives.is_archive(root):
+            yield from archives.entries(root, whitelist, parent)
+            continue
+
         if os.path.isfile(root):
             if root.lower().endswith(whitelist):
                 yield types.FileEntry(
@@ -73,7 +83,10 @@ def walk(
                             stack.append(entry.path)
 
                         elif entry.is_file():
-                            if entry.name.lower().endswith(whitelist):
+                            if archives.is_archive(entry.path):
+                                yield from _nested(entry.path, base, whitelist)
+
+                            elif entry.name.lower().endswith(whitelist):
                                 yield types.FileEntry(
                                     root=root,
                                     path=entry.path,
@@ -84,6 +97,14 @@ def walk(
                 continue
 
 
+def _nested(path: str, base: str, whitelist: tuple[str, ...]) -> types.FilesWalk:
+    # Members are nested under archive path without suffix, like directory
+    prefix = os.path.splitext(os.path.relpath(path, base))[0]
+
+    for entry in archives.entries(path, whitelist):
+        yield entry._replace(relpath=os.path.join(prefix, entry.relpath))
+
+
 def destination(
     relpath: str,
     relative: bool,
@@ -95,3 +116,18 @@ def destination(
         return os.path.join(output, os.path.dirname(relpath))
 
     return output
+
+
+def entry_destination(
+    entry: types.FileEntry,
+    relative: bool,
+    output: str | None,
+) -> str | None:
+    """Resolve destination path for walked entry. Archive members default to archive directory."""
+
+    dest = destination(relpath=entry.relpath, relative=relative, output=output)
+
+    if dest is None and entry.member is not None:
+        return os.path.dirname(entry.root)
+
+    return dest
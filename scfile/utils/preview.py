@@ -0,0 +1,115 @@
+"""Top-down map previews rendered straight from map cache regions."""
+
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from scfile import Options, formats
+from scfile.core import RegionContent, parallel
+from scfile.formats.mca.colors import BLOCKS_COLORS, PALETTE
+from scfile.formats.mca.mapping import BLOCKS_MAPPING
+from scfile.formats.png import raster
+
+from . import analytics
+from .regions import RegionKey, RegionsMapping, load
+
+
+SHADE_STEP = 0.15
+"""Brightness change per block of height difference with northern neighbour."""
+
+SHADE_RANGE = (0.6, 1.3)
+
+
+class RegionPreview(NamedTuple):
+    """Rendered region pixels."""
+
+    key: RegionKey
+    pixels: np.ndarray
+
+
+def render(
+    content: RegionContent,
+    raw: bool = False,
+) -> np.ndarray:
+    """
+    Render region as top-down RGB pixels, indexed ``[z, x]``. Empty columns are black.
+
+    Args:
+        content: Decoded region.
+        raw (optional): Keep original block IDs, so blocks mapped to air are drawn too.
+    """
+
+    columns = analytics.columns(content, None if raw else BLOCKS_MAPPING)
+    heights = columns.heights.astype(np.float32)
+
+    # Slopes facing north are lit, like on in-game maps
+    north = np.vstack([heights[:1], heights[:-1]])
+    north = np.where(north < 0, heights, north)
+    shade = np.clip(1.0 + (heights - north) * SHADE_STEP, *SHADE_RANGE)
+
+    # Mapped blocks are vanilla already, raw ones are colored through mapping
+    colors = BLOCKS_COLORS[columns.blocks] if raw else PALETTE[columns.blocks]
+    pixels = np.clip(colors * shade[..., np.newaxis], 0, 255).astype(np.uint8)
+    pixels[columns.heights < 0] = 0
+
+    return pixels
+
+
+def region(
+    key: RegionKey,
+    paths: list[Path],
+    options: Optional[Options] = None,
+) -> RegionPreview:
+    """Decode and render single region."""
+
+    options = options or Options()
+    return RegionPreview(key, render(load(key, paths, options), options.raw_blocks))
+
+
+def regions(
+    mapping: RegionsMapping,
+    options: Optional[Options] = None,
+    workers: Optional[int] = None,
+) -> list[RegionPreview]:
+    """Decode and render all regions in parallel."""
+
+    # Regions run in parallel, so chunks within region are decoded sequentially
+    options = options or Options(chunk_workers=0)
+    return parallel.imap(partial(_region, options=options), list(mapping.items()), workers)
+
+
+def world(
+    previews: list[RegionPreview],
+) -> np.ndarray:
+    """Compose region previews into single world image, north at top."""
+
+    if not previews:
+        return np.zeros((0, 0, 3), dtype=np.uint8)
+
+    xs = [rx for (rx, _), _ in previews]
+    zs = [rz for (_, rz), _ in previews]
+    side = analytics.REGION_SIDE
+
+    pixels = np.zeros(((max(zs) - min(zs) + 1) * side, (max(xs) - min(xs) + 1) * side, 3), dtype=np.uint8)
+
+    for (rx, rz), image in previews:
+        x, z = (rx - min(xs)) * side, (rz - min(zs)) * side
+        pixels[z : z + side, x : x + side] = image
+
+    return pixels
+
+
+def save(
+    pixels: np.ndarray,
+    path: Path,
+) -> None:
+    """Write pixels as PNG file."""
+
+    with formats.png.PngEncoder(raster.image(pixels)) as png:
+        png.encode().save(path)
+
+
+def _region(item: tuple[RegionKey, list[Path]], options: Options) -> RegionPreview:
+    return region(*item, options=options)
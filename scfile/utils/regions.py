@@ -34,6 +34,30 @@ def merge(
 ) -> MergeResult:
     """Merge multiple map chunks into single region file."""
 
+    merged = load(key, paths, options, cancelled)
+    filename = f"r.{merged.rx}.{merged.rz}.mca"
+    target = output / filename
+
+    if target.exists():
+        backup = target.with_suffix(".mca.bck")
+        if not backup.exists():
+            target.rename(backup)
+
+    with formats.mca.McaEncoder(data=merged, options=options) as mca:
+        mca.encode()
+        mca.save(target)
+
+    return MergeResult(filename, len(merged.chunks))
+
+
+def load(
+    key: RegionKey,
+    paths: list[Path],
+    options: Options,
+    cancelled: CancelEvent = None,
+) -> RegionContent:
+    """Decode region chunks from multiple map caches. First occurrence of each chunk wins."""
+
     merged = RegionContent()
     seen: set[int] = set()
 
@@ -56,19 +80,8 @@ def merge(
     (rx, rz) = key
     merged.rx = rx
     merged.rz = rz
-    filename = f"r.{rx}.{rz}.mca"
-    target = output / filename
-
-    if target.exists():
-        backup = target.with_suffix(".mca.bck")
-        if not backup.exists():
-            target.rename(backup)
 
-    with formats.mca.McaEncoder(data=merged, options=options) as mca:
-        mca.encode()
-        mca.save(target)
-
-    return MergeResult(filename, len(merged.chunks))
+    return merged
 
 
 def parse(paths: Iterable[Path]) -> RegionsMapping:
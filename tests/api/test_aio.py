@@ -0,0 +1,103 @@
+import asyncio
+import shutil
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from scfile import aio, exceptions
+from scfile.formats.mcsb import McsbDecoder
+from scfile.formats.obj import ObjEncoder
+from scfile.utils import files
+from tests.conftest import ASSETS, MODEL
+
+
+def _collect(**kwargs) -> list[aio.BatchResult]:
+    async def run():
+        return [result async for result in aio.batch(**kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_convert_bytes():
+    data = (ASSETS / "source" / MODEL).read_bytes()
+
+    with McsbDecoder(data) as dec:
+        expected = dec.convert(ObjEncoder)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        result = asyncio.run(aio.convert_bytes(McsbDecoder, ObjEncoder, data, executor=executor))
+
+    assert result == expected
+
+
+def test_auto(temp: Path):
+    asyncio.run(aio.auto(ASSETS / "cli" / "model_v12.mcsb", temp))
+    assert (temp / "model_v12.obj").exists()
+
+
+def test_batch(temp: Path):
+    results = _collect(sources=[ASSETS / "cli" / "sub"], output=temp, workers=2)
+
+    assert len(results) == 2
+    assert all(result.ok for result in results)
+    assert (temp / "sub_model_v12.obj").exists()
+    assert (temp / "sub_texture_dxt1.dds").exists()
+
+
+def test_batch_archive(temp: Path):
+    archive = temp / "assets.zip"
+    with zipfile.ZipFile(archive, "w") as file:
+        file.write(ASSETS / "cli" / "model_v12.mcsb", "armor/model_v12.mcsb")
+
+    results = _collect(sources=[archive], output=temp / "out", relative=True)
+
+    assert [result.ok for result in results] == [True]
+    assert (temp / "out" / "assets" / "armor" / "model_v12.obj").exists()
+
+
+def test_batch_errors(temp: Path):
+    shutil.copy(ASSETS / "invalid" / "counts.mcsb", temp / "counts.mcsb")
+
+    results = _collect(sources=[temp], output=temp / "out")
+
+    assert len(results) == 1
+    assert isinstance(results[0].error, exceptions.LimitError)
+
+
+def test_batch_cancelled(temp: Path):
+    cancelled = threading.Event()
+    cancelled.set()
+
+    with pytest.raises(exceptions.ConvertInterrupted):
+        _collect(sources=[ASSETS / "cli" / "sub"], output=temp, cancelled=cancelled)
+
+    assert not any(temp.iterdir())
+
+
+def test_batch_cancelled_queued(temp: Path, monkeypatch: pytest.MonkeyPatch):
+    cancelled = threading.Event()
+    scanned = threading.Event()
+    converted: list[str] = []
+    entries = list(files.walk([ASSETS / "cli" / "sub"]))
+
+    def walk(*_, **__):
+        yield from entries
+        scanned.set()
+
+    def auto(source, *_):
+        # Cancel once all entries are submitted, while second job is still queued
+        scanned.wait(timeout=5)
+        converted.append(source)
+        cancelled.set()
+
+    monkeypatch.setattr(aio.files, "walk", walk)
+    monkeypatch.setattr(aio.detect, "auto", auto)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(exceptions.ConvertInterrupted):
+            _collect(sources=[], output=temp, executor=executor, workers=4, cancelled=cancelled)
+
+    assert len(converted) == 1
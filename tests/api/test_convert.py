@@ -1,9 +1,13 @@
+import io
+import zipfile
 from pathlib import Path
 
 import pytest
 
 from scfile import convert
+from scfile.core import FileEncoder
 from scfile.exceptions import InvalidSignatureError, InvalidStructureError, UnsupportedFormatError
+from scfile.formats.json import JsonEncoder
 from tests.conftest import ASSETS, CUBEMAP, IMAGE, MODEL, MODEL_LEGACY, NBT, TEXTURE
 
 
@@ -15,6 +19,57 @@ def test_auto(temp: Path, path: Path):
     convert.auto(path, temp)
 
 
+def test_auto_archive(temp: Path):
+    archive = temp / "assets.zip"
+    with zipfile.ZipFile(archive, "w") as file:
+        file.write(ASSETS / "cli" / "model_v12.mcsb", "armor/model_v12.mcsb")
+        file.write(ASSETS / "cli" / "texture_dxt1.ol", "items/texture_dxt1.ol")
+
+    convert.auto(archive, temp / "out")
+    assert (temp / "out" / "model_v12.obj").exists()
+    assert (temp / "out" / "texture_dxt1.dds").exists()
+
+    convert.auto(archive)
+    assert (temp / "model_v12.obj").exists()
+
+
+def test_stream():
+    output = io.BytesIO()
+    source = io.BufferedReader(io.BytesIO((ASSETS / "source" / TEXTURE).read_bytes()))
+    convert.convert.stream(convert.decoders()["ol"], convert.encoders()["dds"], source, output)
+    assert output.getvalue().startswith(b"DDS ")
+
+
+def test_stream_model_file(temp: Path):
+    src = ASSETS / "cli" / "model_v12.mcsb"
+    convert.formats.mcsb_to_obj(src, temp)
+
+    with convert.decoders()["mcsb"](src) as dec:
+        assert (temp / "model_v12.obj").read_bytes() == dec.convert(convert.encoders()["obj"])
+    assert list(temp.glob("*.part")) == []
+
+
+def test_stream_model_truncated(temp: Path):
+    content = (ASSETS / "cli" / "model_v12.mcsb").read_bytes()
+    src = temp / "model.mcsb"
+    src.write_bytes(content[: len(content) // 2])
+    (temp / "model.obj").write_bytes(b"old")
+
+    with pytest.raises(InvalidStructureError):
+        convert.formats.mcsb_to_obj(src)
+
+    assert (temp / "model.obj").read_bytes() == b"old"
+    assert list(temp.glob("*.part")) == []
+
+
+def test_target():
+    assert convert.detect.target("ol") == "dds"
+    assert convert.detect.target(".mcsb") == "obj"
+
+    with pytest.raises(UnsupportedFormatError):
+        convert.detect.target("txt")
+
+
 def test_formats_convert(temp: Path):
     src = ASSETS / "source" / MODEL
     out = temp / "model_v12.obj"
@@ -68,3 +123,46 @@ def test_auto_unsupported(temp: Path):
 def test_auto_invalid_signature(temp: Path):
     with pytest.raises(InvalidSignatureError):
         convert.auto(ASSETS / "invalid/signature.mic", temp)
+
+
+def test_passthrough_image(temp: Path):
+    src = ASSETS / "cli" / "image.mic"
+    convert.formats.mic_to_png(src, temp)
+
+    with convert.decoders()["mic"](src) as dec:
+        assert (temp / "image.png").read_bytes() == dec.convert(convert.encoders()["png"])
+    assert list(temp.glob("*.part")) == []
+
+
+def test_passthrough_texarr(temp: Path):
+    src = ASSETS / "cli" / "blocks.texarr"
+    convert.formats.texarr_to_zip(src, temp)
+
+    with convert.decoders()["texarr"](src) as dec:
+        expected = dec.convert(convert.encoders()["zip"])
+
+    with zipfile.ZipFile(temp / "blocks.zip") as z1, zipfile.ZipFile(io.BytesIO(expected)) as z2:
+        assert z1.namelist() == z2.namelist()
+        for name in z1.namelist():
+            assert z1.read(name) == z2.read(name)
+
+
+def test_incremental_json(temp: Path, monkeypatch: pytest.MonkeyPatch):
+    src = ASSETS / "cli" / "data.nbt"
+    streams: list[type] = []
+
+    def write(self, data):
+        streams.append(type(self._stream))
+        return FileEncoder.write(self, data)
+
+    monkeypatch.setattr(JsonEncoder, "CHUNK_SIZE", 16)
+    monkeypatch.setattr(JsonEncoder, "write", write)
+    convert.formats.nbt_to_json(src, temp)
+
+    # Chunks go to partial file, not into memory buffer first
+    assert len(streams) > 1
+    assert io.BytesIO not in streams
+
+    with convert.decoders()["nbt"](src) as dec:
+        assert (temp / "data.json").read_bytes() == dec.convert(convert.encoders()["json"])
+    assert list(temp.glob("*.part")) == []
@@ -1,3 +1,4 @@
+import zipfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -129,6 +130,46 @@ def test_parent_implies_relative(temp: Path):
     assert (temp / "sub" / "sub_model_v12.obj").exists()
 
 
+def test_archive_relative(temp: Path):
+    archive = temp / "assets.zip"
+    with zipfile.ZipFile(archive, "w") as file:
+        for path in (ASSETS / "cli" / "sub").iterdir():
+            file.write(path, f"sub/{path.name}")
+
+    result = runner.invoke(convert_command, [str(archive), "-O", str(temp / "out"), "--parent", "-W", "2"])
+    assert result.exit_code == 0
+    assert (temp / "out" / "assets" / "sub" / "sub_model_v12.obj").exists()
+    assert (temp / "out" / "assets" / "sub" / "sub_texture_dxt1.dds").exists()
+
+
+def test_archive_default_output(temp: Path):
+    archive = temp / "assets.zip"
+    with zipfile.ZipFile(archive, "w") as file:
+        file.write(ASSETS / "cli" / MODEL, f"sub/{MODEL}")
+
+    result = runner.invoke(convert_command, [str(archive)])
+    assert result.exit_code == 0
+    assert (temp / "model_v12.obj").exists()
+
+
+def test_archive_output(temp: Path):
+    src = ASSETS / "cli" / "sub"
+    out = temp / "out.zip"
+    result = runner.invoke(convert_command, [str(src), "-O", str(out), "--parent", "-W", "2"])
+    assert result.exit_code == 0
+
+    with zipfile.ZipFile(out) as file:
+        assert sorted(file.namelist()) == ["sub/sub_model_v12.obj", "sub/sub_texture_dxt1.dds"]
+
+
+def test_workers_errors(temp: Path):
+    src = ASSETS / "invalid" / "counts.mcsb"
+    result = runner.invoke(convert_command, [str(src), str(ASSETS / "cli" / MODEL), "-O", str(temp), "-W", "2"])
+    assert result.exit_code == 0
+    assert (temp / "model_v12.obj").exists()
+    assert "counts.mcsb" in result.output
+
+
 def test_multiple_sources(temp: Path):
     src1 = ASSETS / "cli" / MODEL
     src2 = ASSETS / "cli" / TEXTURE
@@ -175,3 +216,57 @@ def test_unexpected_error(temp: Path):
     with patch("scfile.cli.cmd.convert.convert.auto", side_effect=RuntimeError("boom")):
         result = runner.invoke(convert_command, [str(src), "-O", str(temp)])
         assert result.exit_code == 0
+
+
+def test_convert_stats(temp: Path):
+    src = ASSETS / "cli" / MODEL
+    result = runner.invoke(convert_command, [str(src), "-O", str(temp), "--stats"])
+    assert result.exit_code == 0
+    assert "Statistics" in result.output
+    assert "mcsb" in result.output
+
+
+def test_convert_quantize(temp: Path):
+    src = ASSETS / "cli" / MODEL
+    result = runner.invoke(convert_command, [str(src), "-O", str(temp), "-F", "glb", "--quantize"])
+    assert result.exit_code == 0
+    assert b"KHR_mesh_quantization" in (temp / "model_v12.glb").read_bytes()
+
+
+def test_convert_json_compact(temp: Path):
+    src = ASSETS / "cli" / "data.nbt"
+    result = runner.invoke(convert_command, [str(src), "-O", str(temp), "--json-compact", "--json-bytes", "list"])
+    assert result.exit_code == 0
+    assert b"\n" not in (temp / "data.json").read_bytes()
+
+
+def test_convert_stdin_stdout():
+    src = ASSETS / "cli" / MODEL
+    result = runner.invoke(convert_command, ["-", "-I", "mcsb", "-O", "-", "-F", "glb"], input=src.read_bytes())
+    assert result.exit_code == 0
+    assert result.stdout_bytes.startswith(b"glTF")
+
+
+def test_convert_file_stdout():
+    src = ASSETS / "cli" / TEXTURE
+    result = runner.invoke(convert_command, [str(src), "-O", "-"])
+    assert result.exit_code == 0
+    assert result.stdout_bytes.startswith(b"DDS ")
+
+
+def test_convert_stdin_output_dir(temp: Path):
+    src = ASSETS / "cli" / IMAGE
+    result = runner.invoke(convert_command, ["-", "-I", "mic", "-O", str(temp)], input=src.read_bytes())
+    assert result.exit_code == 0
+    assert (temp / "stdin.png").exists()
+
+
+def test_convert_stdin_requires_format():
+    result = runner.invoke(convert_command, ["-"], input=b"data")
+    assert result.exit_code != 0
+
+
+def test_convert_stdout_multiple_formats():
+    src = ASSETS / "cli" / MODEL
+    result = runner.invoke(convert_command, [str(src), "-O", "-", "-F", "obj", "-F", "glb"])
+    assert result.exit_code != 0
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from scfile.cli.cmd.mapcache import mapcache_command
@@ -16,6 +17,30 @@ def test_mapcache(temp: Path):
     assert (temp / "r.0.0.mca").exists()
 
 
+def test_mapcache_level(temp: Path):
+    src = ASSETS / "cli" / "mapcache"
+    stored = temp / "stored"
+    stored.mkdir()
+    result = runner.invoke(mapcache_command, [str(src), "-O", str(stored), "-W", "0", "--level", "0"])
+    assert result.exit_code == 0
+
+    compressed = temp / "compressed"
+    compressed.mkdir()
+    result = runner.invoke(mapcache_command, [str(src), "-O", str(compressed), "-W", "0", "--level", "9"])
+    assert result.exit_code == 0
+
+    assert (stored / "r.0.0.mca").stat().st_size > (compressed / "r.0.0.mca").stat().st_size
+
+
+@pytest.mark.parametrize("mode, name", [("region", "r.0.0.png"), ("world", "world.png")])
+def test_mapcache_preview(temp: Path, mode: str, name: str):
+    src = ASSETS / "cli" / "mapcache"
+    result = runner.invoke(mapcache_command, [str(src), "-O", str(temp), "--preview", mode])
+    assert result.exit_code == 0
+    assert (temp / name).read_bytes().startswith(b"\x89PNG")
+    assert not (temp / "r.0.0.mca").exists()
+
+
 def test_mapcache_auto_output(temp: Path):
     src = temp / "mapcache"
     src.mkdir()
@@ -0,0 +1,82 @@
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from scfile.convert.convert import convert
+from scfile.convert.sinks import DirectorySink, TarSink, ZipSink, archive
+from scfile.core.options import Options
+from tests.conftest import FakeDecoder, FakeEncoder
+
+
+def test_zip_sink(temp: Path):
+    src = temp / "model.mcsb"
+    src.write_bytes(b"data")
+
+    with ZipSink(temp / "out.zip") as sink:
+        convert(FakeDecoder, FakeEncoder, src, sink=sink)
+        convert(FakeDecoder, FakeEncoder, src, "sub", sink=sink)
+
+    with zipfile.ZipFile(temp / "out.zip") as file:
+        assert file.namelist() == ["model.obj", "sub/model.obj"]
+        assert file.read("sub/model.obj") == b"data"
+
+
+def test_tar_sink_stream():
+    output = io.BytesIO()
+
+    with TarSink(output, "gz") as sink:
+        sink.write(sink.reserve("a/b.obj") or "", b"data")
+
+    with tarfile.open(fileobj=io.BytesIO(output.getvalue())) as file:
+        member = file.extractfile("a/b.obj")
+        assert member and member.read() == b"data"
+
+
+def test_sink_conflicts(temp: Path):
+    src = temp / "model.mcsb"
+    src.write_bytes(b"data")
+
+    with ZipSink(temp / "out.zip") as sink:
+        convert(FakeDecoder, FakeEncoder, src, sink=sink, options=Options(on_conflict="rename"))
+        convert(FakeDecoder, FakeEncoder, src, sink=sink, options=Options(on_conflict="rename"))
+        convert(FakeDecoder, FakeEncoder, src, sink=sink, options=Options(on_conflict="skip"))
+
+    with zipfile.ZipFile(temp / "out.zip") as file:
+        assert file.namelist() == ["model.obj", "model (1).obj"]
+
+
+def test_directory_sink(temp: Path):
+    (temp / "a").mkdir()
+    (temp / "a" / "b.obj").write_bytes(b"old")
+
+    with DirectorySink(temp) as sink:
+        assert sink.reserve("a/b.obj", "skip") is None
+        assert sink.reserve("a/b.obj", "rename") == "a/b (1).obj"
+        sink.write("c/d.obj", b"data")
+
+    assert (temp / "c" / "d.obj").read_bytes() == b"data"
+
+
+class FailingSink(ZipSink):
+    def _add(self, name: str, data: bytes) -> None:
+        raise OSError("disk full")
+
+
+def test_sink_writer_error(temp: Path):
+    sink = FailingSink(temp / "out.zip")
+    sink.write("a.obj", b"data")
+
+    with pytest.raises(OSError):
+        sink.close()
+
+
+def test_archive(temp: Path):
+    for name, kind in (("out.zip", ZipSink), ("out.tar.gz", TarSink), ("out.tar", TarSink)):
+        sink = archive(temp / "nested" / name)
+        assert isinstance(sink, kind)
+        sink.close()
+
+    assert archive(temp / "out") is None
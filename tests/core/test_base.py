@@ -1,6 +1,7 @@
 import io
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from scfile.core.base import BaseFile
@@ -45,6 +46,23 @@ def test_from_file_object(temp: Path):
         f.close()
 
 
+@pytest.mark.parametrize("buffer", [bytearray(DATA), memoryview(DATA), np.frombuffer(DATA, dtype=np.uint8)])
+def test_from_buffer(buffer):
+    f = _TestFile(buffer, mode="rb")
+    assert f.read() == DATA
+    assert f.size() == len(DATA)
+    f.close()
+
+
+def test_readarray_owns_buffer_data():
+    buffer = bytearray(DATA)
+    f = _TestFile(buffer, mode="rb")
+    array = f._readarray("u1", len(DATA))
+    assert not np.shares_memory(array, np.frombuffer(buffer, dtype=np.uint8))
+    assert array.tobytes() == DATA
+    f.close()
+
+
 def test_invalid_stream_type():
     with pytest.raises(TypeError):
         _TestFile(73, mode="rb")  # type: ignore[arg-type]
@@ -97,6 +115,13 @@ def test_size_file(temp: Path):
     f.close()
 
 
+def test_size_after_write():
+    f = _TestFile(io.BytesIO(), mode="wb+")
+    assert f.size() == 0
+    f.write(DATA)
+    assert f.size() == len(DATA)
+
+
 def test_is_eof():
     f = _TestFile(DATA, mode="rb")
     assert not f.is_eof()
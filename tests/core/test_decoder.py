@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 from scfile.core.options import Options
@@ -5,6 +7,19 @@ from scfile.exceptions import EmptyFileError, InvalidSignatureError
 from tests.conftest import DATA, FakeDecoder, FakeEncoder
 
 
+class _Pipe(io.RawIOBase):
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._buffer.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
 def test_decode_parses_data():
     dec = FakeDecoder(DATA)
     data = dec.decode()
@@ -27,6 +42,32 @@ def test_decode_without_seek():
     dec.close()
 
 
+def test_decode_repeated():
+    dec = FakeDecoder(DATA)
+    first = dec.decode()
+    second = dec.decode()
+    assert first is not second
+    assert second.parsed == DATA
+    dec.close()
+
+
+def test_decode_forward():
+    stream = io.BufferedReader(_Pipe(DATA))
+    dec = FakeDecoder(stream)
+    data = dec.decode()
+    assert dec.forward
+    assert data.parsed == DATA
+    assert dec.tell() == len(DATA)
+    dec.close()
+
+
+def test_decode_forward_empty():
+    dec = FakeDecoder(io.BufferedReader(_Pipe(b"")))
+    with pytest.raises(EmptyFileError):
+        dec.decode()
+    dec.close()
+
+
 def test_decode_empty():
     dec = FakeDecoder(b"")
     with pytest.raises(EmptyFileError):
@@ -48,6 +48,14 @@ def test_save_as(temp: Path):
     enc.close()
 
 
+def test_writeto():
+    enc = FakeEncoder(FakeContent(parsed=DATA))
+    output = BytesIO()
+    assert enc.writeto(output) == len(DATA)
+    assert output.getvalue() == DATA
+    enc.close()
+
+
 def test_export_as(temp: Path):
     enc = FakeEncoder(FakeContent(parsed=DATA))
     enc.encode()
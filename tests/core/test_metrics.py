@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from scfile.core.metrics import FileMetrics, Metrics
+from scfile.core.options import Options
+from tests.conftest import DATA, FakeDecoder, FakeEncoder
+
+
+def test_decode_without_metrics():
+    with FakeDecoder(DATA) as dec:
+        dec.decode()
+        assert dec._metrics is None
+
+
+def test_decode_records():
+    metrics = Metrics()
+
+    with FakeDecoder(DATA, Options(metrics=metrics)) as dec:
+        dec.decode()
+
+    [record] = metrics.files
+    assert record.format == "mcsa"
+    assert record.operation == "decode"
+    assert record.bytes_read == len(DATA)
+    assert record.bytes_written == 0
+    assert set(record.stages) == {"prelude", "signature", "parse"}
+
+
+def test_encode_records():
+    metrics = Metrics()
+    options = Options(metrics=metrics)
+
+    with FakeDecoder(DATA, options) as dec:
+        with dec.convert_to(FakeEncoder) as enc:
+            enc.encode()
+
+    decoded, encoded = metrics.files
+    assert decoded.operation == "decode"
+    assert encoded.format == "obj"
+    assert encoded.operation == "encode"
+    assert encoded.bytes_written == len(DATA)
+    assert set(encoded.stages) == {"prelude", "transform", "signature", "serialize"}
+
+
+def test_formats_aggregated():
+    metrics = Metrics()
+    options = Options(metrics=metrics)
+
+    for _ in range(3):
+        with FakeDecoder(DATA, options) as dec:
+            dec.decode()
+
+    [summary] = metrics.formats
+    assert summary.files == 3
+    assert summary.bytes_read == len(DATA) * 3
+    assert summary.elapsed > 0
+
+
+def test_callback():
+    records: list[FileMetrics] = []
+    metrics = Metrics(callback=records.append)
+
+    with FakeDecoder(DATA, Options(metrics=metrics)) as dec:
+        dec.decode()
+
+    assert records == metrics.files
+
+
+def test_threads():
+    metrics = Metrics()
+    options = Options(metrics=metrics)
+
+    def decode(_):
+        with FakeDecoder(DATA, options) as dec:
+            dec.decode()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(decode, range(64)))
+
+    assert len(metrics) == 64
+    assert metrics.formats[0].files == 64
+
+
+def test_reset():
+    metrics = Metrics()
+
+    with FakeDecoder(DATA, Options(metrics=metrics)) as dec:
+        dec.decode()
+
+    metrics.reset()
+    assert len(metrics) == 0
+    assert metrics.formats == []
@@ -0,0 +1,39 @@
+import threading
+
+import pytest
+
+from scfile.core import parallel
+
+
+@pytest.mark.parametrize("workers", [None, 0, 1, 4])
+def test_imap_order(workers):
+    assert parallel.imap(lambda x: x * 2, list(range(100)), workers) == [x * 2 for x in range(100)]
+
+
+def test_imap_sequential():
+    threads: set[int] = set()
+    parallel.imap(lambda _: threads.add(threading.get_ident()), list(range(10)), 0)
+    assert threads == {threading.get_ident()}
+
+
+def test_imap_error():
+    def fail(x: int) -> int:
+        raise ValueError(x)
+
+    with pytest.raises(ValueError):
+        parallel.imap(fail, [1, 2, 3], 2)
+
+
+def test_imap_shared():
+    assert parallel.shared() is parallel.shared()
+
+
+def test_imap_nested_sequential():
+    # Nested calls on shared threads run inline instead of waiting on busy pool
+    def outer(_: int) -> set[int]:
+        threads: set[int] = set()
+        parallel.imap(lambda _: threads.add(threading.get_ident()), list(range(10)))
+        return threads
+
+    for threads in parallel.imap(outer, list(range(64))):
+        assert len(threads) == 1
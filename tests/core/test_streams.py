@@ -0,0 +1,160 @@
+import io
+import mmap
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scfile.core import Options
+from scfile.core.streams import BufferStream, ForwardStream, SourceRange
+from scfile.formats import McsbDecoder
+from tests.conftest import ASSETS, DATA
+
+
+def test_read():
+    stream = BufferStream(bytearray(DATA))
+    assert stream.read(2) == DATA[:2]
+    assert stream.read() == DATA[2:]
+    assert stream.read() == b""
+
+
+def test_readview_zero_copy():
+    buffer = bytearray(DATA)
+    stream = BufferStream(buffer)
+    view = stream.readview(2)
+    buffer[0] = 0
+    assert view[0] == 0
+    assert view.readonly
+
+
+def test_seek():
+    stream = BufferStream(memoryview(DATA))
+    assert stream.seek(0, io.SEEK_END) == len(DATA)
+    assert stream.seek(-1, io.SEEK_CUR) == len(DATA) - 1
+    assert stream.read() == DATA[-1:]
+
+    with pytest.raises(ValueError):
+        stream.seek(-1)
+
+
+def test_readinto():
+    stream = BufferStream(DATA)
+    target = bytearray(len(DATA) + 2)
+    assert stream.readinto(target) == len(DATA)
+    assert bytes(target[: len(DATA)]) == DATA
+
+
+def test_ndarray():
+    array = np.arange(4, dtype=np.uint16)
+    stream = BufferStream(array)
+    assert stream.read() == array.tobytes()
+
+
+def test_mmap(temp: Path):
+    path = temp / "file.bin"
+    path.write_bytes(DATA)
+
+    with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        stream = BufferStream(mapped)
+        assert stream.read() == DATA
+        del stream
+
+
+def test_mmap_close_after_decode():
+    path = ASSETS / "cli" / "model_v12.mcsb"
+
+    with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with McsbDecoder(mapped, Options(skeleton=True)) as src:
+            data = src.decode()
+
+        mapped.close()
+        assert mapped.closed
+
+    # Deferred attributes own their data, source is already unmapped
+    assert data.scene.meshes[0].vertices.size > 0
+
+
+def test_not_buffer():
+    with pytest.raises(TypeError):
+        BufferStream("data")
+
+
+class _Pipe(io.RawIOBase):
+    """Non-seekable stream returning short reads."""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._buffer.read(min(len(buffer), 3))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+LONG = bytes(range(64))
+
+
+def test_forward_read():
+    stream = ForwardStream(_Pipe(LONG))
+    assert stream.read(10) == LONG[:10]
+    assert stream.tell() == 10
+    assert stream.read() == LONG[10:]
+
+
+def test_forward_skip():
+    stream = ForwardStream(_Pipe(LONG))
+    assert stream.skip(20) == 20
+    assert stream.read(1) == LONG[20:21]
+    assert stream.seek(30) == 30
+    assert stream.seek(2, io.SEEK_CUR) == 32
+    assert stream.read(1) == LONG[32:33]
+
+
+def test_forward_seek_backward():
+    stream = ForwardStream(_Pipe(LONG))
+    stream.read(4)
+
+    with pytest.raises(io.UnsupportedOperation):
+        stream.seek(0)
+
+    with pytest.raises(io.UnsupportedOperation):
+        stream.seek(0, io.SEEK_END)
+
+
+def test_forward_eof():
+    stream = ForwardStream(_Pipe(LONG))
+    assert not stream.at_eof()
+    assert stream.read(1) == LONG[:1]
+    stream.skip(len(LONG))
+    assert stream.at_eof()
+    assert stream.tell() == len(LONG)
+
+
+def test_forward_peek():
+    stream = ForwardStream(_Pipe(LONG))
+    assert stream.peek(8) == LONG[:8]
+    assert stream.read(2) == LONG[:2]
+    assert stream.read(10) == LONG[2:12]
+    assert stream.tell() == 12
+
+
+def test_source_range_file(temp: Path):
+    src = temp / "source"
+    src.write_bytes(LONG)
+
+    with open(src, "rb") as source, open(temp / "target", "wb+") as target:
+        target.write(b"head")
+        assert SourceRange(source, 8, 16).copy_to(target) == 16
+        target.write(b"tail")
+
+    assert (temp / "target").read_bytes() == b"head" + LONG[8:24] + b"tail"
+
+
+def test_source_range_buffer():
+    target = io.BytesIO()
+    assert SourceRange(BufferStream(LONG), 60, 16).copy_to(target) == 4
+    assert target.getvalue() == LONG[60:]
+    assert SourceRange(BufferStream(LONG), 2, 3).read() == LONG[2:5]
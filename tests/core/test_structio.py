@@ -141,3 +141,11 @@ def test_writeutf8_roundtrip():
     sio._writeutf8("test")
     sio._buf.seek(0)
     assert sio._buf.read() == b"test"
+
+
+def test_writearray():
+    s = _TestStructIO()
+    array = np.arange(6, dtype="<u2").reshape(2, 3)
+    s._writearray(array[:, 1:])
+    s._writearray(np.array([1.0], dtype=">f4"))
+    assert s._buf.getvalue() == array[:, 1:].tobytes() + b"\x3f\x80\x00\x00"
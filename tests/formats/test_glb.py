@@ -0,0 +1,144 @@
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from scfile.core import ModelContent, Options
+from scfile.formats.glb import GlbEncoder
+from scfile.formats.glb.enums import ComponentType
+from scfile.formats.glb.quantize import EXTENSION
+from scfile.formats.mcsb import McsbDecoder
+from tests.conftest import ASSETS
+
+
+def _encode(source: str, options: Options) -> tuple[ModelContent, dict, bytes]:
+    with McsbDecoder(ASSETS / "source" / source, options) as dec:
+        data = dec.decode()
+        with dec.convert_to(GlbEncoder) as enc:
+            output = enc.getvalue()
+
+    size = struct.unpack_from("<I", output, 12)[0]
+    gltf = json.loads(output[20 : 20 + size])
+    binary = output[20 + size + 8 :]
+    return data, gltf, binary
+
+
+def _read(gltf: dict, binary: bytes, index: int, dtype: str, units: int) -> np.ndarray:
+    accessor = gltf["accessors"][index]
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    itemsize = np.dtype(dtype).itemsize
+    stride = view.get("byteStride", units * itemsize) // itemsize
+
+    data = np.frombuffer(binary, dtype=dtype, count=accessor["count"] * stride, offset=view["byteOffset"])
+    return data.reshape(-1, stride)[:, :units]
+
+
+def test_quantize_disabled():
+    _, gltf, _ = _encode("model/model_v12", Options())
+    assert "extensionsRequired" not in gltf
+    assert all(accessor.get("normalized") is None for accessor in gltf["accessors"])
+
+
+@pytest.mark.parametrize("version", [7, 10, 12])
+def test_quantize_positions(version: int):
+    data, gltf, binary = _encode(f"model/model_v{version}", Options(quantize=True))
+    assert gltf["extensionsUsed"] == [EXTENSION]
+    assert gltf["extensionsRequired"] == [EXTENSION]
+
+    for index, mesh in enumerate(data.scene.meshes):
+        node = gltf["nodes"][index]
+        primitive = gltf["meshes"][index]["primitives"][0]
+        accessor = gltf["accessors"][primitive["attributes"]["POSITION"]]
+        assert accessor["componentType"] == ComponentType.SHORT
+        assert accessor["normalized"]
+
+        positions = _read(gltf, binary, primitive["attributes"]["POSITION"], "<i2", 3)
+        restored = positions / 0x7FFF * node["scale"][0]
+        assert np.allclose(restored, mesh.vertices, atol=node["scale"][0] / 0x7FFF)
+
+
+def test_quantize_positions_bounds():
+    _, gltf, binary = _encode("model/model_v12", Options(quantize=True))
+
+    for mesh in gltf["meshes"]:
+        index = mesh["primitives"][0]["attributes"]["POSITION"]
+        positions = _read(gltf, binary, index, "<i2", 3)
+        assert gltf["accessors"][index]["min"] == positions.min(axis=0).tolist()
+        assert gltf["accessors"][index]["max"] == positions.max(axis=0).tolist()
+
+
+def test_quantize_normals():
+    data, gltf, binary = _encode("model/model_v12", Options(quantize=True))
+    primitive = gltf["meshes"][0]["primitives"][0]
+
+    normals = _read(gltf, binary, primitive["attributes"]["NORMAL"], "i1", 3)
+    assert np.allclose(normals / 0x7F, data.scene.meshes[0].normals, atol=1 / 0x7F)
+
+
+def test_quantize_skinned_positions_float():
+    _, gltf, _ = _encode("model/model_v12", Options(quantize=True, skeleton=True))
+    skinned = [node for node in gltf["nodes"] if "skin" in node]
+    assert skinned
+
+    for node in skinned:
+        primitive = gltf["meshes"][node["mesh"]]["primitives"][0]
+        accessor = gltf["accessors"][primitive["attributes"]["POSITION"]]
+        assert accessor["componentType"] == ComponentType.FLOAT
+        assert "scale" not in node
+
+
+def test_quantize_reuses_raw():
+    with McsbDecoder(ASSETS / "source" / "model/model_v12", Options(quantize=True)) as dec:
+        data = dec.decode()
+        raw = [mesh.quantized["vertices"].data for mesh in data.scene.meshes]
+
+        with GlbEncoder(data, Options(quantize=True)) as enc:
+            output = enc.getvalue()
+
+    size = struct.unpack_from("<I", output, 12)[0]
+    gltf = json.loads(output[20 : 20 + size])
+    binary = output[20 + size + 8 :]
+
+    for index, mesh in enumerate(data.scene.meshes):
+        primitive = gltf["meshes"][index]["primitives"][0]
+        positions = _read(gltf, binary, primitive["attributes"]["POSITION"], "<i2", 3)
+        assert np.array_equal(positions, raw[index][:, :3])
+        assert "vertices" not in mesh.__dict__
+
+
+def test_quantize_edited_after_access():
+    with McsbDecoder(ASSETS / "source" / "model/model_v12", Options(quantize=True)) as dec:
+        data = dec.decode()
+
+    mesh = data.scene.meshes[0]
+    mesh.vertices[:] = 0.5
+    mesh.uv1[:] = 0.25
+
+    with GlbEncoder(data, Options(quantize=True)) as enc:
+        output = enc.getvalue()
+
+    size = struct.unpack_from("<I", output, 12)[0]
+    gltf = json.loads(output[20 : 20 + size])
+    binary = output[20 + size + 8 :]
+
+    attributes = gltf["meshes"][0]["primitives"][0]["attributes"]
+    positions = _read(gltf, binary, attributes["POSITION"], "<i2", 3) / 0x7FFF * gltf["nodes"][0]["scale"][0]
+    uv = _read(gltf, binary, attributes["TEXCOORD_0"], "<i2", 2) / 0x7FFF
+    assert np.allclose(positions, 0.5, atol=1e-3)
+    assert np.allclose(uv, 0.25, atol=1e-3)
+
+
+@pytest.mark.parametrize("quantized", [False, True])
+def test_chunk_sizes(quantized: bool):
+    with McsbDecoder(ASSETS / "source" / "model/model_v12", Options(skeleton=True, quantize=quantized)) as dec:
+        output = dec.convert(GlbEncoder)
+
+    total = struct.unpack_from("<I", output, 8)[0]
+    json_size = struct.unpack_from("<I", output, 12)[0]
+    bin_size, bin_type = struct.unpack_from("<I4s", output, 20 + json_size)
+    gltf = json.loads(output[20 : 20 + json_size])
+
+    assert total == len(output)
+    assert bin_type == b"BIN\0"
+    assert bin_size == gltf["buffers"][0]["byteLength"] == len(output) - 28 - json_size
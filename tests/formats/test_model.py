@@ -1,11 +1,12 @@
 from io import BytesIO
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from scfile.core import Options
 from scfile.core.types import ModelEncoder
-from scfile.exceptions import LimitError
+from scfile.exceptions import InvalidStructureError, LimitError
 from scfile.formats.dae import DaeEncoder
 from scfile.formats.efkmodel import EfkmodelDecoder
 from scfile.formats.fbx import FbxEncoder
@@ -49,6 +50,30 @@ def test_model_special(path: Path, encoder: ModelEncoder):
     assert source == output
 
 
+@pytest.mark.parametrize("version", VERSIONS)
+def test_model_stream(version: int):
+    src = ASSETS / "source" / "model" / f"model_v{version}"
+    expected = (ASSETS / "output" / "model" / f"model_v{version}.obj").read_bytes()
+
+    with McsbDecoder(src, OPTIONS) as dec:
+        with dec.stream_to(ObjEncoder) as enc:
+            assert enc.getvalue() == expected
+
+
+def test_model_stream_meshes():
+    src = ASSETS / "source" / "model" / "model_v12"
+
+    with McsbDecoder(src) as dec:
+        meshes = dec.iter_meshes()
+        assert dec.data.scene.meshes == []
+
+        names = [mesh.name for mesh in meshes]
+        assert dec.data.scene.meshes == []
+
+    with McsbDecoder(src) as dec:
+        assert names == [mesh.name for mesh in dec.decode().scene.meshes]
+
+
 @pytest.mark.parametrize("name", ["model_v12_links2", "model_v12_links3"])
 def test_skip_links(name: str):
     src = ASSETS / "source" / "model" / "special" / name
@@ -75,6 +100,21 @@ def test_efkmodel(encoder: ModelEncoder):
     assert source == output
 
 
+def test_model_attributes():
+    src = ASSETS / "source" / "model/model_v12"
+
+    with McsbDecoder(src) as dec:
+        full = dec.decode()
+        selected = dec.decode(attributes=ObjEncoder.attributes)
+
+    for full_mesh, mesh in zip(full.scene.meshes, selected.scene.meshes):
+        assert len(mesh.uv2) == 0
+        assert len(mesh.tangents) == 0
+        assert np.array_equal(mesh.uv1, full_mesh.uv1)
+        assert np.array_equal(mesh.normals, full_mesh.normals)
+        assert np.array_equal(mesh.polygons, full_mesh.polygons)
+
+
 def test_animodel():
     src = ASSETS / "source" / "model/animodel_v12"
 
@@ -89,6 +129,12 @@ def test_invalid_version():
         McsbDecoder(ASSETS / "invalid" / "unsuported.mcsb").decode()
 
 
+def test_truncated_mesh():
+    data = (ASSETS / "source" / "model/model_v12").read_bytes()
+    with pytest.raises(InvalidStructureError):
+        McsbDecoder(data[: len(data) // 2]).decode()
+
+
 def test_invalid_counts():
     with pytest.raises(LimitError):
         McsbDecoder(ASSETS / "invalid" / "counts.mcsb").decode()
@@ -1,5 +1,14 @@
+import base64
+import io
+import json
+
+import pytest
+import zstandard
+
+from scfile.core import Options
+from scfile.core.options import JsonBytes
 from scfile.formats.json import JsonEncoder
-from scfile.formats.nbt import NbtDecoder, nbt
+from scfile.formats.nbt import NbtDecoder, nbt, query
 from scfile.formats.nbt.enums import Tag
 from tests.conftest import ASSETS
 
@@ -63,3 +72,109 @@ def test_compound():
 def test_lst():
     output = b"\x09\x00\x04list\x03\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02"
     assert nbt.lst(b"list", Tag.INT, b"\x00\x00\x00\x01", b"\x00\x00\x00\x02") == output
+
+
+def test_select():
+    src = ASSETS / "source" / "nbt" / "nbt_gzip"
+    with NbtDecoder(src) as dec:
+        value = dec.decode().value
+        selected = dec.select("int", "list_compound[1].y", "compound.compound.compound.list[1].k2", "missing")
+
+    assert selected == {
+        "int": value["int"],
+        "list_compound[1].y": "second",
+        "compound.compound.compound.list[1].k2": "v2",
+    }
+
+
+def test_select_nested():
+    src = ASSETS / "source" / "nbt" / "nbt"
+    with NbtDecoder(src) as dec:
+        selected = dec.select("list_compound", "list_compound[2].count", "list_compound[9]")
+
+    assert selected["list_compound[2].count"] == 999
+    assert selected["list_compound"][2] == {"flag": 1, "count": 999}
+    assert "list_compound[9]" not in selected
+
+
+def test_events():
+    src = ASSETS / "source" / "nbt" / "nbt_zstd"
+    with NbtDecoder(src) as dec:
+        events = dict(dec.events())
+        value = dec.decode().value
+
+    assert events["byte"] == value["byte"]
+    assert events["list_int[0]"] == value["list_int"][0]
+    assert events["list_compound[0].b"] == "first"
+    assert events["compound.compound.compound.list[0].k"] == "v"
+    assert not any(isinstance(item, dict) for item in events.values())
+
+
+def test_query_parse():
+    assert query.parse("a.b[3].c") == ("a", "b", 3, "c")
+    assert query.parse("a[0][1]") == ("a", 0, 1)
+    assert query.format(("a", "b", 3, "c")) == "a.b[3].c"
+
+
+@pytest.mark.parametrize("path", ["a..b", "a[x]", "a.", "a.[0]", "a[0]b"])
+def test_query_invalid(path: str):
+    with pytest.raises(ValueError):
+        query.parse(path)
+
+
+def test_json_compact():
+    source, output = extract(NbtDecoder, JsonEncoder, "nbt/nbt", "nbt/nbt", Options(json_compact=True))
+    assert b"\n" not in source
+    assert json.loads(source) == json.loads(output)
+
+
+@pytest.mark.parametrize("mode", ["base64", "list"])
+def test_json_bytes(mode: JsonBytes):
+    with NbtDecoder(ASSETS / "source" / "nbt" / "nbt", Options(json_bytes=mode)) as dec:
+        data = dec.decode()
+        output = json.loads(dec.convert(JsonEncoder))
+
+    array = data.value["byte_array"]
+    assert output["byte_array"] == (base64.b64encode(array).decode() if mode == "base64" else list(array))
+
+
+def test_json_chunks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(JsonEncoder, "CHUNK_SIZE", 16)
+    source, output = extract(NbtDecoder, JsonEncoder, "nbt/nbt", "nbt/nbt")
+    assert source == output
+
+
+class _Pipe(io.RawIOBase):
+    """Non-seekable stream returning short reads."""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._buffer.read(min(len(buffer), 5))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+@pytest.mark.parametrize("name", ["nbt", "nbt_gzip", "nbt_zstd"])
+def test_nbt_forward(name: str):
+    source = (ASSETS / "source" / "nbt" / name).read_bytes()
+    with NbtDecoder(_Pipe(source)) as dec:
+        assert dec.forward
+        output = dec.convert(JsonEncoder)
+
+    assert output == (ASSETS / "output" / "nbt" / "nbt").read_bytes()
+
+
+def test_nbt_zstd_frames():
+    raw = (ASSETS / "source" / "nbt" / "nbt").read_bytes()
+    middle = len(raw) // 2
+    compressor = zstandard.ZstdCompressor()
+
+    with NbtDecoder(compressor.compress(raw[:middle]) + compressor.compress(raw[middle:])) as dec:
+        output = dec.convert(JsonEncoder)
+
+    assert output == (ASSETS / "output" / "nbt" / "nbt").read_bytes()
@@ -1,6 +1,13 @@
+import zlib
+
+import numpy as np
+import pytest
+
 from scfile import Options
-from scfile.formats.mca import McaEncoder
+from scfile.formats.mca import McaEncoder, palette
 from scfile.formats.mdat import MdatDecoder
+from scfile.formats.nbt.io import NbtBufferIO
+from tests.conftest import ASSETS
 
 from .conftest import extract
 
@@ -17,3 +24,103 @@ def test_region_full_smoke():
     out = "region/region"
     source, output = extract(MdatDecoder, McaEncoder, src, out, Options(full_chunk=True))
     assert source == output
+
+
+def _chunks(content: bytes) -> list[bytes]:
+    chunks: list[bytes] = []
+    for idx in range(0, 4096, 4):
+        location = int.from_bytes(content[idx : idx + 4], "big")
+        if location:
+            start = (location >> 8) * 4096
+            length = int.from_bytes(content[start : start + 4], "big")
+            chunks.append(zlib.decompress(content[start + 5 : start + 4 + length]))
+    return chunks
+
+
+def test_region_sequential():
+    src = "region/region"
+    out = "region/region"
+    source, output = extract(MdatDecoder, McaEncoder, src, out, Options(chunk_workers=0))
+    assert source == output
+
+
+@pytest.mark.parametrize("level", [0, 1, 9])
+def test_region_compression_level(level: int):
+    src = "region/region"
+    out = "region/region"
+    source, output = extract(MdatDecoder, McaEncoder, src, out, Options(compression_level=level))
+    assert _chunks(source) == _chunks(output)
+
+
+@pytest.mark.parametrize("full_chunk", [False, True])
+def test_region_parallel_decode(full_chunk: bool):
+    src = ASSETS / "source" / "region" / "region"
+
+    with MdatDecoder(src, Options(full_chunk=full_chunk, chunk_workers=0)) as dec:
+        sequential = dec.decode()
+
+    with MdatDecoder(src, Options(full_chunk=full_chunk, chunk_workers=4)) as dec:
+        threaded = dec.decode()
+
+    assert sequential.chunks == threaded.chunks
+
+
+def test_region_chunk_fields():
+    src = ASSETS / "source" / "region" / "region"
+
+    with MdatDecoder(src, Options(full_chunk=True)) as dec:
+        chunk = dec.decode().chunks[0]
+
+    assert all(isinstance(value, bytes) for value in (chunk.blocks, chunk.meta, chunk.light, chunk.add, chunk.extra))
+    assert len(chunk.blocks) + len(chunk.meta) + len(chunk.light) + len(chunk.add) + len(chunk.extra) == (
+        chunk.header.full_size - 20
+    )
+
+
+@pytest.mark.parametrize("size", [4, 5, 9, 12])
+def test_palette_pack(size: int):
+    indices = np.random.default_rng(size).integers(0, 1 << size, 4096, dtype=np.uint64)
+    longs = palette.pack(indices, size).astype(np.uint64)
+
+    per_long = 64 // size
+    assert len(longs) == -(-4096 // per_long)
+
+    shifts = np.arange(per_long, dtype=np.uint64) * np.uint64(size)
+    unpacked = (longs[:, np.newaxis] >> shifts) & np.uint64((1 << size) - 1)
+    assert np.array_equal(unpacked.reshape(-1)[:4096], indices)
+
+
+def test_palette_bits():
+    assert palette.bits(1) == 4
+    assert palette.bits(16) == 4
+    assert palette.bits(17) == 5
+
+
+def test_region_palette():
+    src = ASSETS / "source" / "region" / "region"
+
+    with MdatDecoder(src, Options(palette=True)) as dec:
+        data = dec.decode()
+        with McaEncoder(data, Options(palette=True)) as enc:
+            content = enc.getvalue()
+
+    chunks = _chunks(content)
+    assert len(chunks) == len(data.chunks)
+
+    stream = NbtBufferIO(chunks[0])
+    tag = stream._read_tag()
+    stream._readutf8()
+    root = stream._parse_tag(tag)
+
+    assert root["DataVersion"] == palette.DATA_VERSION
+    assert root["Level"]["Status"] == "full"
+
+    section = root["Level"]["Sections"][0]
+    assert all(entry["Name"].startswith("minecraft:") for entry in section["Palette"])
+    assert "Blocks" not in section
+    assert "SkyLight" not in section
+
+    legacy = [
+        len(chunk) for chunk in _chunks(extract(MdatDecoder, McaEncoder, "region/region", "region/region").source)
+    ]
+    assert sum(map(len, chunks)) < sum(legacy)
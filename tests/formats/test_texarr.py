@@ -1,8 +1,14 @@
+import io
 import zipfile
 from io import BytesIO
+from pathlib import Path
 
+import pytest
+
+from scfile.exceptions import InvalidStructureError
 from scfile.formats.texarr import TexarrDecoder
 from scfile.formats.zip import TexarrEncoder
+from tests.conftest import ASSETS
 
 from .conftest import extract
 
@@ -16,3 +22,60 @@ def test_texarr():
         assert z1.namelist() == z2.namelist()
         for name in z1.namelist():
             assert z1.read(name) == z2.read(name)
+
+
+def test_texarr_index():
+    with TexarrDecoder(ASSETS / "source" / "texarr" / "texarr") as dec:
+        entries = dec.index()
+        textures = dict(dec.decode().textures)
+
+    assert [entry.path for entry in entries] == list(textures)
+    assert [entry.size for entry in entries] == [len(texture) for texture in textures.values()]
+
+
+def test_texarr_load():
+    with TexarrDecoder(ASSETS / "cli" / "blocks.texarr") as dec:
+        entry = dec.entries("floor*")[0]
+        assert dec.load(entry) == dict(dec.decode().textures)["floor.dds"]
+
+
+def test_texarr_extract(temp: Path):
+    with TexarrDecoder(ASSETS / "cli" / "blocks.texarr") as dec:
+        paths = dec.extract(temp, pattern="*l*.dds")
+        textures = dict(dec.decode().textures)
+        assert dec.extract(temp, pattern="missing*") == []
+
+    assert sorted(path.name for path in paths) == ["ceiling.dds", "floor.dds", "wall.dds"]
+    assert all(path.read_bytes() == textures[path.name] for path in paths)
+
+
+@pytest.mark.parametrize("name", [b"..:ab", b"..\\ab", b"a\\..\\..\\ab", b"\\\\host\\share\\ab"])
+def test_texarr_extract_unsafe(temp: Path, name: bytes):
+    source = b"\x00\x00\x00\x01" + len(name).to_bytes(2, "big") + name + b"\x00\x00\x00\x02" + b"dd"
+    with TexarrDecoder(source) as dec:
+        with pytest.raises(InvalidStructureError):
+            dec.extract(temp)
+
+    assert not any(temp.rglob("*.dds"))
+
+
+class _Pipe(io.RawIOBase):
+    """Non-seekable stream."""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._buffer.readinto(buffer)
+
+
+def test_texarr_index_forward(temp: Path):
+    source = (ASSETS / "source" / "texarr" / "texarr").read_bytes()
+    with TexarrDecoder(_Pipe(source)) as dec:
+        with pytest.raises(io.UnsupportedOperation):
+            dec.index()
+        with pytest.raises(io.UnsupportedOperation):
+            dec.extract(temp)
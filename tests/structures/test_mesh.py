@@ -0,0 +1,82 @@
+import numpy as np
+
+from scfile.structures import models as S
+from scfile.structures.models import transforms as T
+
+
+def _attribute(**kwargs) -> S.QuantizedAttribute:
+    data = np.array([[0x7FFF, 0, -0x7FFF, 1], [0, 0x7FFF, 0, 1]], dtype=np.int16)
+    return S.QuantizedAttribute(data, factor=0x7FFF, **kwargs)
+
+
+def _mesh() -> S.ModelMesh:
+    mesh = S.ModelMesh()
+    mesh.defer("vertices", _attribute(scale=2.0, columns=3))
+    return mesh
+
+
+def test_dequantize():
+    values = _attribute(scale=2.0, columns=3).dequantize()
+    assert values.dtype == np.float32
+    assert np.allclose(values, [[2.0, 0.0, -2.0], [0.0, 2.0, 0.0]])
+
+
+def test_dequantize_finalize():
+    values = _attribute(finalize=np.negative).dequantize()
+    assert np.allclose(values[0, :3], [-1.0, 0.0, 1.0])
+
+
+def test_max_influences_cached():
+    mesh = S.ModelMesh(links_weights=np.array([[1.0, 0, 0, 0]], dtype=np.float32))
+    assert mesh.max_influences == 1
+
+    mesh.links_weights[0, 1] = 1.0
+    assert mesh.max_influences == 1
+
+    mesh.links_weights = np.array([[0.5, 0.5, 0, 0]], dtype=np.float32)
+    assert mesh.max_influences == 2
+
+
+def test_deferred_access():
+    mesh = _mesh()
+    assert "vertices" not in mesh.__dict__
+
+    vertices = mesh.vertices
+    assert vertices.shape == (2, 3)
+    assert mesh.vertices is vertices
+    assert "vertices" in mesh.quantized
+
+
+def test_assign_drops_raw():
+    mesh = _mesh()
+    mesh.vertices = np.zeros((4, 3), dtype=np.float32)
+    assert "vertices" not in mesh.quantized
+    assert mesh.count_vertices == 4
+
+
+def test_count_vertices_deferred():
+    mesh = _mesh()
+    scene = S.ModelScene(meshes=[mesh, mesh])
+
+    assert mesh.count_vertices == 2
+    assert scene.total_vertices == 4
+    assert "vertices" not in mesh.__dict__
+
+
+def test_copy_keeps_deferred():
+    mesh = _mesh()
+    copied = mesh.copy()
+    copied.vertices = np.zeros((0, 3), dtype=np.float32)
+
+    assert "vertices" not in copied.quantized
+    assert "vertices" in mesh.quantized
+    assert len(mesh.vertices) == 2
+
+
+def test_transform_keeps_deferred():
+    scene = S.ModelScene(meshes=[_mesh(), _mesh()])
+    result = T.unique_names(scene)
+
+    for mesh in result.meshes:
+        assert "vertices" not in mesh.__dict__
+        assert mesh.count_vertices == 2
@@ -24,6 +24,20 @@ def test_unique_names_duplicates():
     assert [m.name for m in result.meshes] == ["mesh", "mesh_2", "mesh_3"]
 
 
+def test_stream_unique_names_lazy():
+    def meshes():
+        yield S.ModelMesh(name="mesh")
+        raise AssertionError("Second mesh requested too early")
+
+    stream = T.stream_unique_names(meshes())
+    assert next(stream).name == "mesh"
+
+
+def test_stream_unique_names_across_meshes():
+    stream = T.stream_unique_names(S.ModelMesh(name="mesh") for _ in range(3))
+    assert [m.name for m in stream] == ["mesh", "mesh_2", "mesh_3"]
+
+
 def test_unique_names_empty_name():
     scene = S.ModelScene(meshes=[S.ModelMesh(name="")])
     result = T.unique_names(scene)
@@ -10,6 +10,7 @@ def test_strings():
     assert str(exceptions.InvalidSignatureError("test.txt", b"\x00", b"\x01"))
     assert str(exceptions.RegionFileError("reg.0.0.mdat"))
     assert str(exceptions.MergeInterrupted())
+    assert str(exceptions.ConvertInterrupted())
     assert str(exceptions.LimitError("model.mcsa", "vertices", 0x7FFFFFFF, 1_000_000))
     assert str(McsaVersionUnsupported("model.mcsa", 99.0))
     assert str(Ms3dCountsLimit("vertices", 0x7FFFFFFF, 512))
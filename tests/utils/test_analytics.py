@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from scfile import Options
+from scfile.core import RegionContent
+from scfile.structures.regions import ChunkHeader, RegionChunk
+from scfile.utils import analytics, regions
+from tests.conftest import ASSETS
+
+
+def _content() -> RegionContent:
+    # Chunk (1, 1) with sections at Y 0 and 2
+    volume = np.zeros((2, 16, 16, 16), dtype=np.uint8)
+    volume[0, 0] = 1
+    volume[1, 5, 3, 4] = 7
+
+    chunk = RegionChunk(index=33, header=ChunkHeader(blocks_mask=0b101), blocks=volume.tobytes())
+    return RegionContent(rx=1, rz=-1, chunks=[chunk])
+
+
+def test_chunk_volume():
+    chunk = _content().chunks[0]
+    assert chunk.volume.shape == (2, 16, 16, 16)
+    assert chunk.volume[1, 5, 3, 4] == 7
+    assert chunk.sections.tolist() == [0, 2]
+
+
+def test_histogram():
+    counts = analytics.histogram(_content())
+    assert counts[1] == 256
+    assert counts[7] == 1
+    assert counts.sum() == 2 * 4096
+
+
+def test_histogram_lookup():
+    lookup = np.arange(256, dtype=np.uint8)
+    lookup[7] = 0
+    counts = analytics.histogram(_content(), lookup)
+    assert counts[7] == 0
+
+
+def test_columns():
+    result = analytics.columns(_content())
+    assert result.heights.shape == (512, 512)
+
+    assert result.heights[16 + 3, 16 + 4] == 2 * 16 + 5
+    assert result.blocks[16 + 3, 16 + 4] == 7
+    assert result.heights[16, 16] == 0
+    assert result.blocks[16, 16] == 1
+
+    assert result.heights[0, 0] == -1
+    assert (result.heights >= 0).sum() == 256
+
+
+def test_bounds():
+    box = analytics.bounds(_content())
+    assert box == analytics.Bounds(min=(528, 0, -496), max=(543, 37, -481))
+
+
+def test_bounds_empty():
+    assert analytics.bounds(RegionContent()) is None
+
+
+def test_coverage():
+    present = analytics.coverage(_content())
+    assert present.sum() == 1
+    assert present[1, 1]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_analyze(workers: int):
+    mapping = regions.parse([ASSETS / "cli" / "mapcache" / "r.0.0.mdat"])
+    stats = analytics.analyze(mapping, Options(chunk_workers=0), workers=workers)
+
+    assert stats.chunks == 222
+    assert stats.histogram.sum() == sum(
+        len(chunk.blocks) for chunk in regions.load((0, 0), mapping[(0, 0)], Options()).chunks
+    )
+    assert stats.bounds is not None
+    assert stats.regions[(0, 0)].coverage.sum() == 222
@@ -0,0 +1,20 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from scfile.utils import archives
+
+
+def test_reader_closed(temp: Path):
+    path = temp / "assets.zip"
+    with zipfile.ZipFile(path, "w") as file:
+        file.writestr("a.mcsa", b"data")
+
+    entry = next(archives.entries(str(path), (".mcsa",)))
+
+    with archives.ArchiveReader() as reader:
+        assert reader.load(entry) == b"data"
+
+    with pytest.raises(ValueError):
+        reader.load(entry)
@@ -1,9 +1,11 @@
 import os
 import sys
+import zipfile
 from pathlib import Path
 from unittest.mock import patch
 
-from scfile.utils.files import destination, resolve, resource, walk
+from scfile.types import FileEntry
+from scfile.utils.files import destination, entry_destination, resolve, resource, walk
 
 
 def test_destination():
@@ -13,6 +15,13 @@ def test_destination():
     assert destination("a/b.txt", False, None) is None
 
 
+def test_entry_destination():
+    member = FileEntry("assets.zip", os.path.join("assets.zip", "a", "b.mcsa"), os.path.join("a", "b.mcsa"), "a/b.mcsa")
+    assert entry_destination(member, True, "out") == os.path.join("out", "a")
+    assert entry_destination(member, False, None) == ""
+    assert entry_destination(FileEntry("b.mcsa", "b.mcsa", "b.mcsa"), False, None) is None
+
+
 def test_resolve(temp: Path):
     a = temp / "a.mcsa"
     b = temp / "b.mcsa"
@@ -111,3 +120,40 @@ def test_walk_permission_error(temp: Path):
         names = {os.path.basename(e.path) for e in result}
         assert "b.mcsa" in names
         assert "a.mcsa" not in names
+
+
+def test_walk_archive(temp: Path):
+    archive = temp / "assets.zip"
+    with zipfile.ZipFile(archive, "w") as file:
+        file.writestr("armor/a.mcsa", b"")
+        file.writestr("b.txt", b"")
+        file.writestr("../c.mcsb", b"")
+
+    result = sorted(walk([archive]), key=lambda entry: entry.relpath)
+    assert [entry.member for entry in result] == ["armor/a.mcsa", "../c.mcsb"]
+    assert [entry.relpath for entry in result] == [os.path.join("armor", "a.mcsa"), "c.mcsb"]
+    assert result[0].path == os.path.join(str(archive.resolve()), "armor", "a.mcsa")
+
+    result = list(walk([archive], whitelist=[".mcsa"], parent=True))
+    assert [entry.relpath for entry in result] == [os.path.join("assets", "armor", "a.mcsa")]
+
+
+def test_walk_archive_in_dir(temp: Path):
+    (temp / "pack").mkdir()
+    (temp / "b.mcsb").write_bytes(b"")
+
+    archive = temp / "pack" / "assets.pak"
+    with zipfile.ZipFile(archive, "w") as file:
+        file.writestr("armor/a.mcsa", b"")
+        file.writestr("c.txt", b"")
+
+    result = sorted(walk([temp]), key=lambda entry: entry.relpath)
+    assert [entry.relpath for entry in result] == [
+        "b.mcsb",
+        os.path.join("pack", "assets", "armor", "a.mcsa"),
+    ]
+
+    nested = result[1]
+    assert nested.root == str(archive.resolve())
+    assert nested.member == "armor/a.mcsa"
+    assert nested.path == os.path.join(str(archive.resolve()), "armor", "a.mcsa")
@@ -0,0 +1,72 @@
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from scfile.core import RegionContent
+from scfile.formats.png import raster
+from scfile.structures.regions import ChunkHeader, RegionChunk
+from scfile.utils import preview, regions
+from tests.conftest import ASSETS
+
+
+def _decode(data: bytes) -> np.ndarray:
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    pos, idat, header = 8, b"", b""
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        kind, body = data[pos + 4 : pos + 8], data[pos + 8 : pos + 8 + length]
+        assert struct.unpack(">I", data[pos + 8 + length : pos + 12 + length])[0] == zlib.crc32(kind + body)
+        header = body if kind == b"IHDR" else header
+        idat += body if kind == b"IDAT" else b""
+        pos += 12 + length
+
+    width, height, _, color, *_ = struct.unpack(">IIBBBBB", header)
+    channels = {2: 3, 6: 4}[color]
+    rows = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, width * channels + 1)
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape(height, width, channels)
+
+
+@pytest.mark.parametrize("channels", [3, 4])
+def test_raster_roundtrip(channels: int):
+    pixels = np.random.default_rng(0).integers(0, 256, (5, 7, channels), dtype=np.uint8)
+    assert np.array_equal(_decode(raster.encode(pixels)), pixels)
+
+
+def test_raster_invalid():
+    with pytest.raises(ValueError):
+        raster.encode(np.zeros((4, 4), dtype=np.uint8))
+
+
+def test_render():
+    volume = np.zeros((1, 16, 16, 16), dtype=np.uint8)
+    volume[0, 3] = 2
+    chunk = RegionChunk(index=0, header=ChunkHeader(blocks_mask=1), blocks=volume.tobytes())
+
+    pixels = preview.render(RegionContent(chunks=[chunk]))
+    assert pixels.shape == (512, 512, 3)
+    assert pixels[:16, :16].any(axis=2).all()
+    assert not pixels[16:, :].any()
+
+
+def test_world():
+    side = 512
+    previews = [
+        preview.RegionPreview((0, 0), np.full((side, side, 3), 1, dtype=np.uint8)),
+        preview.RegionPreview((1, -1), np.full((side, side, 3), 2, dtype=np.uint8)),
+    ]
+    pixels = preview.world(previews)
+
+    assert pixels.shape == (2 * side, 2 * side, 3)
+    assert pixels[side, 0, 0] == 1
+    assert pixels[0, side, 0] == 2
+    assert pixels[0, 0, 0] == 0
+
+
+def test_regions():
+    mapping = regions.parse([ASSETS / "cli" / "mapcache" / "r.0.0.mdat"])
+    previews = preview.regions(mapping, workers=2)
+    assert [item.key for item in previews] == [(0, 0)]
+    assert previews[0].pixels.any()
@@ -1,9 +1,10 @@
-from .cmd import audit, info, profile, tools
+from .cmd import audit, bench, info, profile, tools
 
 
 __all__ = (
     "tools",
     "audit",
+    "bench",
     "info",
     "profile",
 )
@@ -0,0 +1,76 @@
+import json
+import tracemalloc
+from collections.abc import Callable, Collection, Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from scfile import __version__
+
+
+Metrics = Mapping[str, float]
+
+
+class Regression(NamedTuple):
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1.0
+
+
+def peak(operation: Callable[[], None]) -> int:
+    """Peak traced memory of operation in bytes."""
+
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def dump(results: list[dict[str, Any]], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": __version__,
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def load(path: Path) -> list[dict[str, Any]]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return payload["results"]
+
+
+def compare(
+    current: Mapping[str, Metrics],
+    baseline: Mapping[str, Metrics],
+    threshold: float,
+    higher: Collection[str] = (),
+) -> list[Regression]:
+    """
+    Metrics which changed for the worse by more than threshold.
+
+    Metrics listed in `higher` are better when larger, such as throughput.
+    Others are better when smaller, such as time or peak memory.
+    """
+
+    regressions = []
+
+    for name, metrics in current.items():
+        previous = baseline.get(name, {})
+
+        for metric, value in metrics.items():
+            before = previous.get(metric)
+            if not before or before <= 0:
+                continue
+
+            change = value / before - 1.0
+            if (-change if metric in higher else change) > threshold:
+                regressions.append(Regression(name, metric, before, value))
+
+    return regressions
@@ -10,6 +10,8 @@ from rich.live import Live
 from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
+from scfile.core import Metrics
+from scfile.utils.cli import metrics_table
 from tools.cmd import tools
 
 from . import files, stats
@@ -66,12 +68,13 @@ def run(cfg: Config, console: Console) -> int:
     task = progress.add_task("Checking", total=len(assets))
 
     clear(cfg.reports)
+    metrics = Metrics() if cfg.stats else None
     output = stats.Writer(cfg.reports) if cfg.stats else nullcontext()
     initial = Group(progress, table(found, checked, failed))
     with output as writer, Live(initial, console=console, refresh_per_second=10) as live:
         updated = time.monotonic()
 
-        for result in files.decode_assets(assets, cfg):
+        for result in files.decode_assets(assets, cfg, metrics):
             checked[result.format] += 1
             if result.error:
                 failed[result.format] += 1
@@ -90,6 +93,12 @@ def run(cfg: Config, console: Console) -> int:
         if writer:
             writer.formats(found, checked, failed)
 
+        if writer and metrics:
+            writer.metrics(metrics)
+
+    if metrics:
+        console.print(metrics_table(metrics))
+
     save(errors, cfg.reports / ERRORS_JSONL)
 
     if errors:
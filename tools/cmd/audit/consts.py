@@ -28,5 +28,6 @@ TABLES = {
     Image: "images.csv",
 }
 FORMATS_CSV = "formats.csv"
+METRICS_CSV = "metrics.csv"
 ERRORS_JSONL = "errors.jsonl"
-FILES = (*TABLES.values(), FORMATS_CSV, ERRORS_JSONL)
+FILES = (*TABLES.values(), FORMATS_CSV, METRICS_CSV, ERRORS_JSONL)
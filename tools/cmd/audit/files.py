@@ -8,7 +8,7 @@ from rich.console import Console
 
 from scfile.consts import SUPPORTED_NBT
 from scfile.convert import detect
-from scfile.core import Options
+from scfile.core import Metrics, Options
 from scfile.exceptions import EmptyFileError
 from scfile.utils.files import walk
 from tools.cmd.audit import stats
@@ -71,8 +71,8 @@ def find_assets(config: Config, console: Console) -> list[Asset]:
     return assets
 
 
-def decode_assets(assets: list[Asset], config: Config) -> Iterator[Result]:
-    options = Options(skeleton=config.animation, animation=config.animation)
+def decode_assets(assets: list[Asset], config: Config, metrics: Metrics | None = None) -> Iterator[Result]:
+    options = Options(skeleton=config.animation, animation=config.animation, metrics=metrics)
 
     if config.workers == 0:
         for asset in assets:
@@ -4,11 +4,11 @@ from collections import Counter
 from pathlib import Path
 from typing import Any, TextIO
 
-from scfile.core import BaseContent, ImageContent, ModelContent, TextureContent
+from scfile.core import BaseContent, ImageContent, Metrics, ModelContent, TextureContent
 from scfile.formats.ol.enums import TextureKind
 from scfile.structures.models import Flag
 from scfile.structures.textures import CubemapTexture, DefaultTexture
-from tools.cmd.audit.consts import FORMATS_CSV, TABLES
+from tools.cmd.audit.consts import FORMATS_CSV, METRICS_CSV, TABLES
 from tools.cmd.audit.schemas import Animation, Bone, Image, Mesh, Model, Record, Texture
 from tools.cmd.audit.types import Asset
 
@@ -41,7 +41,7 @@ def _model(path: str, content: ModelContent, filesize: int, animation: bool) ->
             idx=index,
             name=mesh.name,
             material=mesh.material,
-            vertices=len(mesh.vertices),
+            vertices=mesh.count_vertices,
             polygons=len(mesh.polygons),
             quads=mesh.quads,
             max_influences=mesh.max_influences if animation else "-",
@@ -156,3 +156,13 @@ class Writer:
 
             for format in sorted(found):
                 writer.writerow((format, found[format], checked[format], failed[format]))
+
+    def metrics(self, metrics: Metrics) -> None:
+        with (self.path / METRICS_CSV).open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("format", "files", "prelude", "signature", "parse", "elapsed", "bytes_read", "arrays"))
+
+            for summary in metrics.formats:
+                stages = (round(summary.stages.get(name, 0.0), 6) for name in ("prelude", "signature", "parse"))
+                elapsed = round(summary.elapsed, 6)
+                writer.writerow((summary.format, summary.files, *stages, elapsed, summary.bytes_read, summary.arrays))
@@ -0,0 +1,4 @@
+from .command import bench
+
+
+__all__ = ("bench",)
@@ -0,0 +1,178 @@
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.filesize import decimal
+from rich.table import Table
+
+from scfile.convert import decoders, encoders, registry
+from scfile.core import Options
+from tools import baselines, synthetic
+from tools.cmd import tools
+from tools.paths import ROOT
+
+from . import runner
+
+
+REPORTS = ROOT / "reports" / "bench"
+DECODERS = decoders()
+ENCODERS = encoders()
+REGISTRY = registry()
+FORMATS = tuple(synthetic.samples())
+
+
+def table(results: list[runner.Result]) -> Table:
+    output = Table()
+    output.add_column("Tier")
+    output.add_column("Sample")
+    output.add_column("Operation")
+    output.add_column("Size", justify="right")
+    output.add_column("Median", justify="right")
+    output.add_column("Throughput", justify="right", style="green")
+    output.add_column("Peak", justify="right", style="cyan")
+
+    for result in results:
+        output.add_row(
+            result.tier,
+            f"{result.format} {result.sample}",
+            result.operation,
+            decimal(result.size),
+            f"{result.seconds * 1000:.2f} ms",
+            f"{result.throughput:.1f} MB/s",
+            decimal(result.peak),
+        )
+
+    return output
+
+
+def regressions(items: list[baselines.Regression]) -> Table:
+    output = Table()
+    output.add_column("Case")
+    output.add_column("Metric")
+    output.add_column("Baseline", justify="right")
+    output.add_column("Current", justify="right")
+    output.add_column("Change", justify="right", style="red")
+
+    for item in items:
+        if item.metric == "peak":
+            values = decimal(int(item.baseline)), decimal(int(item.current))
+        else:
+            values = f"{item.baseline:.1f} MB/s", f"{item.current:.1f} MB/s"
+
+        output.add_row(item.name, item.metric, *values, f"{item.change:+.1%}")
+
+    return output
+
+
+@tools.command()
+@click.option(
+    "-F",
+    "--formats",
+    type=click.Choice(FORMATS, case_sensitive=False),
+    multiple=True,
+    help="Source formats. Repeat for multiple formats.",
+)
+@click.option(
+    "-t",
+    "--tier",
+    type=click.Choice(tuple(synthetic.TIERS), case_sensitive=False),
+    multiple=True,
+    help="Size tier. Repeat for multiple tiers.",
+)
+@click.option(
+    "-N",
+    "--count",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Timed runs per case.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Synthetic data seed.",
+)
+@click.option(
+    "--decode-only",
+    is_flag=True,
+    help="Skip conversions.",
+)
+@click.option(
+    "-O",
+    "--output",
+    type=click.Path(path_type=Path, dir_okay=False),
+    help="Results JSON file.",
+)
+@click.option(
+    "-B",
+    "--baseline",
+    type=click.Path(path_type=Path, exists=True, dir_okay=False),
+    help="Baseline JSON file to compare against.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0.0, max=1.0),
+    default=0.1,
+    show_default=True,
+    help="Allowed throughput drop or peak memory growth before failing.",
+)
+def bench(
+    formats: tuple[str, ...],
+    tier: tuple[str, ...],
+    count: int,
+    seed: int,
+    decode_only: bool,
+    output: Path | None,
+    baseline: Path | None,
+    threshold: float,
+) -> None:
+    output = output or REPORTS / "results.json"
+    if not output.is_absolute():
+        output = ROOT / output
+
+    formats = formats or FORMATS
+    tiers = tier or ("small",)
+    options = Options(skeleton=True, animation=True)
+    console = Console()
+
+    results: list[runner.Result] = []
+    for name in tiers:
+        samples = synthetic.samples(synthetic.TIERS[name], seed)
+
+        for source in formats:
+            decoder = DECODERS[source]
+
+            for sample, generate in samples[source].items():
+                data = generate()
+
+                cases: list[tuple[str, Callable[[], None]]] = [
+                    ("decode", partial(runner.decode, data, decoder, options))
+                ]
+                if not decode_only:
+                    for target in sorted(REGISTRY.get(source, {})):
+                        operation = partial(runner.convert, data, decoder, ENCODERS[target], options)
+                        cases.append((target, operation))
+
+                for operation, call in cases:
+                    seconds, peak = runner.measure(call, count)
+                    throughput = len(data) / runner.MB / seconds if seconds > 0 else 0.0
+                    results.append(runner.Result(source, sample, operation, name, len(data), seconds, throughput, peak))
+
+    console.print(table(results))
+
+    runner.dump(results, output)
+    console.print(f"\nResults written to '{output}'.")
+
+    if baseline:
+        found = runner.compare(results, runner.load(baseline), threshold)
+
+        if found:
+            console.print(f"\n[red]{len(found)} regression(s) above {threshold:.0%}[/]")
+            console.print(regressions(found))
+            raise click.exceptions.Exit(1)
+
+        console.print(f"\n[green]No regressions above {threshold:.0%}[/]")
@@ -0,0 +1,70 @@
+import statistics
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple
+
+from scfile.core import FileDecoder, FileEncoder, Options
+from tools import baselines
+
+
+MB = 1024 * 1024
+
+
+class Result(NamedTuple):
+    format: str
+    sample: str
+    operation: str
+    tier: str
+    size: int
+    seconds: float
+    throughput: float
+    peak: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.tier}/{self.format}/{self.sample}/{self.operation}"
+
+
+def decode(data: bytes, decoder: type[FileDecoder], options: Options) -> None:
+    with decoder(data, options) as src:
+        src.decode()
+
+
+def convert(data: bytes, decoder: type[FileDecoder], encoder: type[FileEncoder], options: Options) -> None:
+    with decoder(data, options) as src:
+        with src.convert_to(encoder) as out:
+            out.encode()
+
+
+def measure(operation: Callable[[], None], count: int) -> tuple[float, int]:
+    # Warm-up run fills caches and imports
+    operation()
+
+    timings = []
+    for _ in range(count):
+        started = perf_counter()
+        operation()
+        timings.append(perf_counter() - started)
+
+    # Memory is traced separately, tracemalloc slows down timing
+    return statistics.median(timings), baselines.peak(operation)
+
+
+def metrics(result: Result) -> dict[str, float]:
+    return {"throughput": result.throughput, "peak": result.peak}
+
+
+def dump(results: list[Result], path: Path) -> None:
+    baselines.dump([result._asdict() for result in results], path)
+
+
+def load(path: Path) -> dict[str, Result]:
+    results = (Result(**item) for item in baselines.load(path))
+    return {result.key: result for result in results}
+
+
+def compare(results: list[Result], baseline: dict[str, Result], threshold: float) -> list[baselines.Regression]:
+    current = {result.key: metrics(result) for result in results}
+    previous = {key: metrics(result) for key, result in baseline.items()}
+    return baselines.compare(current, previous, threshold, higher=("throughput",))
@@ -7,8 +7,9 @@ from rich.console import Console
 from rich.filesize import decimal
 from rich.table import Table
 
-from scfile.convert import converters, decoders, detect, encoders, registry
-from scfile.core import Options
+from scfile.convert import converters, decoders, detect, encoders
+from scfile.core import IOStream, Options
+from tools import baselines, synthetic
 from tools.cmd import tools
 from tools.paths import ROOT
 
@@ -19,39 +20,73 @@ MODEL = ROOT / "assets" / "profile" / "model.mcsb"
 REPORTS = ROOT / "reports" / "profile"
 DECODERS = decoders()
 ENCODERS = encoders()
-REGISTRY = registry()
-PROFILES = tuple(
-    sorted(
-        {f"{source}-decode.prof" for source in DECODERS}
-        | {f"{source}-{target}.prof" for source, targets in REGISTRY.items() for target in targets}
-    )
-)
+REPORT_PATTERNS = ("*.prof", "*.folded")
 
 
-def table(rows: list[tuple[str, float, int, Path]], count: int) -> Table:
+def table(rows: list[tuple[profiler.Measurement, float | None, Path]]) -> Table:
     output = Table()
     output.add_column("Operation")
-    output.add_column("Total", justify="right")
-    output.add_column("Average", justify="right", style="green")
+    output.add_column("Size", justify="right")
+    output.add_column("Median", justify="right", style="green")
+    output.add_column("p95", justify="right")
+    output.add_column("Peak", justify="right", style="cyan")
     output.add_column("Calls", justify="right")
+    output.add_column("Scaling", justify="right")
     output.add_column("Profile", style="cyan")
 
-    for operation, elapsed, calls, profile in rows:
+    for item, exponent, profile in rows:
         output.add_row(
-            operation,
-            f"{elapsed:.3f} s",
-            f"{elapsed / count:.3f} s",
-            f"{calls:,}",
+            item.name,
+            decimal(item.size),
+            f"{item.median:.3f} s",
+            f"{item.p95:.3f} s",
+            decimal(item.peak),
+            f"{item.calls:,}",
+            scaling(exponent),
             profile.name,
         )
 
     return output
 
 
+def scaling(exponent: float | None) -> str:
+    if exponent is None:
+        return "-"
+    if exponent > 1.2:
+        return f"[yellow]{exponent:.2f}[/]"
+    return f"{exponent:.2f}"
+
+
+def regressions(items: list[baselines.Regression]) -> Table:
+    output = Table()
+    output.add_column("Operation")
+    output.add_column("Metric")
+    output.add_column("Baseline", justify="right")
+    output.add_column("Current", justify="right")
+    output.add_column("Change", justify="right", style="red")
+
+    for item in items:
+        if item.metric == "peak":
+            values = decimal(int(item.baseline)), decimal(int(item.current))
+        else:
+            values = f"{item.baseline:.3f} s", f"{item.current:.3f} s"
+
+        output.add_row(item.name, item.metric, *values, f"{item.change:+.1%}")
+
+    return output
+
+
 def clear(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
-    for name in PROFILES:
-        (path / name).unlink(missing_ok=True)
+    for pattern in REPORT_PATTERNS:
+        for report in path.glob(pattern):
+            report.unlink(missing_ok=True)
+
+
+def absolute(path: Path) -> Path:
+    if not path.is_absolute():
+        path = ROOT / path
+    return path.resolve()
 
 
 @tools.command()
@@ -72,7 +107,19 @@ def clear(path: Path) -> None:
     type=click.IntRange(min=1),
     default=1,
     show_default=True,
-    help="Number of runs.",
+    help="Number of timed runs.",
+)
+@click.option(
+    "--warmup",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Untimed runs before measuring.",
+)
+@click.option(
+    "--sweep",
+    is_flag=True,
+    help="Measure synthetic inputs of every size tier in source format. Source file is optional.",
 )
 @click.option(
     "--sort",
@@ -98,23 +145,45 @@ def clear(path: Path) -> None:
     type=click.Path(path_type=Path, file_okay=False),
     help="Reports directory.",
 )
+@click.option(
+    "--save",
+    type=click.Path(path_type=Path, dir_okay=False),
+    help="Write results JSON baseline.",
+)
+@click.option(
+    "-B",
+    "--baseline",
+    type=click.Path(path_type=Path, exists=True, dir_okay=False),
+    help="Baseline JSON file to compare against.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0.0),
+    default=0.1,
+    show_default=True,
+    help="Allowed median slowdown or peak memory growth before failing.",
+)
 def profile(
     source: Path | None,
     target: tuple[str, ...],
     count: int,
+    warmup: int,
+    sweep: bool,
     sort: str,
     limit: int,
     animation: bool,
     reports: Path | None,
+    save: Path | None,
+    baseline: Path | None,
+    threshold: float,
 ) -> None:
-    reports = reports or REPORTS
-    if not reports.is_absolute():
-        reports = ROOT / reports
-    reports = reports.resolve()
+    reports = absolute(reports or REPORTS)
 
     options = Options(skeleton=animation, animation=animation)
     source = source or MODEL
-    if not source.is_file():
+
+    # Sweep only takes format from source, so file may be absent
+    if not sweep and not source.is_file():
         raise click.UsageError(f"Reference file not found: '{source}'.")
 
     source_format = detect.format(source)
@@ -134,30 +203,69 @@ def profile(
             f"Unsupported conversion: '{source_format}' to '{unsupported[0]}'. Available: {supported}."
         )
 
-    cases: list[tuple[str, Callable[[], None], Path]] = []
-    if targets:
-        for value in targets:
-            name = f"{source_format} to {value}"
-            operation = partial(profiler.convert, source, decoder, ENCODERS[value], options)
-            cases.append((name, operation, reports / f"{source_format}-{value}.prof"))
+    inputs: list[tuple[str, IOStream, int]] = []
+    if sweep:
+        for tier, scale in synthetic.TIERS.items():
+            samples = synthetic.samples(scale).get(source_format)
+            if not samples:
+                raise click.UsageError(f"No synthetic samples for format: '{source_format}'.")
+
+            data = next(iter(samples.values()))()
+            inputs.append((tier, data, len(data)))
     else:
-        name = f"{source_format} decode"
-        operation = partial(profiler.decode, source, decoder, options)
-        cases.append((name, operation, reports / f"{source_format}-decode.prof"))
+        inputs.append(("", source, source.stat().st_size))
+
+    cases: list[tuple[str, str, Callable[[], None], int, Path]] = []
+    for tier, stream, size in inputs:
+        suffix = f"-{tier}" if tier else ""
+        label = f" ({tier})" if tier else ""
+
+        if targets:
+            for value in targets:
+                name = f"{source_format} to {value}"
+                operation = partial(profiler.convert, stream, decoder, ENCODERS[value], options)
+                report = reports / f"{source_format}-{value}{suffix}.prof"
+                cases.append((name, f"{name}{label}", operation, size, report))
+        else:
+            name = f"{source_format} decode"
+            operation = partial(profiler.decode, stream, decoder, options)
+            report = reports / f"{source_format}-decode{suffix}.prof"
+            cases.append((name, f"{name}{label}", operation, size, report))
 
     clear(reports)
-    rows = []
+    rows: list[tuple[profiler.Measurement, float | None, Path]] = []
     stats = []
-    for name, operation, report in cases:
-        result, elapsed, calls = profiler.run(operation, count, report)
+    previous: dict[str, profiler.Measurement] = {}
+    for group, name, operation, size, report in cases:
+        measurement, result = profiler.run(name, operation, size, count, warmup, report)
+        exponent = profiler.scaling(previous[group], measurement) if group in previous else None
+        previous[group] = measurement
+
         stats.append(result)
-        rows.append((name, elapsed, calls, report))
+        rows.append((measurement, exponent, report))
+
+    measurements = [measurement for measurement, _, _ in rows]
 
     console = Console()
-    console.print(f"[cyan]{source}[/] ({decimal(source.stat().st_size)})")
-    console.print(table(rows, count))
-    console.print(f"\nProfiles written to '{reports}'.")
+    if not sweep:
+        console.print(f"[cyan]{source}[/] ({decimal(source.stat().st_size)})")
+    console.print(table(rows))
+    console.print(f"\nProfiles and collapsed stacks written to '{reports}'.")
 
     if len(stats) == 1:
         console.print()
         stats[0].strip_dirs().sort_stats(sort).print_stats(limit)
+
+    if save:
+        profiler.dump(measurements, absolute(save))
+        console.print(f"Results written to '{absolute(save)}'.")
+
+    if baseline:
+        found = profiler.compare(measurements, profiler.load(baseline), threshold)
+
+        if found:
+            console.print(f"\n[red]{len(found)} regression(s) above {threshold:.0%}[/]")
+            console.print(regressions(found))
+            raise click.exceptions.Exit(1)
+
+        console.print(f"\n[green]No regressions above {threshold:.0%}[/]")
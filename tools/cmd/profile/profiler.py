@@ -1,14 +1,42 @@
 import cProfile
+import math
 import pstats
+import statistics
+import sys
+from collections import defaultdict
 from collections.abc import Callable
 from pathlib import Path
 from time import perf_counter
+from types import FrameType
+from typing import Any, NamedTuple
 
-from scfile.core import FileDecoder, FileEncoder, Options
+from scfile.core import FileDecoder, FileEncoder, IOStream, Options
+from tools import baselines
+
+
+class Measurement(NamedTuple):
+    name: str
+    size: int
+    timings: list[float]
+    calls: int
+    peak: int
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def p95(self) -> float:
+        ordered = sorted(self.timings)
+        return ordered[max(math.ceil(len(ordered) * 0.95) - 1, 0)]
 
 
 def decode(
-    source: Path,
+    source: IOStream,
     decoder: type[FileDecoder],
     options: Options,
 ) -> None:
@@ -17,7 +45,7 @@ def decode(
 
 
 def convert(
-    source: Path,
+    source: IOStream,
     decoder: type[FileDecoder],
     encoder: type[FileEncoder],
     options: Options,
@@ -27,22 +55,125 @@ def convert(
             out.encode()
 
 
+def _label(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}"
+
+
+def _builtin(function: Any) -> str:
+    module = getattr(function, "__module__", None) or "builtins"
+    return f"{module}.{getattr(function, '__qualname__', repr(function))}"
+
+
+def stacks(operation: Callable[[], None]) -> dict[str, float]:
+    """Collect self time in seconds per call stack."""
+
+    totals: dict[str, float] = defaultdict(float)
+    path: list[str] = []
+    started: list[float] = []
+    inner: list[float] = []
+
+    def tracer(frame: FrameType, event: str, arg: Any) -> None:
+        now = perf_counter()
+
+        if event in ("call", "c_call"):
+            path.append(_label(frame) if event == "call" else _builtin(arg))
+            started.append(now)
+            inner.append(0.0)
+
+        elif event in ("return", "c_return", "c_exception") and path:
+            elapsed = now - started.pop()
+            totals[";".join(path)] += elapsed - inner.pop()
+            path.pop()
+
+            if inner:
+                inner[-1] += elapsed
+
+    sys.setprofile(tracer)
+    try:
+        operation()
+    finally:
+        sys.setprofile(None)
+
+    return totals
+
+
+def folded(totals: dict[str, float], output: Path) -> None:
+    """Write collapsed stacks in microseconds, as consumed by flamegraph tools."""
+
+    with output.open("w", encoding="utf-8") as file:
+        for stack, elapsed in sorted(totals.items()):
+            if (micros := round(elapsed * 1_000_000)) > 0:
+                file.write(f"{stack} {micros}\n")
+
+
 def run(
+    name: str,
     operation: Callable[[], None],
+    size: int,
     count: int,
+    warmup: int,
     output: Path,
-) -> tuple[pstats.Stats, float, int]:
+) -> tuple[Measurement, pstats.Stats]:
+    for _ in range(warmup):
+        operation()
+
     profile = cProfile.Profile()
 
     with profile:
         operation()
 
-    started = perf_counter()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    profile.dump_stats(output)
+    folded(stacks(operation), output.with_suffix(".folded"))
+
+    timings = []
     for _ in range(count):
+        started = perf_counter()
         operation()
-    elapsed = perf_counter() - started
+        timings.append(perf_counter() - started)
 
-    output.parent.mkdir(parents=True, exist_ok=True)
-    profile.dump_stats(output)
     calls = sum(item.callcount for item in profile.getstats())
-    return pstats.Stats(profile), elapsed, calls
+    measurement = Measurement(name, size, timings, calls, baselines.peak(operation))
+    return measurement, pstats.Stats(profile)
+
+
+def metrics(item: Measurement) -> dict[str, float]:
+    return {"median": item.median, "peak": item.peak}
+
+
+def dump(measurements: list[Measurement], path: Path) -> None:
+    results = [
+        {
+            "name": item.name,
+            "size": item.size,
+            "count": len(item.timings),
+            "median": item.median,
+            "p95": item.p95,
+            "peak": item.peak,
+            "calls": item.calls,
+        }
+        for item in measurements
+    ]
+    baselines.dump(results, path)
+
+
+def load(path: Path) -> dict[str, dict[str, float]]:
+    return {item["name"]: {"median": item["median"], "peak": item["peak"]} for item in baselines.load(path)}
+
+
+def compare(
+    measurements: list[Measurement],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[baselines.Regression]:
+    current = {item.name: metrics(item) for item in measurements}
+    return baselines.compare(current, baseline, threshold)
+
+
+def scaling(previous: Measurement, current: Measurement) -> float | None:
+    """Exponent of time growth against size growth. Close to 1.0 means linear scaling."""
+
+    if previous.size <= 0 or current.size <= previous.size or previous.median <= 0:
+        return None
+
+    return math.log(current.median / previous.median) / math.log(current.size / previous.size)
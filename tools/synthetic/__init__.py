@@ -0,0 +1,60 @@
+import math
+from collections.abc import Callable
+from functools import partial
+
+from . import models, textures
+from .models import mcsa, mcsb
+from .nbt import tree
+from .regions import mdat
+from .texarr import texarr
+from .textures import mic, ol
+
+
+Generator = Callable[[], bytes]
+
+TIERS = {"small": 1, "medium": 8, "large": 64}
+
+
+def samples(scale: int = 1, seed: int = 0) -> dict[str, dict[str, Generator]]:
+    """Deterministic samples grouped by source format."""
+
+    # Texture area grows with side squared
+    side = 64 * math.isqrt(scale)
+
+    return {
+        "mcsa": {
+            f"v{version:g}": partial(mcsa, version=version, vertices=512 * scale, seed=seed)
+            for version in models.VERSIONS
+        },
+        "mcsb": {
+            "static": partial(mcsb, meshes=4, vertices=1024 * scale, seed=seed),
+            "skinned": partial(mcsb, version=15.0, vertices=1024 * scale, bones=32, clips=4, frames=30, seed=seed),
+        },
+        "ol": {
+            f"{format.decode().lower()}{'-cubemap' if cubemap else ''}": partial(
+                ol, format=format, width=side, height=side, cubemap=cubemap, seed=seed
+            )
+            for format in textures.FORMATS
+            for cubemap in (False, True)
+        },
+        "mic": {"image": partial(mic, size=64 * 1024 * scale, seed=seed)},
+        "mdat": {"region": partial(mdat, chunks=min(16 * scale, 1024), seed=seed)},
+        "nbt": {
+            compression: partial(tree, depth=4, size=64 * scale, compression=compression, seed=seed)
+            for compression in ("raw", "gzip", "zstd")
+        },
+        "texarr": {"bundle": partial(texarr, count=16 * scale, seed=seed)},
+    }
+
+
+__all__ = (
+    "TIERS",
+    "samples",
+    "mcsa",
+    "mcsb",
+    "ol",
+    "mic",
+    "mdat",
+    "tree",
+    "texarr",
+)
@@ -0,0 +1,140 @@
+import struct
+
+import numpy as np
+
+from scfile.consts import FileSignature
+from scfile.formats.mcsa.versions import SUPPORTED_VERSIONS, VERSION_MAP
+from scfile.structures.models import Flag
+
+
+VERSIONS = tuple(SUPPORTED_VERSIONS)
+
+
+def _utf8(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return struct.pack("<H", len(data)) + data
+
+
+def _mesh(
+    rng: np.random.Generator,
+    index: int,
+    version: float,
+    flags: dict[Flag, bool],
+    vertices: int,
+    bones: int,
+) -> bytes:
+    polygons = max(vertices // 2, 1)
+    parts = [_utf8(f"mesh_{index}"), _utf8(f"material_{index % 4}")]
+
+    if flags[Flag.SKELETON]:
+        local = min(bones, 0xFF)
+        parts.append(struct.pack("<BB", 4, local))
+        parts.append(bytes(range(local)))
+
+    parts.append(struct.pack("<I", vertices))
+    if version >= 12.0:
+        parts.append(struct.pack("<?", False))
+    parts.append(struct.pack("<I", polygons))
+
+    if version >= 15.0:
+        parts.append(struct.pack("<?", False))
+
+    if flags[Flag.UV]:
+        parts.append(struct.pack("<f", 0.1))
+
+    if version >= 10.0:
+        parts.append(np.array([-1, -1, -1, 1, 1, 1], dtype="<f4").tobytes())
+
+    if version >= 11.0:
+        parts.append(struct.pack("<f", 1.7))
+
+    parts.append(rng.integers(-0x7FFF, 0x7FFF, vertices * 4, dtype="<i2").tobytes())
+
+    for flag in (Flag.UV, Flag.UV2):
+        if flags[flag]:
+            parts.append(rng.integers(0, 0x7FFF, vertices * 2, dtype="<i2").tobytes())
+
+    for flag in (Flag.NORMALS, Flag.TANGENTS):
+        if flags[flag]:
+            parts.append(rng.integers(-0x7F, 0x7F, vertices * 4, dtype="i1").tobytes())
+
+    if flags[Flag.COLORS]:
+        parts.append(rng.integers(0, 0xFF, vertices * 4, dtype="u1").tobytes())
+
+    if flags[Flag.SKELETON]:
+        parts.append(rng.integers(0, max(bones, 1), vertices * 4, dtype="u1").tobytes())
+        parts.append(rng.integers(0, 0xFF, vertices * 4, dtype="u1").tobytes())
+
+    fmt = "<u2" if polygons * 3 <= 0xFFFF else "<u4"
+    parts.append(rng.integers(0, vertices, polygons * 3).astype(fmt).tobytes())
+
+    return b"".join(parts)
+
+
+def _skeleton(rng: np.random.Generator, version: float, bones: int) -> bytes:
+    parts = [struct.pack("<B", bones)]
+
+    for index in range(bones):
+        parts.append(_utf8(f"bone_{index}"))
+        parts.append(struct.pack("<B", max(index - 1, 0)))
+        parts.append(rng.uniform(-1, 1, 6).astype("<f4").tobytes())
+
+    if version >= 15.0:
+        parts.append(struct.pack("<H", 0))
+
+    return b"".join(parts)
+
+
+def _animation(rng: np.random.Generator, version: float, bones: int, clips: int, frames: int) -> bytes:
+    parts = [struct.pack("<i", clips)]
+
+    for index in range(clips):
+        parts.append(_utf8(f"clip_{index}"))
+        parts.append(struct.pack("<If", frames, 0.033))
+        if version >= 15.0:
+            parts.append(struct.pack("<H", 0))
+        parts.append(rng.integers(-0x7FFF, 0x7FFF, frames * bones * 7, dtype="<i2").tobytes())
+
+    return b"".join(parts)
+
+
+def mcsa(
+    version: float = 12.0,
+    meshes: int = 4,
+    vertices: int = 1024,
+    bones: int = 0,
+    clips: int = 0,
+    frames: int = 30,
+    seed: int = 0,
+) -> bytes:
+    if version not in VERSIONS:
+        raise ValueError(f"Unsupported MCSA version: {version}")
+
+    rng = np.random.default_rng(seed)
+    mapping = VERSION_MAP.get(version, VERSION_MAP[max(VERSION_MAP)])
+    flags = {flag: flag != Flag.SKELETON or bones > 0 for flag in mapping}
+    flags = {flag: flags.get(flag, False) for flag in Flag}
+
+    parts = [FileSignature.MCSA, struct.pack("<f", version)]
+    parts.append(bytes(flags[flag] for flag in mapping))
+    parts.append(struct.pack("<f", 2.5))
+
+    if flags[Flag.UV]:
+        parts.append(struct.pack("<f", 1.0))
+    if flags[Flag.UV2]:
+        parts.append(struct.pack("<f", 1.0))
+
+    parts.append(struct.pack("<i", meshes))
+    parts.extend(_mesh(rng, index, version, flags, vertices, bones) for index in range(meshes))
+
+    if bones:
+        parts.append(_skeleton(rng, version, bones))
+        if clips:
+            parts.append(_animation(rng, version, bones, clips, frames))
+
+    return b"".join(parts)
+
+
+def mcsb(**kwargs) -> bytes:
+    prefix = b"synthetic"
+    return struct.pack(">i", len(prefix)) + prefix + mcsa(**kwargs)
@@ -0,0 +1,65 @@
+import gzip
+import struct
+from typing import Literal
+
+import numpy as np
+import zstandard as zstd
+
+from scfile.formats.nbt import nbt
+from scfile.formats.nbt.enums import Tag
+
+
+Compression = Literal["raw", "gzip", "zstd"]
+COMPRESSIONS: tuple[Compression, ...] = ("raw", "gzip", "zstd")
+
+
+def _string(name: bytes, value: str) -> bytes:
+    data = value.encode("utf-8")
+    return nbt.encode(Tag.STRING, name) + struct.pack(">H", len(data)) + data
+
+
+def _compound(rng: np.random.Generator, name: bytes, depth: int, breadth: int, size: int) -> bytes:
+    children: list[bytes] = []
+
+    for index in range(breadth):
+        key = f"{name.decode() or 'root'}_{index}".encode()
+
+        match index % 7:
+            case 0:
+                children.append(nbt.encode_int(key, int(rng.integers(-(2**31), 2**31 - 1))))
+            case 1:
+                children.append(nbt.encode_long(key, int(rng.integers(-(2**63), 2**63 - 1))))
+            case 2:
+                children.append(_string(key, f"value {rng.integers(1 << 30)}"))
+            case 3:
+                children.append(nbt.encode_ba(key, rng.bytes(size)))
+            case 4:
+                children.append(nbt.encode_ia(key, tuple(rng.integers(-(2**31), 2**31 - 1, size).tolist())))
+            case 5:
+                values = [struct.pack(">i", int(value)) for value in rng.integers(0, 1000, size)]
+                children.append(nbt.lst(key, Tag.INT, *values))
+            case 6 if depth > 0:
+                children.append(_compound(rng, key, depth - 1, breadth, size))
+            case _:
+                children.append(nbt.encode_byte(key, int(rng.integers(-128, 127))))
+
+    return nbt.compound(name, *children)
+
+
+def tree(
+    depth: int = 3,
+    breadth: int = 14,
+    size: int = 64,
+    compression: Compression = "gzip",
+    seed: int = 0,
+) -> bytes:
+    rng = np.random.default_rng(seed)
+    data = _compound(rng, b"", depth, breadth, size)
+
+    match compression:
+        case "gzip":
+            return gzip.compress(data, mtime=0)
+        case "zstd":
+            return zstd.ZstdCompressor().compress(data)
+        case _:
+            return data
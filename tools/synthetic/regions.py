@@ -0,0 +1,58 @@
+import struct
+
+import numpy as np
+import zstandard as zstd
+
+from scfile.formats.mdat.decoder import CHUNKS_COUNT, NIBBLE_SIZE, SECTION_SIZE
+
+
+HEADER_SIZE = 5 * 4
+
+
+def _chunk(rng: np.random.Generator, cctx: zstd.ZstdCompressor, sections: int) -> bytes:
+    mask = (1 << sections) - 1
+
+    # Terrain-like column: solid ground, sparse air above
+    blocks = rng.integers(1, 16, (sections, SECTION_SIZE), dtype="u1")
+    blocks[sections // 2 :] *= rng.random((sections - sections // 2, SECTION_SIZE)) < 0.1
+
+    payload = b"".join(
+        [
+            blocks.tobytes(),
+            bytes(sections * NIBBLE_SIZE),
+            b"\xff" * (sections * NIBBLE_SIZE * 3),
+        ]
+    )
+
+    compressed = cctx.compress(payload)
+    full_size = len(payload) + HEADER_SIZE
+    header = struct.pack(">5I", full_size, mask, 0, full_size, len(compressed))
+    return header + compressed
+
+
+def mdat(
+    chunks: int = 256,
+    sections: int = 4,
+    seed: int = 0,
+) -> bytes:
+    rng = np.random.default_rng(seed)
+    cctx = zstd.ZstdCompressor(level=3)
+
+    indexes = sorted(rng.choice(CHUNKS_COUNT, size=min(chunks, CHUNKS_COUNT), replace=False).tolist())
+    table = bytearray(CHUNKS_COUNT * 24)
+    body = bytearray()
+
+    # Table occupies first sectors
+    sector = (len(table) + SECTION_SIZE - 1) // SECTION_SIZE
+
+    for index in indexes:
+        data = _chunk(rng, cctx, sections)
+        struct.pack_into(">ii", table, index * 24, sector, 1)
+        table[index * 24 + 8 : index * 24 + 24] = rng.bytes(16)
+
+        padded = -len(data) % SECTION_SIZE
+        body += data + bytes(padded)
+        sector += (len(data) + padded) // SECTION_SIZE
+
+    table += bytes(-len(table) % SECTION_SIZE)
+    return bytes(table + body)
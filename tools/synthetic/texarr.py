@@ -0,0 +1,23 @@
+import struct
+
+import numpy as np
+
+from scfile.consts import FileSignature
+from scfile.formats.texarr.decoder import DELIMITER
+
+
+def texarr(
+    count: int = 64,
+    size: int = 16 * 1024,
+    seed: int = 0,
+) -> bytes:
+    rng = np.random.default_rng(seed)
+    parts = [struct.pack(">I", count)]
+
+    for index in range(count):
+        path = DELIMITER.join(("blocks", f"group_{index % 8}", f"texture_{index}")).encode()
+        texture = FileSignature.DDS + rng.bytes(size - len(FileSignature.DDS))
+        parts.append(struct.pack(">H", len(path)) + path)
+        parts.append(struct.pack(">I", len(texture)) + texture)
+
+    return b"".join(parts)
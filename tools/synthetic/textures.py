@@ -0,0 +1,69 @@
+import struct
+
+import lz4.block
+import numpy as np
+
+from scfile.consts import CubemapFaces, FileSignature
+from scfile.formats.ol.enums import TextureKind
+from scfile.formats.ol.formats import SUPPORTED_FORMATS
+from scfile.formats.ol.io import NULL, XOR
+
+
+FORMATS = tuple(SUPPORTED_FORMATS)
+
+# Bytes per 4x4 block for compressed formats, bytes per pixel otherwise
+BLOCK_SIZES = {b"DXT1": 8, b"DXT3": 16, b"DXT5": 16, b"DXN_X": 8, b"DXN_XY": 16}
+PIXEL_SIZES = {b"RGBA8": 4, b"BGRA8": 4, b"RGBA32F": 16}
+
+
+def _format(value: bytes) -> bytes:
+    return bytes(byte ^ XOR for byte in value).ljust(16, bytes([NULL]))
+
+
+def _mipsize(format: bytes, width: int, height: int) -> int:
+    if format in BLOCK_SIZES:
+        return max(1, (width + 3) // 4) * max(1, (height + 3) // 4) * BLOCK_SIZES[format]
+    return width * height * PIXEL_SIZES[format]
+
+
+def _mipmap(rng: np.random.Generator, size: int) -> tuple[int, bytes]:
+    # Small alphabet keeps data compressible like real textures
+    data = rng.integers(0, 16, size, dtype="u1").tobytes()
+    return size, lz4.block.compress(data, store_size=False)
+
+
+def ol(
+    format: bytes = b"DXT1",
+    width: int = 256,
+    height: int = 256,
+    cubemap: bool = False,
+    seed: int = 0,
+) -> bytes:
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported OL format: {format!r}")
+
+    rng = np.random.default_rng(seed)
+    mipmaps = max(width, height).bit_length()
+    faces = CubemapFaces.COUNT if cubemap else 1
+
+    levels = [
+        [_mipmap(rng, _mipsize(format, max(width >> level, 1), max(height >> level, 1))) for _ in range(faces)]
+        for level in range(mipmaps)
+    ]
+
+    uncompressed = [size for level in levels for size, _ in level]
+    compressed = [len(data) for level in levels for _, data in level]
+
+    parts = [FileSignature.OL, struct.pack(">III", width, height, mipmaps), _format(format)]
+    parts.append(struct.pack(">B", TextureKind.CUBEMAP if cubemap else TextureKind.DEFAULT))
+    parts.append(struct.pack(f">{len(uncompressed)}I", *uncompressed))
+    parts.append(struct.pack(f">{len(compressed)}I", *compressed))
+    parts.append(struct.pack(">H", 8) + b"synthetc")
+    parts.extend(data for level in levels for _, data in level)
+
+    return b"".join(parts)
+
+
+def mic(size: int = 256 * 1024, seed: int = 0) -> bytes:
+    rng = np.random.default_rng(seed)
+    return FileSignature.MIC + rng.bytes(size)